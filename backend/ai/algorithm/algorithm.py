@@ -1,21 +1,70 @@
-from typing import List, Tuple
+from time import monotonic
+from typing import List, Optional, Tuple
 
-import numpy as np
 from ai.board import Board
+from ai.ordering import MoveOrdering
+from ai.transposition import TranspositionTable
 from core.constants import PLAYER_ONE, PLAYER_TWO
+from django.conf import settings
+
+# Number of nodes searched between checks of the deadline.
+CHECK_INTERVAL = 1024
+
+
+class SearchTimeout(Exception):
+    """
+    Raised inside a search when its deadline has passed.
+
+    """
 
 
 class Algorithm:
     def __init__(
-        self, player: int, board: List[List[int]], depth: int
+        self,
+        player: int,
+        board: List[List[int]],
+        depth: int,
+        table: Optional[TranspositionTable] = None,
+        ordering: bool = True,
     ) -> None:
         self.name = "Algorithm"
         self.player = player
         self.opponent = PLAYER_ONE if player == PLAYER_TWO else PLAYER_TWO
-        self.board: Board = Board(np.array(board), player)
+        self.board: Board = Board(board, player)
         self.depth = depth
 
+        if table is None:
+            table = TranspositionTable(settings.AI_TRANSPOSITION_TABLE_SIZE)
+
+        self.table = table
+        self.table.new_search()
+
+        self.ordering = MoveOrdering(
+            self.board.columns,
+            self.board.size - self.board.filled,
+            ordering,
+        )
+
+        self.nodes = 0
+        self.deadline: Optional[float] = None
+
     def get_move(self) -> Tuple[int, int]:
+        column, _ = self.search(self.depth)
+        row = self.board.get_open_row(column)
+
+        return row, column
+
+    def search(self, depth: int) -> Tuple[int, float]:
         raise NotImplementedError(
-            "Algorithm.get_move() must be implemented in subclass"
+            "Algorithm.search() must be implemented in subclass"
         )
+
+    def visit(self) -> None:
+        self.nodes += 1
+
+        if (
+            self.deadline is not None
+            and not self.nodes % CHECK_INTERVAL
+            and monotonic() >= self.deadline
+        ):
+            raise SearchTimeout()
@@ -0,0 +1,60 @@
+from math import inf
+from time import monotonic
+from typing import Optional, Tuple
+
+from .algorithm import Algorithm, SearchTimeout
+
+
+class IterativeDeepening:
+    """
+    Search an algorithm one depth at a time within a wall-clock budget.
+
+    Every iteration shares the algorithm's transposition table, so the
+    best moves found at one depth are searched first at the next. When the
+    budget runs out the move from the deepest completed iteration is
+    returned. The first iteration always completes so a move is available.
+    ``complete`` tells whether the move is as good as the full depth's.
+
+    """
+
+    def __init__(
+        self, algorithm: Algorithm, time_limit: Optional[float] = None
+    ) -> None:
+        self.algorithm = algorithm
+        self.time_limit = time_limit
+        self.depth_reached = 0
+        self.complete = False
+
+    def get_move(self) -> Tuple[int, int]:
+        algorithm = self.algorithm
+        board = algorithm.board
+        played = len(board.moves)
+        start = monotonic()
+        best_column = -1
+
+        for depth in range(1, algorithm.depth + 1):
+            try:
+                column, score = algorithm.search(depth)
+            except SearchTimeout:
+                while len(board.moves) > played:
+                    board.undo_move()
+                break
+
+            best_column = column
+            self.depth_reached = depth
+            # A proven win or loss needs no deeper search.
+            self.complete = depth == algorithm.depth or abs(score) == inf
+
+            if abs(score) == inf:
+                break
+
+            if self.time_limit is not None:
+                algorithm.deadline = start + self.time_limit
+
+                if monotonic() >= algorithm.deadline:
+                    break
+
+        algorithm.deadline = None
+        row = board.get_open_row(best_column)
+
+        return row, best_column
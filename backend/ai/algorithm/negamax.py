@@ -0,0 +1,137 @@
+from math import inf
+from typing import List, Optional, Tuple
+
+from ai.board import Board
+from ai.tables import searcher_keys
+from ai.transposition import Bound, TranspositionTable
+from core.constants import EMPTY
+
+from .algorithm import Algorithm
+
+ALPHA = -inf
+BETA = inf
+
+
+class Negamax(Algorithm):
+    """
+    Negamax search shared by every algorithm.
+
+    Scores are kept from the point of view of the player to move, so a
+    single branch serves both sides. Leaves are scored with the heuristic of
+    the searching player, negated on the opponent's turns, which gives the
+    same values as a minimax over that heuristic.
+
+    ``pruning`` enables alpha-beta cutoffs and ``pvs`` enables principal
+    variation search: after the first move, siblings are searched with a
+    null window and only re-searched with the full window when they might
+    improve on the best move so far.
+
+    """
+
+    def __init__(
+        self,
+        player: int,
+        board: List[List[int]],
+        depth,
+        table: Optional[TranspositionTable] = None,
+        ordering: bool = True,
+        pruning: bool = True,
+        pvs: bool = True,
+    ) -> None:
+        super().__init__(player, board, depth, table, ordering)
+        self.pruning = pruning
+        self.pvs = pvs and pruning
+        # Tables may be shared between searches for either player.
+        self.key = searcher_keys()[player]
+
+    def search(self, depth: int) -> Tuple[int, float]:
+        return self._negamax(self.board, depth, ALPHA, BETA, 1)
+
+    def _negamax(
+        self,
+        board: Board,
+        depth: int,
+        alpha: float,
+        beta: float,
+        sign: int,
+    ) -> Tuple[int, float]:
+        self.visit()
+
+        token = self.player if sign > 0 else self.opponent
+
+        if (winner := board.winner()) != EMPTY:
+            return -1, inf if winner == token else -inf
+        if board.is_full():
+            return -1, 0
+        if depth == 0:
+            return -1, sign * board.score(self.player)
+
+        alpha_original = alpha
+        entry = self.table.probe(board.hash ^ self.key)
+
+        if entry and entry.depth >= depth:
+            if entry.bound == Bound.EXACT:
+                return entry.move, entry.score
+            elif entry.bound == Bound.LOWER:
+                alpha = max(alpha, entry.score)
+            else:
+                beta = min(beta, entry.score)
+
+            if alpha >= beta:
+                return entry.move, entry.score
+
+        ply = len(board.moves)
+        open_columns = self.ordering.order(
+            board.get_open_columns(),
+            ply,
+            token,
+            entry.move if entry else None,
+        )
+        best_column = open_columns[0]
+        best_score = -inf
+
+        for index, column in enumerate(open_columns):
+            board.drop_token(column, token)
+
+            if self.pvs and index and alpha > -inf:
+                _, score = self._negamax(
+                    board, depth - 1, -alpha - 1, -alpha, -sign
+                )
+                score = -score
+
+                if alpha < score < beta:
+                    _, score = self._negamax(
+                        board, depth - 1, -beta, -alpha, -sign
+                    )
+                    score = -score
+            else:
+                _, score = self._negamax(
+                    board, depth - 1, -beta, -alpha, -sign
+                )
+                score = -score
+
+            board.undo_move()
+
+            if score > best_score:
+                best_score = score
+                best_column = column
+
+            if self.pruning:
+                alpha = max(alpha, score)
+
+                if alpha >= beta:
+                    self.ordering.cutoff(column, ply, token, depth)
+                    break
+
+        if best_score <= alpha_original:
+            bound = Bound.UPPER
+        elif best_score >= beta:
+            bound = Bound.LOWER
+        else:
+            bound = Bound.EXACT
+
+        self.table.store(
+            board.hash ^ self.key, depth, best_score, bound, best_column
+        )
+
+        return best_column, best_score
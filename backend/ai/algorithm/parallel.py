@@ -0,0 +1,211 @@
+import multiprocessing
+from concurrent.futures import Executor, ProcessPoolExecutor
+from math import inf
+from time import monotonic
+from typing import Dict, List, Optional, Tuple, Type
+
+from ai.ordering import centre_out
+from ai.transposition import TranspositionTable
+
+from .algorithm import SearchTimeout
+from .negamax import BETA, Negamax
+
+_pools: Dict[int, ProcessPoolExecutor] = {}
+_table: Optional[TranspositionTable] = None
+
+
+def can_start_pool() -> bool:
+    """
+    Return whether this process may start a process pool.
+
+    Daemonic processes, such as the workers of Celery's prefork pool, may
+    not have children, so searches in them cannot be split across processes.
+
+    """
+    return not multiprocessing.current_process().daemon
+
+
+def get_pool(workers: int) -> Executor:
+    """
+    Return the process pool shared by searches with ``workers`` workers.
+
+    """
+    if workers not in _pools:
+        _pools[workers] = ProcessPoolExecutor(max_workers=workers)
+
+    return _pools[workers]
+
+
+def _search_root_move(
+    algorithm_class: Type[Negamax],
+    player: int,
+    board: List[List[int]],
+    depth: int,
+    alpha: float,
+    deadline: Optional[float],
+    table_size: int,
+    ordering: bool,
+) -> Tuple[Optional[float], int]:
+    """
+    Score one root move in a worker process.
+
+    ``board`` is the position after the move, with the opponent to move.
+    The move is first searched with a null window around ``alpha`` and only
+    re-searched with the full window when it beats it. Each worker keeps its
+    transposition table between tasks, so later iterations and sibling
+    moves reuse its entries.
+
+    Returns
+    -------
+    Tuple[Optional[float], int]
+        The score of the move for the root player, or None if the deadline
+        passed, and the number of nodes searched.
+
+    """
+    global _table
+
+    if _table is None or _table.size != table_size:
+        _table = TranspositionTable(table_size)
+
+    algorithm = algorithm_class(player, board, depth, _table, ordering)
+    algorithm.deadline = deadline
+
+    try:
+        if algorithm.pvs and alpha > -inf:
+            _, score = algorithm._negamax(
+                algorithm.board, depth, -alpha - 1, -alpha, -1
+            )
+            if -score > alpha:
+                _, score = algorithm._negamax(
+                    algorithm.board, depth, -BETA, -alpha, -1
+                )
+        else:
+            _, score = algorithm._negamax(
+                algorithm.board, depth, -BETA, -alpha, -1
+            )
+    except SearchTimeout:
+        return None, algorithm.nodes
+
+    return -score, algorithm.nodes
+
+
+class RootParallel:
+    """
+    Search the moves at the root of an algorithm across a process pool.
+
+    Each depth is searched in turn, as by ``IterativeDeepening``. The most
+    promising root move is searched in this process to establish a bound,
+    then every other root move is searched by a pool worker against that
+    bound. Like the serial search, the first iteration always completes and
+    the move from the deepest completed iteration is returned.
+
+    """
+
+    def __init__(
+        self,
+        algorithm: Negamax,
+        workers: int,
+        time_limit: Optional[float] = None,
+        pool: Optional[Executor] = None,
+    ) -> None:
+        self.algorithm = algorithm
+        self.workers = workers
+        self.time_limit = time_limit
+        self.pool = pool
+        self.depth_reached = 0
+        self.complete = False
+        self.nodes = 0
+
+    def get_move(self) -> Tuple[int, int]:
+        algorithm = self.algorithm
+        board = algorithm.board
+        pool = self.pool or get_pool(self.workers)
+        start = monotonic()
+        best_column = -1
+        order = centre_out(board.columns)
+
+        for depth in range(1, algorithm.depth + 1):
+            columns = sorted(
+                board.get_open_columns(),
+                key=lambda c: (c != best_column, order.index(c)),
+            )
+
+            try:
+                column, score = self._search(pool, columns, depth)
+            except SearchTimeout:
+                break
+
+            best_column = column
+            self.depth_reached = depth
+            # A proven win or loss needs no deeper search.
+            self.complete = depth == algorithm.depth or abs(score) == inf
+
+            if abs(score) == inf:
+                break
+
+            if self.time_limit is not None:
+                algorithm.deadline = start + self.time_limit
+
+                if monotonic() >= algorithm.deadline:
+                    break
+
+        algorithm.deadline = None
+        self.nodes += algorithm.nodes
+        row = board.get_open_row(best_column)
+
+        return row, best_column
+
+    def _search(
+        self, pool: Executor, columns: List[int], depth: int
+    ) -> Tuple[int, float]:
+        algorithm = self.algorithm
+        board = algorithm.board
+
+        played = len(board.moves)
+        best_column = columns[0]
+        board.drop_token(best_column, algorithm.player)
+        try:
+            _, score = algorithm._negamax(board, depth - 1, -BETA, BETA, -1)
+        finally:
+            while len(board.moves) > played:
+                board.undo_move()
+        best_score = -score
+
+        if abs(best_score) == inf and best_score > 0:
+            return best_column, best_score
+
+        futures = []
+        for column in columns[1:]:
+            board.drop_token(column, algorithm.player)
+            futures.append(
+                (
+                    column,
+                    pool.submit(
+                        _search_root_move,
+                        type(algorithm),
+                        algorithm.player,
+                        board.raw,
+                        depth - 1,
+                        best_score,
+                        algorithm.deadline,
+                        algorithm.table.size,
+                        algorithm.ordering.enabled,
+                    ),
+                )
+            )
+            board.undo_move()
+
+        timed_out = False
+        for column, future in futures:
+            score, nodes = future.result()
+            self.nodes += nodes
+
+            if score is None:
+                timed_out = True
+            elif score > best_score:
+                best_column, best_score = column, score
+
+        if timed_out:
+            raise SearchTimeout()
+
+        return best_column, best_score
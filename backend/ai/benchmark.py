@@ -0,0 +1,292 @@
+import json
+import platform
+import tracemalloc
+from math import ceil
+from pathlib import Path
+from time import perf_counter
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Type
+
+import numpy as np
+from core.constants import PLAYER_ONE
+from core.dataclasses import Algorithm as cfa
+
+from ai.algorithm.alphabeta import AlphaBeta
+from ai.algorithm.iterative import IterativeDeepening
+from ai.algorithm.minimax import Minimax
+from ai.algorithm.negamax import Negamax
+from ai.board import Board
+from ai.positions import generate_positions
+from ai.utils import get_score
+
+FIXTURE = Path(__file__).resolve().parent / "fixtures" / "sample_data.json"
+
+ALGORITHMS: Dict[str, Type[Negamax]] = {
+    cfa.MINIMAX.value: Minimax,
+    cfa.ALPHA_BETA.value: AlphaBeta,
+}
+
+Position = Tuple[List[List[int]], int]
+
+
+def load_algorithms(path: Path = FIXTURE) -> List[Tuple[str, int]]:
+    """
+    Return the code name and depth of every algorithm in a fixture.
+
+    Parameters
+    ----------
+    path : Path
+        The path of a fixture holding ``core.Algorithm`` objects.
+
+    Returns
+    -------
+    List[Tuple[str, int]]
+        The code names and depths of the algorithms the engine implements.
+
+    """
+    with open(path) as file:
+        objects = json.load(file)
+
+    return [
+        (item["fields"]["code_name"], item["fields"]["depth"])
+        for item in objects
+        if item["model"].lower() == "core.algorithm"
+        and item["fields"]["code_name"] in ALGORITHMS
+    ]
+
+
+def percentile(values: Sequence[float], q: float) -> float:
+    """
+    Return the nearest-rank percentile of some values.
+
+    """
+    if not values:
+        return 0.0
+
+    ordered = sorted(values)
+    rank = max(1, ceil(q / 100 * len(ordered)))
+
+    return ordered[rank - 1]
+
+
+def summarise(latencies: Sequence[float]) -> Dict[str, float]:
+    """
+    Return the percentiles of some latencies, in milliseconds.
+
+    """
+    return {
+        f"p{q}_ms": round(percentile(latencies, q) * 1000, 3)
+        for q in (50, 95, 99)
+    } | {"max_ms": round(max(latencies, default=0.0) * 1000, 3)}
+
+
+def benchmark_search(
+    code_name: str,
+    positions: Sequence[Position],
+    depth: int,
+    time_limit: Optional[float] = None,
+    memory: bool = True,
+) -> Dict[str, Any]:
+    """
+    Search every position with an algorithm as ``compute_ai_move`` does.
+
+    Each position is searched by iterative deepening with a fresh
+    transposition table. The peak memory is measured in a second pass under
+    ``tracemalloc``, so tracing does not slow the timed pass.
+
+    Parameters
+    ----------
+    code_name : str
+        The code name of the algorithm.
+
+    positions : Sequence[Position]
+        The boards to search, each with the token of the player to move.
+
+    depth : int
+        The depth to search to.
+
+    time_limit : Optional[float]
+        The number of seconds each search may take, if limited.
+
+    memory : bool
+        Whether to measure the peak memory of the searches.
+
+    Returns
+    -------
+    Dict[str, Any]
+        The nodes searched, the nodes per second, the depths reached, the
+        latency percentiles and the peak memory.
+
+    """
+    algorithm_class = ALGORITHMS[code_name]
+    latencies = []
+    depths = []
+    nodes = 0
+
+    for board, token in positions:
+        search = algorithm_class(token, board, depth)
+        driver = IterativeDeepening(search, time_limit)
+
+        start = perf_counter()
+        driver.get_move()
+        latencies.append(perf_counter() - start)
+
+        depths.append(driver.depth_reached)
+        nodes += search.nodes
+
+    elapsed = sum(latencies)
+    result = {
+        "algorithm": code_name,
+        "depth": depth,
+        "time_limit": time_limit,
+        "positions": len(positions),
+        "nodes": nodes,
+        "seconds": round(elapsed, 4),
+        "nodes_per_second": round(nodes / elapsed) if elapsed else 0,
+        "depth_reached": {
+            "min": min(depths, default=0),
+            "mean": round(sum(depths) / len(depths), 2) if depths else 0,
+        },
+        "latency": summarise(latencies),
+    }
+
+    if memory:
+        tracemalloc.start()
+        try:
+            for board, token in positions:
+                search = algorithm_class(token, board, depth)
+                IterativeDeepening(search, time_limit).get_move()
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+        result["peak_memory_bytes"] = peak
+
+    return result
+
+
+def benchmark_board(
+    positions: Sequence[Position], repeat: int = 100
+) -> Dict[str, Any]:
+    """
+    Time dropping, checking and undoing every open move on each position.
+
+    """
+    boards = [(Board(board, token), token) for board, token in positions]
+    operations = 0
+
+    start = perf_counter()
+    for _ in range(repeat):
+        for board, token in boards:
+            for column in board.get_open_columns():
+                board.drop_token(column, token)
+                board.winner()
+                board.undo_move()
+                operations += 1
+    elapsed = perf_counter() - start
+
+    return {
+        "operations": operations,
+        "seconds": round(elapsed, 4),
+        "operations_per_second": round(operations / elapsed) if elapsed else 0,
+    }
+
+
+def benchmark_get_score(
+    positions: Sequence[Position], repeat: int = 100
+) -> Dict[str, Any]:
+    """
+    Time scoring each position from scratch with ``get_score``.
+
+    """
+    boards = [np.array(board, dtype=np.int32) for board, _ in positions]
+    calls = len(boards) * repeat
+
+    start = perf_counter()
+    for _ in range(repeat):
+        for board in boards:
+            get_score(board, PLAYER_ONE)
+    elapsed = perf_counter() - start
+
+    return {
+        "calls": calls,
+        "seconds": round(elapsed, 4),
+        "calls_per_second": round(calls / elapsed) if elapsed else 0,
+    }
+
+
+def run_benchmark(
+    sizes: Sequence[Tuple[int, int]] = ((6, 7),),
+    depths: Optional[Sequence[int]] = None,
+    count: int = 20,
+    seed: int = 0,
+    time_limit: Optional[float] = None,
+    memory: bool = True,
+    fixture: Path = FIXTURE,
+) -> Dict[str, Any]:
+    """
+    Benchmark the AI engine over a corpus of positions.
+
+    The algorithms come from the fixture, each searched to its own depth
+    unless ``depths`` is given. Positions are generated from ``seed``, so
+    the same arguments replay the same corpus and the JSON results can be
+    compared between releases.
+
+    Parameters
+    ----------
+    sizes : Sequence[Tuple[int, int]]
+        The rows and columns of the boards to benchmark.
+
+    depths : Optional[Sequence[int]]
+        The depths to search each algorithm to.
+
+    count : int
+        The number of positions generated for each board size.
+
+    seed : int
+        The seed the positions are generated from.
+
+    time_limit : Optional[float]
+        The number of seconds each search may take, if limited.
+
+    memory : bool
+        Whether to measure the peak memory of the searches.
+
+    fixture : Path
+        The fixture holding the algorithms to benchmark.
+
+    Returns
+    -------
+    Dict[str, Any]
+        The environment and the results for each board size.
+
+    """
+    algorithms = load_algorithms(fixture)
+    results = []
+
+    for rows, columns in sizes:
+        positions = generate_positions(count, rows, columns, seed=seed)
+        searches = [
+            benchmark_search(code_name, positions, depth, time_limit, memory)
+            for code_name, default in algorithms
+            for depth in (depths or [default])
+        ]
+
+        results.append(
+            {
+                "rows": rows,
+                "columns": columns,
+                "board": benchmark_board(positions),
+                "get_score": benchmark_get_score(positions),
+                "searches": searches,
+            }
+        )
+
+    return {
+        "environment": {
+            "python": platform.python_version(),
+            "numpy": np.__version__,
+            "machine": platform.machine(),
+        },
+        "corpus": {"positions": count, "seed": seed},
+        "results": results,
+    }
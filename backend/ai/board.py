@@ -1,85 +1,238 @@
-from itertools import product
-from typing import List, Tuple
+from typing import Dict, List, Sequence, Tuple, Union
 
 import numpy as np
 import numpy.typing as npt
-from core.constants import EMPTY, PLAYER_ONE, PLAYER_TWO
+from core.constants import CONNECT, EMPTY, PLAYER_ONE, PLAYER_TWO
+
+from ai.tables import (
+    CENTRE_WEIGHT,
+    SCORE_TABLE,
+    cell_windows,
+    window_indices,
+    zobrist_keys,
+)
 
 
 class Board:
-    def __init__(self, board: npt.NDArray[np.int32], player: int) -> None:
-        self.board = board
+    """
+    Bitboard representation of a Connect Four position.
+
+    Each column occupies ``rows + 1`` bits of an integer mask, with the
+    extra bit acting as a sentinel so that shifted masks never connect
+    tokens across neighbouring columns. One mask is kept per token and the
+    height of each column is tracked so a drop is a single bit operation.
+
+    The heuristic score of both players is maintained incrementally: every
+    drop and undo only revisits the windows containing the changed cell.
+
+    """
+
+    def __init__(
+        self,
+        board: Union[npt.NDArray[np.int32], Sequence[Sequence[int]]],
+        player: int,
+    ) -> None:
+        grid = board.tolist() if isinstance(board, np.ndarray) else board
+
         self.player = player
         self.opponent = PLAYER_ONE if player == PLAYER_TWO else PLAYER_TWO
 
-        self.rows = board.shape[0]
-        self.columns = board.shape[1]
+        self.rows = len(grid)
+        self.columns = len(grid[0])
+        self.height = self.rows + 1
+
+        # Shifts between neighbouring cells: vertical, horizontal and the
+        # two diagonals.
+        self.directions = (1, self.height, self.height - 1, self.height + 1)
 
+        self.masks: Dict[int, int] = {PLAYER_ONE: 0, PLAYER_TWO: 0}
+        self.heights: List[int] = [0] * self.columns
         self.moves: List[Tuple[int, int]] = []
+        self.size = self.rows * self.columns
+        self.filled = 0
+
+        self.centre = self.columns // 2
+        self.cell_windows = cell_windows(self.rows, self.columns)
+        windows = len(window_indices(self.rows, self.columns))
+        self.window_counts: Dict[int, List[int]] = {
+            PLAYER_ONE: [0] * windows,
+            PLAYER_TWO: [0] * windows,
+        }
+        self.scores: Dict[int, int] = {PLAYER_ONE: 0, PLAYER_TWO: 0}
+
+        self.zobrist = zobrist_keys(self.rows, self.columns)
+        self.hash = 0
+
+        for column in range(self.columns):
+            for row in range(self.rows - 1, -1, -1):
+                token = int(grid[row][column])
+                if token == EMPTY:
+                    break
+
+                self._place(column, token)
+
+    def _bit(self, column: int, level: int) -> int:
+        return column * self.height + level
+
+    def _place(self, column: int, token: int) -> int:
+        level = self.heights[column]
+        row = self.rows - 1 - level
+
+        self.masks[token] |= 1 << self._bit(column, level)
+        self.heights[column] = level + 1
+        self.filled += 1
+        self.hash ^= self.zobrist[token][row * self.columns + column]
+
+        self._update_scores(row, column, token, 1)
+
+        return row
+
+    def _remove(self, row: int, column: int) -> None:
+        token = self.get_token(row, column)
+
+        self.heights[column] -= 1
+        self.filled -= 1
+        self.masks[token] &= ~(1 << self._bit(column, self.heights[column]))
+        self.hash ^= self.zobrist[token][row * self.columns + column]
+
+        self._update_scores(row, column, token, -1)
+
+    def _update_scores(
+        self, row: int, column: int, token: int, step: int
+    ) -> None:
+        other = PLAYER_ONE if token == PLAYER_TWO else PLAYER_TWO
+        own_counts = self.window_counts[token]
+        other_counts = self.window_counts[other]
+        own_score = self.scores[token]
+        other_score = self.scores[other]
+
+        for window in self.cell_windows[row * self.columns + column]:
+            before = own_counts[window]
+            after = before + step
+            against = other_counts[window]
+
+            own_score += SCORE_TABLE[after][against]
+            own_score -= SCORE_TABLE[before][against]
+            other_score += SCORE_TABLE[against][after]
+            other_score -= SCORE_TABLE[against][before]
+
+            own_counts[window] = after
+
+        if column == self.centre:
+            own_score += CENTRE_WEIGHT * step
+
+        self.scores[token] = own_score
+        self.scores[other] = other_score
+
+    def score(self, token: int) -> int:
+        return self.scores[token]
 
     def game_over(self) -> bool:
-        return (
-            self.is_full()
-            or self.is_winner(self.player)
-            or self.is_winner(self.opponent)
-        )
+        return self.is_full() or self.winner() != EMPTY
 
     def is_full(self) -> bool:
-        return bool(np.all(self.board != EMPTY))
+        return self.filled == self.size
 
-    def is_winner(self, token: int) -> bool:
-        for r, c in product(range(self.rows), range(self.columns - 3)):
-            if np.all(self.board[r, c : c + 4] == token):
-                return True
+    def winner(self) -> int:
+        if self.moves:
+            row, column = self.moves[-1]
+            token = self.get_token(row, column)
+
+            return token if self._connects(token, row, column) else EMPTY
+
+        if self.is_winner(self.player):
+            return self.player
+        if self.is_winner(self.opponent):
+            return self.opponent
+
+        return EMPTY
+
+    def _connects(self, token: int, row: int, column: int) -> bool:
+        # Only the four lines through the given cell can have changed, so
+        # walk outwards along each of them instead of scanning the board.
+        mask = self.masks[token]
+        bit = 1 << self._bit(column, self.rows - 1 - row)
+
+        for shift in self.directions:
+            count = 1
 
-        for r, c in product(range(self.rows - 3), range(self.columns)):
-            if np.all(self.board[r : r + 4, c] == token):
+            cell = bit << shift
+            while mask & cell and count < CONNECT:
+                count += 1
+                cell <<= shift
+
+            cell = bit >> shift
+            while mask & cell and count < CONNECT:
+                count += 1
+                cell >>= shift
+
+            if count >= CONNECT:
                 return True
 
-        for r, c in product(range(self.rows - 3), range(self.columns - 3)):
-            if np.all([self.board[r + i, c + i] == token for i in range(4)]):
+        return False
+
+    def is_winner(self, token: int) -> bool:
+        mask = self.masks[token]
+
+        for shift in self.directions:
+            line = mask
+            for step in range(1, CONNECT):
+                line &= mask >> (shift * step)
+
+            if line:
                 return True
 
-        return any(
-            np.all([self.board[r - i, c + i] == token for i in range(4)])
-            for r, c in product(range(3, self.rows), range(self.columns - 3))
-        )
+        return False
 
     def drop_token(self, column: int, token: int) -> bool:
         if not 0 <= column < self.columns:
             return False
 
-        empty_rows = np.where(self.board[:, column] == EMPTY)[0]
-
-        if empty_rows.size > 0:
-            row = empty_rows[-1]
-
-            self.board[row, column] = token
-            self.moves.append((row, column))
+        if self.heights[column] == self.rows:
+            return False
 
-            return True
+        self.moves.append((self._place(column, token), column))
 
-        return False
+        return True
 
     def undo_move(self) -> bool:
         if not self.moves:
             return False
 
         row, column = self.moves.pop()
-        self.board[row, column] = EMPTY
+        self._remove(row, column)
 
         return True
 
     def get_open_columns(self) -> List[int]:
-        open_columns = np.where(self.board[0] == EMPTY)[0]
-
-        return open_columns.tolist()
+        return [
+            column
+            for column, level in enumerate(self.heights)
+            if level < self.rows
+        ]
 
     def get_open_row(self, column: int) -> int:
-        empty_rows = np.where(self.board[:, column] == EMPTY)[0]
+        level = self.heights[column]
+
+        return self.rows - 1 - level if level < self.rows else -1
+
+    def get_token(self, row: int, column: int) -> int:
+        bit = 1 << self._bit(column, self.rows - 1 - row)
 
-        return int(empty_rows[-1]) if empty_rows.size > 0 else -1
+        if self.masks[PLAYER_ONE] & bit:
+            return PLAYER_ONE
+        if self.masks[PLAYER_TWO] & bit:
+            return PLAYER_TWO
+
+        return EMPTY
+
+    @property
+    def board(self) -> npt.NDArray[np.int32]:
+        return np.array(self.raw, dtype=np.int32)
 
     @property
     def raw(self) -> List[List[int]]:
-        return self.board.tolist()
+        return [
+            [self.get_token(row, column) for column in range(self.columns)]
+            for row in range(self.rows)
+        ]
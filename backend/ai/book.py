@@ -0,0 +1,151 @@
+import struct
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+from core.constants import PLAYER_ONE
+from django.conf import settings
+
+from ai.board import Board
+
+MAGIC = b"C4OB"
+VERSION = 1
+
+# magic, version, rows, columns, number of records
+HEADER = struct.Struct("<4sBBBI")
+# canonical position key, column to play
+RECORD = struct.Struct("<QB")
+
+KEY_BITS = 64
+
+
+def position_key(board: Board) -> int:
+    """
+    Return a key that uniquely identifies the tokens on a board.
+
+    Each column contributes ``rows + 1`` bits: the player one tokens, plus
+    a marker bit just above the top token of the column.
+
+    """
+    key = board.masks[PLAYER_ONE]
+
+    for column, level in enumerate(board.heights):
+        key |= 1 << (column * board.height + level)
+
+    return key
+
+
+def mirror_key(key: int, rows: int, columns: int) -> int:
+    """
+    Return the key of the position reflected left to right.
+
+    """
+    height = rows + 1
+    group = (1 << height) - 1
+    mirrored = 0
+
+    for column in range(columns):
+        bits = (key >> (column * height)) & group
+        mirrored |= bits << ((columns - 1 - column) * height)
+
+    return mirrored
+
+
+def canonical_key(board: Board) -> Tuple[int, bool]:
+    """
+    Return the smaller of a position's key and its mirror's key.
+
+    Returns
+    -------
+    Tuple[int, bool]
+        The canonical key and whether it belongs to the mirrored position.
+
+    """
+    key = position_key(board)
+    mirrored = mirror_key(key, board.rows, board.columns)
+
+    return (mirrored, True) if mirrored < key else (key, False)
+
+
+class OpeningBook:
+    """
+    Best moves for early positions, keyed by canonical position key.
+
+    """
+
+    def __init__(
+        self, rows: int, columns: int, moves: Optional[Dict[int, int]] = None
+    ) -> None:
+        if (rows + 1) * columns > KEY_BITS:
+            raise ValueError(
+                f"A {rows}x{columns} board does not fit a {KEY_BITS}-bit key"
+            )
+
+        self.rows = rows
+        self.columns = columns
+        self.moves: Dict[int, int] = moves or {}
+
+    def __len__(self) -> int:
+        return len(self.moves)
+
+    def __contains__(self, board: Board) -> bool:
+        return canonical_key(board)[0] in self.moves
+
+    def supports(self, board: Board) -> bool:
+        return board.rows == self.rows and board.columns == self.columns
+
+    def add(self, board: Board, column: int) -> None:
+        key, mirrored = canonical_key(board)
+        self.moves[key] = self.columns - 1 - column if mirrored else column
+
+    def lookup(self, board: Board) -> Optional[int]:
+        if not self.supports(board):
+            return None
+
+        key, mirrored = canonical_key(board)
+        column = self.moves.get(key)
+
+        if column is None:
+            return None
+
+        return self.columns - 1 - column if mirrored else column
+
+    def save(self, path: Path) -> None:
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        with path.open("wb") as file:
+            file.write(
+                HEADER.pack(
+                    MAGIC, VERSION, self.rows, self.columns, len(self.moves)
+                )
+            )
+            for key in sorted(self.moves):
+                file.write(RECORD.pack(key, self.moves[key]))
+
+    @classmethod
+    def load(cls, path: Path) -> "OpeningBook":
+        data = Path(path).read_bytes()
+        magic, version, rows, columns, count = HEADER.unpack_from(data)
+
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"{path} is not a version {VERSION} opening book")
+
+        moves = dict(
+            RECORD.iter_unpack(
+                data[HEADER.size : HEADER.size + count * RECORD.size]
+            )
+        )
+
+        return cls(rows, columns, moves)
+
+
+@lru_cache(maxsize=1)
+def get_opening_book() -> Optional[OpeningBook]:
+    """
+    Return the opening book configured in the settings, if there is one.
+
+    """
+    path = Path(settings.AI_OPENING_BOOK)
+
+    return OpeningBook.load(path) if path.is_file() else None
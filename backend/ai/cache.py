@@ -0,0 +1,188 @@
+from collections import Counter, OrderedDict
+from typing import Dict, Optional, Tuple
+
+import redis
+from core.redis import position_cache_client
+from django.conf import settings
+
+from ai.board import Board
+from ai.book import canonical_key
+
+PREFIX = "ai:position"
+STATS_KEY = f"{PREFIX}:stats"
+COUNTERS = ("front_hits", "hits", "misses")
+
+
+class PositionCache:
+    """
+    Cache of AI moves shared by every game and worker.
+
+    Moves are stored with a TTL in a Redis instance of their own, keyed by
+    the canonical position, the token of the player to move, the algorithm
+    and the depth, so a position and its mirror image share an entry. That
+    instance evicts the least recently used entries under memory pressure
+    (``volatile-lru``) without touching the queues and game state, and
+    each process keeps its most recently used entries in a small front
+    cache to skip the round trip.
+
+    Hit counters are kept per process and added to the shared counters in
+    Redis along with the next lookup that reaches Redis. Redis errors are
+    treated as misses so the AI keeps playing without it.
+
+    """
+
+    def __init__(
+        self,
+        client: redis.Redis = position_cache_client,
+        ttl: Optional[int] = None,
+        front_size: Optional[int] = None,
+    ) -> None:
+        self.client = client
+        self.ttl = settings.AI_POSITION_CACHE_TTL if ttl is None else ttl
+        self.front_size = (
+            settings.AI_POSITION_CACHE_FRONT_SIZE
+            if front_size is None
+            else front_size
+        )
+        self.front: OrderedDict[str, int] = OrderedDict()
+
+        self.counts: Counter = Counter()
+        self.pending: Counter = Counter()
+
+    @staticmethod
+    def key(
+        board: Board, token: int, code_name: str, depth: int
+    ) -> Tuple[str, bool]:
+        """
+        Return the Redis key of a search and whether the board is mirrored.
+
+        """
+        position, mirrored = canonical_key(board)
+        key = (
+            f"{PREFIX}:{board.rows}x{board.columns}:{position:x}"
+            f":{token}:{code_name}:{depth}"
+        )
+
+        return key, mirrored
+
+    def get(
+        self, board: Board, token: int, code_name: str, depth: int
+    ) -> Optional[int]:
+        """
+        Return the cached column to play on a board, if there is one.
+
+        """
+        key, mirrored = self.key(board, token, code_name, depth)
+
+        if (column := self.front.get(key)) is not None:
+            self.front.move_to_end(key)
+            self._count("front_hits")
+        else:
+            try:
+                pipeline = self.client.pipeline(transaction=False)
+                self._flush(pipeline)
+                value = pipeline.get(key).execute()[-1]
+            except redis.RedisError:
+                value = None
+
+            if value is None:
+                self._count("misses")
+                return None
+
+            column = int(value)
+            self._remember(key, column)
+            self._count("hits")
+
+        return board.columns - 1 - column if mirrored else column
+
+    def set(
+        self,
+        board: Board,
+        token: int,
+        code_name: str,
+        depth: int,
+        column: int,
+    ) -> None:
+        """
+        Cache the column to play on a board.
+
+        """
+        key, mirrored = self.key(board, token, code_name, depth)
+        column = board.columns - 1 - column if mirrored else column
+
+        self._remember(key, column)
+
+        try:
+            self.client.set(key, column, ex=self.ttl)
+        except redis.RedisError:
+            pass
+
+    def clear(self) -> None:
+        """
+        Remove every cached move and reset the counters.
+
+        """
+        self.front.clear()
+        self.counts.clear()
+        self.pending.clear()
+
+        try:
+            keys = list(self.client.scan_iter(f"{PREFIX}:*"))
+            if keys:
+                self.client.delete(*keys)
+        except redis.RedisError:
+            pass
+
+    @property
+    def hit_rate(self) -> float:
+        """
+        The fraction of this process's lookups that were hits.
+
+        """
+        return _hit_rate(self.counts)
+
+    def stats(self) -> Dict[str, float]:
+        """
+        Return the counters shared by every process using the cache.
+
+        """
+        try:
+            pipeline = self.client.pipeline(transaction=False)
+            self._flush(pipeline)
+            counts = pipeline.hgetall(STATS_KEY).execute()[-1]
+        except redis.RedisError:
+            counts = {}
+
+        counts = {name: int(counts.get(name, 0)) for name in COUNTERS}
+
+        return {**counts, "hit_rate": _hit_rate(counts)}
+
+    def _remember(self, key: str, column: int) -> None:
+        if self.front_size <= 0:
+            return
+
+        self.front[key] = column
+        self.front.move_to_end(key)
+
+        while len(self.front) > self.front_size:
+            self.front.popitem(last=False)
+
+    def _count(self, name: str) -> None:
+        self.counts[name] += 1
+        self.pending[name] += 1
+
+    def _flush(self, pipeline) -> None:
+        for name, count in self.pending.items():
+            pipeline.hincrby(STATS_KEY, name, count)
+
+        self.pending.clear()
+
+
+def _hit_rate(counts) -> float:
+    hits = counts.get("front_hits", 0) + counts.get("hits", 0)
+    lookups = hits + counts.get("misses", 0)
+
+    return hits / lookups if lookups else 0.0
+
+
+position_cache = PositionCache()
@@ -0,0 +1,107 @@
+from typing import List, Optional, Tuple
+
+from core.dataclasses import Algorithm as cfa
+from django.conf import settings
+
+from ai.algorithm.alphabeta import AlphaBeta
+from ai.algorithm.iterative import IterativeDeepening
+from ai.algorithm.minimax import Minimax
+from ai.algorithm.parallel import RootParallel, can_start_pool
+from ai.board import Board
+from ai.book import get_opening_book
+from ai.cache import PositionCache, position_cache
+from ai.transposition import TranspositionTable
+
+
+def find_move(
+    code_name: str,
+    player: int,
+    board: List[List[int]],
+    depth: int,
+    time_limit: Optional[float] = None,
+    workers: int = 1,
+    cache: Optional[PositionCache] = position_cache,
+    table: Optional[TranspositionTable] = None,
+) -> Optional[Tuple[int, int]]:
+    """
+    Find the move an AI player makes on a board.
+
+    The opening book is consulted first when searching at least
+    ``AI_OPENING_BOOK_MIN_DEPTH`` deep, then the shared position cache;
+    otherwise the algorithm named by ``code_name`` searches the board by
+    iterative deepening, split across ``workers`` processes when there is
+    more than one and this process may start them. The result is cached
+    only when the search was not cut short by ``time_limit``, so a
+    shallower move found under a tight budget is never replayed to a
+    caller with a larger one.
+
+    Parameters
+    ----------
+    code_name : str
+        The code name of the algorithm.
+
+    player : int
+        The token of the AI player.
+
+    board : List[List[int]]
+        The game board.
+
+    depth : int
+        The maximum depth to search to.
+
+    time_limit : Optional[float]
+        The number of seconds the search may take, if limited.
+
+    workers : int
+        The number of processes to search the root moves with. The search
+        runs in this process instead when it is daemonic, as in a Celery
+        prefork worker.
+
+    cache : Optional[PositionCache]
+        The cache of previous searches, or None to always search.
+
+    table : Optional[TranspositionTable]
+        The transposition table to search with, which may be shared by
+        several searches. A new table is used if None.
+
+    Returns
+    -------
+    Optional[Tuple[int, int]]
+        The row and column of the move, or None if the algorithm is
+        unknown.
+
+    """
+    match code_name:
+        case cfa.MINIMAX.value:
+            algorithm_class = Minimax
+        case cfa.ALPHA_BETA.value:
+            algorithm_class = AlphaBeta
+        case _:
+            return None
+
+    position = Board(board, player)
+
+    if (
+        depth >= settings.AI_OPENING_BOOK_MIN_DEPTH
+        and (book := get_opening_book())
+        and (column := book.lookup(position)) is not None
+    ):
+        return position.get_open_row(column), column
+
+    if cache and (
+        column := cache.get(position, player, code_name, depth)
+    ) is not None:
+        return position.get_open_row(column), column
+
+    algorithm = algorithm_class(player, board, depth, table)
+    if workers > 1 and can_start_pool():
+        driver = RootParallel(algorithm, workers, time_limit)
+    else:
+        driver = IterativeDeepening(algorithm, time_limit)
+
+    row, column = driver.get_move()
+
+    if cache and driver.complete:
+        cache.set(position, player, code_name, depth, column)
+
+    return row, column
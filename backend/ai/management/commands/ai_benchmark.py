@@ -0,0 +1,63 @@
+import json
+from pathlib import Path
+
+from ai.benchmark import FIXTURE, run_benchmark
+from django.core.management.base import BaseCommand, CommandError
+
+
+def board_size(value: str):
+    try:
+        rows, columns = (int(n) for n in value.lower().split("x"))
+    except ValueError:
+        raise CommandError(f"Invalid board size {value!r}, expected RxC")
+
+    return rows, columns
+
+
+class Command(BaseCommand):
+    """
+    Command to benchmark the AI engine.
+
+    """
+
+    help = (
+        "Searches a reproducible corpus of positions with every algorithm "
+        "and prints the nodes, nodes per second, latency percentiles and "
+        "peak memory as JSON."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--sizes", nargs="+", type=board_size, default=[(6, 7)]
+        )
+        parser.add_argument("--depths", nargs="+", type=int, default=None)
+        parser.add_argument("--positions", type=int, default=20)
+        parser.add_argument("--seed", type=int, default=0)
+        parser.add_argument("--time-limit", type=float, default=None)
+        parser.add_argument("--fixture", type=Path, default=FIXTURE)
+        parser.add_argument("--no-memory", action="store_true")
+        parser.add_argument("--output", type=Path, default=None)
+
+    def handle(self, *args, **options):
+        """
+        Handle the command.
+
+        """
+        result = run_benchmark(
+            sizes=options["sizes"],
+            depths=options["depths"],
+            count=options["positions"],
+            seed=options["seed"],
+            time_limit=options["time_limit"],
+            memory=not options["no_memory"],
+            fixture=options["fixture"],
+        )
+        output = json.dumps(result, indent=2)
+
+        if options["output"]:
+            options["output"].write_text(output + "\n")
+            self.stdout.write(
+                self.style.SUCCESS(f"Saved results to {options['output']}")
+            )
+        else:
+            self.stdout.write(output)
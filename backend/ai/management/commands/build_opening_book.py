@@ -0,0 +1,82 @@
+from pathlib import Path
+
+from ai.algorithm.alphabeta import AlphaBeta
+from ai.algorithm.iterative import IterativeDeepening
+from ai.board import Board
+from ai.book import OpeningBook, canonical_key
+from core.constants import (
+    DEFAULT_COLUMNS,
+    DEFAULT_ROWS,
+    EMPTY,
+    PLAYER_ONE,
+    PLAYER_TWO,
+)
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+
+class Command(BaseCommand):
+    """
+    Command to build the opening book used by the AI players.
+
+    """
+
+    help = (
+        "Searches every opening position to a high depth and stores the "
+        "best move for each in the opening book."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--plies", type=int, default=4)
+        parser.add_argument("--depth", type=int, default=14)
+        parser.add_argument("--time-limit", type=float, default=None)
+        parser.add_argument("--rows", type=int, default=DEFAULT_ROWS)
+        parser.add_argument("--columns", type=int, default=DEFAULT_COLUMNS)
+        parser.add_argument(
+            "--output", type=Path, default=Path(settings.AI_OPENING_BOOK)
+        )
+
+    def handle(self, *args, **options):
+        """
+        Handle the command.
+
+        """
+        rows, columns = options["rows"], options["columns"]
+
+        try:
+            book = OpeningBook(rows, columns)
+        except ValueError as e:
+            raise CommandError(str(e))
+
+        board = Board([[EMPTY] * columns for _ in range(rows)], PLAYER_ONE)
+        self._build(book, board, PLAYER_ONE, options)
+
+        book.save(options["output"])
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Saved {len(book)} positions to {options['output']}"
+            )
+        )
+
+    def _build(self, book, board, token, options) -> None:
+        if board.filled >= options["plies"] or board.game_over():
+            return
+        if board in book:
+            return
+
+        search = AlphaBeta(token, board.raw, options["depth"])
+        driver = IterativeDeepening(search, options["time_limit"])
+        _, column = driver.get_move()
+        book.add(board, column)
+
+        key, _ = canonical_key(board)
+        self.stdout.write(
+            f"{key:#018x} -> {column} (depth {driver.depth_reached})"
+        )
+
+        opponent = PLAYER_TWO if token == PLAYER_ONE else PLAYER_ONE
+        for open_column in board.get_open_columns():
+            board.drop_token(open_column, token)
+            self._build(book, board, opponent, options)
+            board.undo_move()
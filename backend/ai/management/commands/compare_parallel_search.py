@@ -0,0 +1,66 @@
+import os
+from time import perf_counter
+
+from ai.algorithm.alphabeta import AlphaBeta
+from ai.algorithm.iterative import IterativeDeepening
+from ai.algorithm.parallel import RootParallel, get_pool
+from ai.positions import generate_positions
+from django.core.management.base import BaseCommand
+
+
+class Command(BaseCommand):
+    """
+    Command to measure the speedup of the parallel AI search.
+
+    """
+
+    help = (
+        "Searches generated positions with the serial AlphaBeta and with "
+        "the root-parallel search, and reports the speedup."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--depth", type=int, default=8)
+        parser.add_argument("--workers", type=int, default=os.cpu_count())
+        parser.add_argument("--positions", type=int, default=10)
+        parser.add_argument("--seed", type=int, default=0)
+
+    def handle(self, *args, **options):
+        """
+        Handle the command.
+
+        """
+        depth, workers = options["depth"], options["workers"]
+        positions = generate_positions(
+            options["positions"], seed=options["seed"]
+        )
+
+        # Start the workers before timing anything.
+        pool = get_pool(workers)
+        list(pool.map(abs, range(workers)))
+
+        serial = parallel = 0.0
+        serial_nodes = parallel_nodes = 0
+
+        for board, token in positions:
+            search = AlphaBeta(token, board, depth)
+            start = perf_counter()
+            IterativeDeepening(search).get_move()
+            serial += perf_counter() - start
+            serial_nodes += search.nodes
+
+            driver = RootParallel(AlphaBeta(token, board, depth), workers)
+            start = perf_counter()
+            driver.get_move()
+            parallel += perf_counter() - start
+            parallel_nodes += driver.nodes
+
+        self.stdout.write(
+            f"Positions: {len(positions)}, depth: {depth}, "
+            f"workers: {workers}, cpus: {os.cpu_count()}"
+        )
+        self.stdout.write(f"Serial:   {serial:.3f}s, {serial_nodes} nodes")
+        self.stdout.write(f"Parallel: {parallel:.3f}s, {parallel_nodes} nodes")
+        self.stdout.write(
+            self.style.SUCCESS(f"Speedup: {serial / parallel:.2f}x")
+        )
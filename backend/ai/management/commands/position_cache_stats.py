@@ -0,0 +1,30 @@
+import json
+
+from ai.cache import position_cache
+from django.core.management.base import BaseCommand
+
+
+class Command(BaseCommand):
+    """
+    Command to report the hit rate of the shared AI position cache.
+
+    """
+
+    help = "Prints the hit counters of the shared AI position cache as JSON."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--clear",
+            action="store_true",
+            help="Remove every cached move and reset the counters.",
+        )
+
+    def handle(self, *args, **options):
+        """
+        Handle the command.
+
+        """
+        if options["clear"]:
+            position_cache.clear()
+
+        self.stdout.write(json.dumps(position_cache.stats(), indent=2))
@@ -0,0 +1,85 @@
+from typing import Dict, List, Optional
+
+from core.constants import PLAYER_ONE, PLAYER_TWO
+
+# Number of killer moves remembered for each ply.
+KILLER_SLOTS = 2
+
+
+def centre_out(columns: int) -> List[int]:
+    """
+    Return the columns of a board ordered from the centre outwards.
+
+    Parameters
+    ----------
+    columns : int
+        The number of columns on the board.
+
+    Returns
+    -------
+    List[int]
+        The column indices, centre first, alternating left and right.
+
+    """
+    centre = columns // 2
+
+    return sorted(range(columns), key=lambda c: (abs(c - centre), c))
+
+
+class MoveOrdering:
+    """
+    Orders the moves at a node so alpha-beta is likely to cut off early.
+
+    Moves are tried in the order: the transposition table's best move, the
+    killer moves for the ply, then by history score, with the centre-out
+    static order breaking ties.
+
+    """
+
+    def __init__(self, columns: int, plies: int, enabled: bool = True) -> None:
+        self.enabled = enabled
+        self.static = centre_out(columns)
+        self.rank = {column: i for i, column in enumerate(self.static)}
+
+        self.killers: List[List[int]] = [
+            [-1] * KILLER_SLOTS for _ in range(plies + 1)
+        ]
+        self.history: Dict[int, List[int]] = {
+            PLAYER_ONE: [0] * columns,
+            PLAYER_TWO: [0] * columns,
+        }
+
+    def order(
+        self,
+        columns: List[int],
+        ply: int,
+        token: int,
+        best_move: Optional[int] = None,
+    ) -> List[int]:
+        if not self.enabled:
+            return columns
+
+        killers = self.killers[ply]
+        history = self.history[token]
+        rank = self.rank
+
+        def priority(column: int) -> tuple:
+            return (
+                column != best_move,
+                column not in killers,
+                -history[column],
+                rank[column],
+            )
+
+        return sorted(columns, key=priority)
+
+    def cutoff(self, column: int, ply: int, token: int, depth: int) -> None:
+        if not self.enabled:
+            return
+
+        killers = self.killers[ply]
+        if column not in killers:
+            killers.pop()
+            killers.insert(0, column)
+
+        self.history[token][column] += depth * depth
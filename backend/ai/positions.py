@@ -0,0 +1,66 @@
+from random import Random
+from typing import List, Tuple
+
+from core.constants import (
+    DEFAULT_COLUMNS,
+    DEFAULT_ROWS,
+    EMPTY,
+    PLAYER_ONE,
+    PLAYER_TWO,
+)
+
+from ai.board import Board
+
+
+def generate_positions(
+    count: int,
+    rows: int = DEFAULT_ROWS,
+    columns: int = DEFAULT_COLUMNS,
+    plies: Tuple[int, int] = (4, 16),
+    seed: int = 0,
+) -> List[Tuple[List[List[int]], int]]:
+    """
+    Generate reproducible mid-game positions by playing random moves.
+
+    Parameters
+    ----------
+    count : int
+        The number of positions to generate.
+
+    rows : int
+        The number of rows on the board.
+
+    columns : int
+        The number of columns on the board.
+
+    plies : Tuple[int, int]
+        The inclusive range of moves played from the empty board.
+
+    seed : int
+        The seed for the random number generator.
+
+    Returns
+    -------
+    List[Tuple[List[List[int]], int]]
+        The boards, each paired with the token of the player to move.
+        Positions that are already decided are skipped.
+
+    """
+    rng = Random(seed)
+    positions = []
+    low, high = plies[0], min(plies[1], rows * columns - 1)
+
+    while len(positions) < count:
+        board = Board([[EMPTY] * columns for _ in range(rows)], PLAYER_ONE)
+        token = PLAYER_ONE
+
+        for _ in range(rng.randint(low, high)):
+            board.drop_token(rng.choice(board.get_open_columns()), token)
+            token = PLAYER_TWO if token == PLAYER_ONE else PLAYER_ONE
+
+            if board.game_over():
+                break
+        else:
+            positions.append((board.raw, token))
+
+    return positions
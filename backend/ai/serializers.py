@@ -44,4 +44,9 @@ class AlgorithmDetailSerializer(AlgorithmSerializer):
 
         """
 
-        fields = AlgorithmSerializer.Meta.fields + ["description", "depth"]
+        fields = AlgorithmSerializer.Meta.fields + [
+            "description",
+            "depth",
+            "time_limit",
+            "workers",
+        ]
@@ -0,0 +1,173 @@
+from functools import lru_cache
+from random import Random
+
+import numpy as np
+import numpy.typing as npt
+from core.constants import CONNECT, PLAYER_ONE, PLAYER_TWO
+
+# Weight awarded for the centre column, per token.
+CENTRE_WEIGHT = 3
+
+# Seed for the Zobrist keys so hashes are stable across processes.
+ZOBRIST_SEED = 0xC0FFEE
+
+
+def _window_score(own: int, other: int) -> int:
+    empty = CONNECT - own - other
+    score = 0
+
+    if own == 4:
+        score += 100
+    elif own == 3 and empty == 1:
+        score += 5
+    elif own == 2 and empty == 2:
+        score += 2
+
+    if other == 3 and empty == 1:
+        score -= 4
+
+    return score
+
+
+# Score of a single window indexed by the number of tokens the player and
+# the opponent hold in it.
+WINDOW_SCORES: npt.NDArray[np.int32] = np.array(
+    [
+        [
+            _window_score(own, other) if own + other <= CONNECT else 0
+            for other in range(CONNECT + 1)
+        ]
+        for own in range(CONNECT + 1)
+    ],
+    dtype=np.int32,
+)
+
+
+@lru_cache(maxsize=None)
+def window_indices(rows: int, columns: int) -> npt.NDArray[np.intp]:
+    """
+    Return the flat cell indices of every window on a board.
+
+    Parameters
+    ----------
+    rows : int
+        The number of rows on the board.
+
+    columns : int
+        The number of columns on the board.
+
+    Returns
+    -------
+    npt.NDArray[np.intp]
+        An array of shape ``(windows, CONNECT)`` in the order horizontal,
+        vertical, positive diagonal and negative diagonal.
+
+    """
+    span = range(CONNECT)
+    windows = []
+
+    for r in range(rows):
+        for c in range(columns - CONNECT + 1):
+            windows.append([(r, c + i) for i in span])
+
+    for c in range(columns):
+        for r in range(rows - CONNECT + 1):
+            windows.append([(r + i, c) for i in span])
+
+    for r in range(rows - CONNECT + 1):
+        for c in range(columns - CONNECT + 1):
+            windows.append([(r + i, c + i) for i in span])
+
+    for r in range(rows - CONNECT + 1):
+        for c in range(columns - CONNECT + 1):
+            windows.append([(r + CONNECT - 1 - i, c + i) for i in span])
+
+    table = np.array(
+        [[r * columns + c for r, c in window] for window in windows],
+        dtype=np.intp,
+    ).reshape(-1, CONNECT)
+    table.setflags(write=False)
+
+    return table
+
+
+# Plain nested tuples of WINDOW_SCORES for scalar lookups in the search.
+SCORE_TABLE = tuple(tuple(row) for row in WINDOW_SCORES.tolist())
+
+
+@lru_cache(maxsize=None)
+def cell_windows(rows: int, columns: int) -> tuple:
+    """
+    Return, for every flat cell index, the windows that contain the cell.
+
+    Parameters
+    ----------
+    rows : int
+        The number of rows on the board.
+
+    columns : int
+        The number of columns on the board.
+
+    Returns
+    -------
+    tuple
+        A tuple of ``rows * columns`` tuples of window indices into
+        ``window_indices(rows, columns)``.
+
+    """
+    table = [[] for _ in range(rows * columns)]
+
+    for window, cells in enumerate(window_indices(rows, columns).tolist()):
+        for cell in cells:
+            table[cell].append(window)
+
+    return tuple(tuple(windows) for windows in table)
+
+
+@lru_cache(maxsize=None)
+def zobrist_keys(rows: int, columns: int) -> dict:
+    """
+    Return the Zobrist keys for every cell of a board.
+
+    Parameters
+    ----------
+    rows : int
+        The number of rows on the board.
+
+    columns : int
+        The number of columns on the board.
+
+    Returns
+    -------
+    dict
+        A mapping of token to a tuple of 64-bit keys, one per flat cell
+        index.
+
+    """
+    rng = Random(f"{ZOBRIST_SEED}:{rows}x{columns}")
+
+    return {
+        token: tuple(rng.getrandbits(64) for _ in range(rows * columns))
+        for token in (PLAYER_ONE, PLAYER_TWO)
+    }
+
+
+@lru_cache(maxsize=None)
+def searcher_keys() -> dict:
+    """
+    Return a 64-bit key for each token, mixed into the hash of the positions
+    a player searches.
+
+    Scores are kept from the point of view of the searching player, so the
+    same position searched by each player must not share an entry in a
+    transposition table.
+
+    Returns
+    -------
+    dict
+        A mapping of token to its key.
+
+    """
+    rng = Random(f"{ZOBRIST_SEED}:searcher")
+
+    return {token: rng.getrandbits(64) for token in (PLAYER_ONE, PLAYER_TWO)}
@@ -0,0 +1,306 @@
+import multiprocessing
+from random import Random
+
+from ai.algorithm.alphabeta import AlphaBeta
+from ai.algorithm.iterative import IterativeDeepening
+from ai.algorithm.minimax import Minimax
+from ai.algorithm.negamax import ALPHA, BETA
+from ai.algorithm import parallel
+from ai.algorithm.parallel import RootParallel, can_start_pool, get_pool
+from ai.engine import find_move
+from ai.ordering import MoveOrdering, centre_out
+from ai.positions import generate_positions
+from ai.tests.test_utils import random_board
+from ai.transposition import Bound, TranspositionTable
+from core.constants import PLAYER_ONE, PLAYER_TWO
+from core.dataclasses import Algorithm as cfa
+from django.test import SimpleTestCase
+
+
+class TranspositionTableTests(SimpleTestCase):
+    """
+    Tests for the transposition table.
+
+    """
+
+    def test_probe_and_store(self) -> None:
+        """
+        Test stored entries are found and counted as hits.
+
+        """
+        table = TranspositionTable(8)
+
+        self.assertIsNone(table.probe(3))
+        table.store(3, 2, 10, Bound.EXACT, 4)
+        entry = table.probe(3)
+
+        self.assertEqual((entry.depth, entry.score, entry.move), (2, 10, 4))
+        self.assertEqual((table.hits, table.misses), (1, 1))
+
+    def test_depth_preferred_replacement(self) -> None:
+        """
+        Test a deeper entry is only replaced by a later search.
+
+        """
+        table = TranspositionTable(8)
+        table.store(1, 5, 1, Bound.EXACT, 0)
+        table.store(9, 2, 2, Bound.EXACT, 0)
+
+        self.assertIsNotNone(table.probe(1))
+        self.assertIsNone(table.probe(9))
+
+        table.new_search()
+        table.store(9, 2, 2, Bound.EXACT, 0)
+
+        self.assertIsNotNone(table.probe(9))
+        self.assertEqual(table.stats()["overwrites"], 1)
+
+    def test_shared_between_players(self) -> None:
+        """
+        Test entries stored by one player's searches are not used by the
+        other's.
+
+        """
+        table = TranspositionTable(1 << 16)
+
+        for grid, token in generate_positions(20, seed=7):
+            other = PLAYER_ONE if token == PLAYER_TWO else PLAYER_TWO
+            AlphaBeta(other, grid, 4, table).search(4)
+
+            shared = AlphaBeta(token, grid, 4, table)
+            fresh = AlphaBeta(token, grid, 4)
+
+            self.assertEqual(shared.search(4), fresh.search(4))
+            self.assertEqual(shared.nodes, fresh.nodes)
+
+
+class AlgorithmTests(SimpleTestCase):
+    """
+    Tests the search algorithms agree on the value of a position.
+
+    """
+
+    def test_alpha_beta_matches_minimax(self) -> None:
+        """
+        Test alpha-beta with a transposition table finds the minimax value.
+
+        """
+        rng = Random(11)
+
+        for _ in range(15):
+            grid = random_board(rng, 6, 7).tolist()
+            player = rng.choice([PLAYER_ONE, PLAYER_TWO])
+
+            minimax = Minimax(player, grid, 4, TranspositionTable(1))
+            alpha_beta = AlphaBeta(player, grid, 4)
+
+            if alpha_beta.board.game_over():
+                continue
+
+            _, expected = minimax.search(4)
+            _, score = alpha_beta.search(4)
+
+            self.assertEqual(score, expected)
+
+    def test_search_agrees_on_generated_positions(self) -> None:
+        """
+        Test every configuration of the negamax core finds the same value.
+
+        """
+        for grid, token in generate_positions(8, seed=2):
+            scores = {
+                AlphaBeta(token, grid, 5).search(5)[1],
+                AlphaBeta(token, grid, 5, ordering=False).search(5)[1],
+                Minimax(token, grid, 5, TranspositionTable(1)).search(5)[1],
+            }
+
+            self.assertEqual(len(scores), 1)
+
+    def test_takes_winning_move(self) -> None:
+        """
+        Test both algorithms complete a line of three.
+
+        """
+        grid = [[0] * 7 for _ in range(6)]
+        for column in range(3):
+            grid[5][column] = PLAYER_TWO
+            grid[4][column] = PLAYER_ONE
+
+        for algorithm in [Minimax, AlphaBeta]:
+            search = algorithm(PLAYER_TWO, grid, 3)
+            self.assertEqual(search.get_move(), (5, 3))
+            self.assertGreater(search.table.stats()["stores"], 0)
+
+
+class IterativeDeepeningTests(SimpleTestCase):
+    """
+    Tests for the iterative deepening driver.
+
+    """
+
+    def test_matches_fixed_depth(self) -> None:
+        """
+        Test an unbounded search picks a move as good as a fixed depth one.
+
+        """
+        rng = Random(13)
+
+        for _ in range(10):
+            grid = random_board(rng, 6, 7).tolist()
+            search = AlphaBeta(PLAYER_ONE, grid, 4)
+            if search.board.game_over():
+                continue
+
+            driver = IterativeDeepening(search)
+            row, column = driver.get_move()
+
+            _, best = AlphaBeta(PLAYER_ONE, grid, 4).search(4)
+
+            reply = AlphaBeta(PLAYER_ONE, grid, 4)
+            reply.board.drop_token(column, PLAYER_ONE)
+            _, score = reply._negamax(reply.board, 3, ALPHA, BETA, -1)
+            score = -score
+
+            self.assertEqual(row, search.board.get_open_row(column))
+            self.assertEqual(score, best)
+            self.assertTrue(driver.complete)
+
+    def test_time_limit(self) -> None:
+        """
+        Test a tight budget stops early and leaves the board untouched.
+
+        """
+        grid = [[0] * 7 for _ in range(6)]
+        search = AlphaBeta(PLAYER_TWO, grid, 42)
+        driver = IterativeDeepening(search, 0.05)
+
+        row, column = driver.get_move()
+
+        self.assertEqual(row, 5)
+        self.assertIn(column, range(7))
+        self.assertLess(driver.depth_reached, 42)
+        self.assertFalse(driver.complete)
+        self.assertEqual(search.board.moves, [])
+        self.assertEqual(search.board.raw, grid)
+
+
+class MoveOrderingTests(SimpleTestCase):
+    """
+    Tests for move ordering.
+
+    """
+
+    def test_centre_out(self) -> None:
+        """
+        Test the static order starts in the centre and works outwards.
+
+        """
+        self.assertEqual(centre_out(7), [3, 2, 4, 1, 5, 0, 6])
+        self.assertEqual(centre_out(4), [2, 1, 3, 0])
+
+    def test_order(self) -> None:
+        """
+        Test the best move comes first, then killers, then history.
+
+        """
+        ordering = MoveOrdering(7, 10)
+        ordering.cutoff(6, 2, PLAYER_ONE, 3)
+        ordering.cutoff(0, 4, PLAYER_ONE, 1)
+
+        self.assertEqual(
+            ordering.order(list(range(7)), 2, PLAYER_ONE, 5),
+            [5, 6, 0, 3, 2, 4, 1],
+        )
+
+    def test_pruning_gain(self) -> None:
+        """
+        Test ordering searches fewer nodes for the same result.
+
+        """
+        nodes = {True: 0, False: 0}
+
+        for grid, token in generate_positions(10, seed=1):
+            scores = set()
+
+            for ordering in [True, False]:
+                search = AlphaBeta(token, grid, 5, ordering=ordering)
+                _, score = search.search(5)
+                nodes[ordering] += search.nodes
+                scores.add(score)
+
+            self.assertEqual(len(scores), 1)
+
+        self.assertLess(nodes[True] * 2, nodes[False])
+
+
+class RootParallelTests(SimpleTestCase):
+    """
+    Tests for the root-parallel search.
+
+    """
+
+    def test_matches_serial_search(self) -> None:
+        """
+        Test the parallel search finds the same score as the serial one.
+
+        """
+        pool = get_pool(2)
+
+        for grid, token in generate_positions(6, seed=3):
+            _, expected = AlphaBeta(token, grid, 5).search(5)
+
+            driver = RootParallel(AlphaBeta(token, grid, 5), 2, pool=pool)
+            columns = driver.algorithm.board.get_open_columns()
+            column, score = driver._search(pool, columns, 5)
+
+            self.assertEqual(score, expected)
+            self.assertIn(column, columns)
+
+    def test_takes_winning_move(self) -> None:
+        """
+        Test the parallel search completes a line of four.
+
+        """
+        grid = [[0] * 7 for _ in range(6)]
+        grid[5][:3] = [PLAYER_TWO] * 3
+        grid[4][:3] = [PLAYER_ONE] * 3
+
+        driver = RootParallel(AlphaBeta(PLAYER_TWO, grid, 4), 2)
+
+        self.assertEqual(driver.get_move(), (5, 3))
+        self.assertEqual(driver.algorithm.board.raw, grid)
+
+    def test_daemonic_process(self) -> None:
+        """
+        Test a daemonic process, like a Celery prefork worker, searches
+        serially instead of starting a pool.
+
+        """
+        [(grid, token)] = generate_positions(1, seed=5)
+        expected = find_move(cfa.ALPHA_BETA.value, token, grid, 4, cache=None)
+
+        context = multiprocessing.get_context("fork")
+        queue = context.Queue()
+        process = context.Process(
+            target=search_in_child, args=(queue, grid, token), daemon=True
+        )
+        process.start()
+        result = queue.get(timeout=30)
+        process.join()
+
+        self.assertTrue(can_start_pool())
+        self.assertEqual(result, (False, expected))
+
+
+def search_in_child(queue, grid, token) -> None:
+    # Pools forked from the test process are not the child's to use.
+    parallel._pools.clear()
+
+    try:
+        move = find_move(
+            cfa.ALPHA_BETA.value, token, grid, 4, workers=2, cache=None
+        )
+    except Exception as error:
+        move = repr(error)
+
+    queue.put((can_start_pool(), move))
@@ -0,0 +1,67 @@
+import json
+from io import StringIO
+
+from ai.benchmark import load_algorithms, percentile, run_benchmark
+from core.dataclasses import Algorithm as cfa
+from django.core.management import call_command
+from django.test import SimpleTestCase
+
+
+class BenchmarkTests(SimpleTestCase):
+    """
+    Tests for the AI benchmark harness.
+
+    """
+
+    def test_percentile(self) -> None:
+        """
+        Test the nearest-rank percentile.
+
+        """
+        values = list(range(1, 101))
+
+        self.assertEqual(percentile(values, 50), 50)
+        self.assertEqual(percentile(values, 99), 99)
+        self.assertEqual(percentile([3.0], 95), 3.0)
+        self.assertEqual(percentile([], 50), 0.0)
+
+    def test_load_algorithms(self) -> None:
+        """
+        Test the algorithms and depths are read from the sample fixture.
+
+        """
+        self.assertEqual(
+            load_algorithms(),
+            [(cfa.MINIMAX.value, 2), (cfa.ALPHA_BETA.value, 4)],
+        )
+
+    def test_run_benchmark(self) -> None:
+        """
+        Test every board size and algorithm is benchmarked.
+
+        """
+        result = run_benchmark(
+            sizes=[(6, 7), (5, 6)], depths=[2], count=3, memory=False
+        )
+
+        self.assertEqual(len(result["results"]), 2)
+        for size in result["results"]:
+            self.assertEqual(len(size["searches"]), 2)
+            for search in size["searches"]:
+                self.assertEqual(search["positions"], 3)
+                self.assertGreater(search["nodes"], 0)
+                self.assertIn("p95_ms", search["latency"])
+                self.assertNotIn("peak_memory_bytes", search)
+
+    def test_command_emits_json(self) -> None:
+        """
+        Test the command prints the results as JSON.
+
+        """
+        out = StringIO()
+        call_command("ai_benchmark", positions=2, depths=[2], stdout=out)
+        result = json.loads(out.getvalue())
+
+        search = result["results"][0]["searches"][0]
+        self.assertGreater(search["peak_memory_bytes"], 0)
+        self.assertEqual(result["corpus"], {"positions": 2, "seed": 0})
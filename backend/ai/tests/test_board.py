@@ -0,0 +1,146 @@
+from random import Random
+from typing import List
+
+import numpy as np
+from ai.board import Board
+from core.constants import EMPTY, PLAYER_ONE, PLAYER_TWO
+from django.test import SimpleTestCase
+from game.utils import is_winner
+
+
+def empty_board(rows: int = 6, columns: int = 7) -> List[List[int]]:
+    """
+    Return an empty board.
+
+    """
+    return [[EMPTY for _ in range(columns)] for _ in range(rows)]
+
+
+class BoardTests(SimpleTestCase):
+    """
+    Tests for the bitboard backed Board.
+
+    """
+
+    def test_load_board(self) -> None:
+        """
+        Test loading a board from a list and from a NumPy array.
+
+        """
+        grid = empty_board()
+        grid[5][3] = PLAYER_ONE
+        grid[4][3] = PLAYER_TWO
+        grid[5][0] = PLAYER_TWO
+
+        self.assertEqual(Board(grid, PLAYER_ONE).raw, grid)
+        self.assertEqual(Board(np.array(grid), PLAYER_ONE).raw, grid)
+
+    def test_drop_and_undo(self) -> None:
+        """
+        Test dropping tokens and undoing them restores the board.
+
+        """
+        board = Board(empty_board(), PLAYER_ONE)
+
+        self.assertTrue(board.drop_token(3, PLAYER_ONE))
+        self.assertTrue(board.drop_token(3, PLAYER_TWO))
+        self.assertEqual(board.raw[5][3], PLAYER_ONE)
+        self.assertEqual(board.raw[4][3], PLAYER_TWO)
+        self.assertEqual(board.get_open_row(3), 3)
+
+        self.assertTrue(board.undo_move())
+        self.assertTrue(board.undo_move())
+        self.assertFalse(board.undo_move())
+        self.assertEqual(board.raw, empty_board())
+
+    def test_full_column(self) -> None:
+        """
+        Test a full column is no longer open.
+
+        """
+        board = Board(empty_board(4, 5), PLAYER_ONE)
+
+        for i in range(4):
+            board.drop_token(2, PLAYER_ONE if i % 2 else PLAYER_TWO)
+
+        self.assertFalse(board.drop_token(2, PLAYER_ONE))
+        self.assertFalse(board.drop_token(5, PLAYER_ONE))
+        self.assertEqual(board.get_open_row(2), -1)
+        self.assertEqual(board.get_open_columns(), [0, 1, 3, 4])
+
+    def test_winner_from_loaded_board(self) -> None:
+        """
+        Test the winner is found on a loaded board with no moves made.
+
+        """
+        grid = empty_board()
+        for column in range(4):
+            grid[5][column] = PLAYER_TWO
+
+        board = Board(grid, PLAYER_ONE)
+
+        self.assertEqual(board.winner(), PLAYER_TWO)
+        self.assertTrue(board.game_over())
+
+    def test_is_full(self) -> None:
+        """
+        Test the filled cell count tracks drops and undos.
+
+        """
+        grid = [[PLAYER_ONE, PLAYER_TWO] * 2 for _ in range(4)]
+        grid[0][0] = EMPTY
+        board = Board(grid, PLAYER_ONE)
+
+        self.assertFalse(board.is_full())
+        board.drop_token(0, PLAYER_TWO)
+        self.assertTrue(board.is_full())
+        board.undo_move()
+        self.assertFalse(board.is_full())
+
+    def test_no_win_across_columns(self) -> None:
+        """
+        Test a vertical run split over two columns is not a win.
+
+        """
+        board = Board(empty_board(), PLAYER_ONE)
+
+        for _ in range(2):
+            board.drop_token(0, PLAYER_TWO)
+        for _ in range(4):
+            board.drop_token(0, PLAYER_ONE)
+        for _ in range(2):
+            board.drop_token(1, PLAYER_ONE)
+
+        self.assertTrue(board.is_winner(PLAYER_ONE))
+        board.undo_move()
+        board.undo_move()
+        board.undo_move()
+        self.assertFalse(board.is_winner(PLAYER_ONE))
+
+    def test_matches_reference_winner(self) -> None:
+        """
+        Test random games on several board sizes agree with the move
+        based winner check used by the game.
+
+        """
+        rng = Random(4)
+
+        for rows, columns in [(6, 7), (4, 4), (5, 9), (12, 14)]:
+            for _ in range(25):
+                board = Board(empty_board(rows, columns), PLAYER_ONE)
+                token = PLAYER_ONE
+
+                while open_columns := board.get_open_columns():
+                    column = rng.choice(open_columns)
+                    row = board.get_open_row(column)
+                    board.drop_token(column, token)
+
+                    won = is_winner(token, board.raw, column, row)
+                    self.assertEqual(board.is_winner(token), won)
+                    self.assertEqual(board.winner(), token if won else EMPTY)
+                    if won:
+                        break
+
+                    token = PLAYER_TWO if token == PLAYER_ONE else PLAYER_ONE
+
+                self.assertTrue(board.game_over())
@@ -0,0 +1,135 @@
+from io import StringIO
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from unittest.mock import patch
+
+from ai.board import Board
+from ai.book import OpeningBook, canonical_key, mirror_key, position_key
+from ai.engine import find_move
+from core.constants import EMPTY, PLAYER_ONE, PLAYER_TWO
+from core.dataclasses import Algorithm as cfa
+from django.core.management import call_command
+from django.test import SimpleTestCase, override_settings
+
+
+def empty_board(rows: int = 6, columns: int = 7) -> Board:
+    return Board([[EMPTY] * columns for _ in range(rows)], PLAYER_ONE)
+
+
+def play(board: Board, columns) -> Board:
+    token = PLAYER_ONE
+    for column in columns:
+        board.drop_token(column, token)
+        token = PLAYER_TWO if token == PLAYER_ONE else PLAYER_ONE
+
+    return board
+
+
+class OpeningBookTests(SimpleTestCase):
+    """
+    Tests for the opening book.
+
+    """
+
+    def test_position_key_is_unique(self) -> None:
+        """
+        Test positions with the same tokens in different places differ.
+
+        """
+        keys = {
+            position_key(play(empty_board(), moves))
+            for moves in ([], [0], [1], [0, 1], [1, 0], [0, 0])
+        }
+
+        self.assertEqual(len(keys), 6)
+
+    def test_mirror_key(self) -> None:
+        """
+        Test the mirrored key is the key of the reflected position.
+
+        """
+        board = play(empty_board(), [0, 1, 1, 5])
+        reflected = play(empty_board(), [6, 5, 5, 1])
+
+        self.assertEqual(
+            mirror_key(position_key(board), 6, 7), position_key(reflected)
+        )
+        self.assertEqual(canonical_key(board)[0], canonical_key(reflected)[0])
+
+    def test_lookup_mirrors_column(self) -> None:
+        """
+        Test a move stored for a position is mirrored for its reflection.
+
+        """
+        book = OpeningBook(6, 7)
+        board = play(empty_board(), [0])
+        book.add(board, 1)
+
+        self.assertEqual(book.lookup(board), 1)
+        self.assertEqual(book.lookup(play(empty_board(), [6])), 5)
+        self.assertIsNone(book.lookup(play(empty_board(), [3])))
+        self.assertIsNone(book.lookup(empty_board(5, 6)))
+
+    def test_save_and_load(self) -> None:
+        """
+        Test a saved book loads back with the same moves.
+
+        """
+        book = OpeningBook(6, 7)
+        book.add(empty_board(), 3)
+        book.add(play(empty_board(), [2]), 3)
+
+        with TemporaryDirectory() as directory:
+            path = Path(directory) / "book.bin"
+            book.save(path)
+            loaded = OpeningBook.load(path)
+
+        self.assertEqual((loaded.rows, loaded.columns), (6, 7))
+        self.assertEqual(loaded.moves, book.moves)
+
+    def test_board_too_large(self) -> None:
+        """
+        Test boards that do not fit a 64 bit key are rejected.
+
+        """
+        with self.assertRaises(ValueError):
+            OpeningBook(9, 7)
+
+    @override_settings(AI_OPENING_BOOK_MIN_DEPTH=3)
+    def test_min_depth(self) -> None:
+        """
+        Test only searches at least the minimum depth play book moves.
+
+        """
+        book = OpeningBook(6, 7)
+        book.add(empty_board(), 0)
+        board = empty_board().raw
+        name = cfa.MINIMAX.value
+
+        with patch("ai.engine.get_opening_book", return_value=book):
+            self.assertEqual(
+                find_move(name, PLAYER_ONE, board, 3, cache=None), (5, 0)
+            )
+            self.assertNotEqual(
+                find_move(name, PLAYER_ONE, board, 2, cache=None), (5, 0)
+            )
+
+    def test_build_opening_book(self) -> None:
+        """
+        Test the command stores a move for every opening position.
+
+        """
+        with TemporaryDirectory() as directory:
+            path = Path(directory) / "book.bin"
+            call_command(
+                "build_opening_book",
+                plies=2,
+                depth=2,
+                output=path,
+                stdout=StringIO(),
+            )
+            book = OpeningBook.load(path)
+
+        # The empty board, plus 7 first moves of which 3 are mirrors.
+        self.assertEqual(len(book), 5)
+        self.assertIn(book.lookup(empty_board()), range(7))
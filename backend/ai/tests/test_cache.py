@@ -0,0 +1,138 @@
+from ai.board import Board
+from ai.cache import PositionCache
+from ai.engine import find_move
+from core.constants import EMPTY, PLAYER_ONE, PLAYER_TWO
+from core.dataclasses import Algorithm as cfa
+from core.redis import position_cache_client
+from django.test import SimpleTestCase
+
+
+def board_after(columns, rows: int = 6, width: int = 7) -> Board:
+    board = Board([[EMPTY] * width for _ in range(rows)], PLAYER_ONE)
+    token = PLAYER_ONE
+    for column in columns:
+        board.drop_token(column, token)
+        token = PLAYER_TWO if token == PLAYER_ONE else PLAYER_ONE
+
+    return board
+
+
+class PositionCacheTests(SimpleTestCase):
+    """
+    Tests for the shared position cache.
+
+    """
+
+    def setUp(self) -> None:
+        self.cache = PositionCache(position_cache_client, ttl=60, front_size=2)
+        self.cache.clear()
+
+    def tearDown(self) -> None:
+        self.cache.clear()
+
+    def test_get_and_set(self) -> None:
+        """
+        Test cached moves are found for the same search only.
+
+        """
+        board = board_after([3, 3])
+        name = cfa.ALPHA_BETA.value
+
+        self.assertIsNone(self.cache.get(board, PLAYER_ONE, name, 4))
+        self.cache.set(board, PLAYER_ONE, name, 4, 2)
+
+        self.assertEqual(self.cache.get(board, PLAYER_ONE, name, 4), 2)
+        self.assertIsNone(self.cache.get(board, PLAYER_TWO, name, 4))
+        self.assertIsNone(self.cache.get(board, PLAYER_ONE, name, 5))
+        self.assertIsNone(
+            self.cache.get(board, PLAYER_ONE, cfa.MINIMAX.value, 4)
+        )
+
+    def test_mirrored_position(self) -> None:
+        """
+        Test a position shares its entry with its mirror image.
+
+        """
+        name = cfa.ALPHA_BETA.value
+        self.cache.set(board_after([0, 1]), PLAYER_ONE, name, 4, 2)
+
+        self.assertEqual(
+            self.cache.get(board_after([6, 5]), PLAYER_ONE, name, 4), 4
+        )
+
+    def test_shared_between_processes(self) -> None:
+        """
+        Test a move cached by one process is found by another through Redis.
+
+        """
+        board = board_after([3])
+        name = cfa.MINIMAX.value
+        self.cache.set(board, PLAYER_TWO, name, 3, 3)
+
+        other = PositionCache(position_cache_client, ttl=60, front_size=2)
+        self.assertEqual(other.get(board, PLAYER_TWO, name, 3), 3)
+        self.assertEqual(other.get(board, PLAYER_TWO, name, 3), 3)
+        self.assertEqual(other.counts["hits"], 1)
+        self.assertEqual(other.counts["front_hits"], 1)
+        key, _ = other.key(board, PLAYER_TWO, name, 3)
+        self.assertGreater(position_cache_client.ttl(key), 0)
+
+    def test_front_cache_evicts_least_recently_used(self) -> None:
+        """
+        Test the front cache keeps only its most recently used entries.
+
+        """
+        name = cfa.MINIMAX.value
+        boards = [board_after([column]) for column in range(3)]
+        for board in boards:
+            self.cache.set(board, PLAYER_TWO, name, 3, 3)
+
+        self.assertEqual(len(self.cache.front), 2)
+        self.assertNotIn(
+            self.cache.key(boards[0], PLAYER_TWO, name, 3)[0], self.cache.front
+        )
+
+    def test_stats(self) -> None:
+        """
+        Test the shared counters report the hit rate.
+
+        """
+        board = board_after([])
+        name = cfa.MINIMAX.value
+        self.cache.get(board, PLAYER_ONE, name, 2)
+        self.cache.set(board, PLAYER_ONE, name, 2, 3)
+        self.cache.get(board, PLAYER_ONE, name, 2)
+
+        stats = self.cache.stats()
+
+        self.assertEqual(stats["misses"], 1)
+        self.assertEqual(stats["front_hits"], 1)
+        self.assertEqual(stats["hit_rate"], 0.5)
+        self.assertEqual(self.cache.hit_rate, 0.5)
+
+    def test_find_move_uses_cache(self) -> None:
+        """
+        Test the engine answers repeated searches from the cache.
+
+        """
+        board = board_after([3, 3, 2]).raw
+        name = cfa.ALPHA_BETA.value
+
+        move = find_move(name, PLAYER_TWO, board, 4, cache=self.cache)
+        self.assertEqual(
+            find_move(name, PLAYER_TWO, board, 4, cache=self.cache), move
+        )
+        self.assertEqual(self.cache.counts["misses"], 1)
+        self.assertEqual(self.cache.counts["front_hits"], 1)
+
+    def test_find_move_skips_incomplete_search(self) -> None:
+        """
+        Test a search cut short by its time limit is not cached.
+
+        """
+        board = board_after([])
+        name = cfa.ALPHA_BETA.value
+
+        find_move(name, PLAYER_ONE, board.raw, 42, 0.05, cache=self.cache)
+
+        self.assertIsNone(self.cache.get(board, PLAYER_ONE, name, 42))
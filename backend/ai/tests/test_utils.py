@@ -0,0 +1,135 @@
+from random import Random
+from typing import List
+
+import numpy as np
+import numpy.typing as npt
+from ai.board import Board
+from ai.utils import get_score, get_scores
+from core.constants import EMPTY, PLAYER_ONE, PLAYER_TWO
+from django.test import SimpleTestCase
+
+
+def reference_score(board: npt.NDArray[np.int32], player: int) -> int:
+    """
+    The original list based heuristic, kept as the parity reference.
+
+    """
+    opponent = PLAYER_ONE if player == PLAYER_TWO else PLAYER_TWO
+
+    def evaluate(window: List[int]) -> int:
+        score = 0
+        if window.count(player) == 4:
+            score += 100
+        elif window.count(player) == 3 and window.count(EMPTY) == 1:
+            score += 5
+        elif window.count(player) == 2 and window.count(EMPTY) == 2:
+            score += 2
+        if window.count(opponent) == 3 and window.count(EMPTY) == 1:
+            score -= 4
+        return score
+
+    rows, columns = board.shape
+    cells = board.tolist()
+    score = [row[columns // 2] for row in cells].count(player) * 3
+
+    for r in range(rows):
+        for c in range(columns - 3):
+            score += evaluate(cells[r][c : c + 4])
+
+    for c in range(columns):
+        column = [row[c] for row in cells]
+        for r in range(rows - 3):
+            score += evaluate(column[r : r + 4])
+
+    for r in range(rows - 3):
+        for c in range(columns - 3):
+            score += evaluate([cells[r + i][c + i] for i in range(4)])
+            score += evaluate([cells[r + 3 - i][c + i] for i in range(4)])
+
+    return score
+
+
+def random_board(
+    rng: Random, rows: int, columns: int
+) -> npt.NDArray[np.int32]:
+    """
+    Return a board reached by playing a random number of random moves.
+
+    """
+    board = np.zeros((rows, columns), dtype=np.int32)
+    heights = [rows] * columns
+    token = PLAYER_ONE
+
+    for _ in range(rng.randrange(rows * columns + 1)):
+        column = rng.choice([c for c in range(columns) if heights[c]])
+        heights[column] -= 1
+        board[heights[column], column] = token
+        token = PLAYER_TWO if token == PLAYER_ONE else PLAYER_ONE
+
+    return board
+
+
+class ScoreParityTests(SimpleTestCase):
+    """
+    Tests the vectorised heuristic against the original implementation.
+
+    """
+
+    def test_get_score_parity(self) -> None:
+        """
+        Test scores match the reference for random boards and sizes.
+
+        """
+        rng = Random(3)
+
+        for rows, columns in [(6, 7), (4, 4), (5, 9), (12, 14)]:
+            for _ in range(50):
+                board = random_board(rng, rows, columns)
+                for player in [PLAYER_ONE, PLAYER_TWO]:
+                    self.assertEqual(
+                        get_score(board, player),
+                        reference_score(board, player),
+                    )
+
+    def test_get_scores_batch(self) -> None:
+        """
+        Test scoring a batch gives the same scores as one at a time.
+
+        """
+        rng = Random(5)
+        boards = np.stack([random_board(rng, 6, 7) for _ in range(32)])
+
+        scores = get_scores(boards, PLAYER_TWO)
+
+        self.assertEqual(
+            scores.tolist(),
+            [reference_score(board, PLAYER_TWO) for board in boards],
+        )
+
+    def test_incremental_score_parity(self) -> None:
+        """
+        Test the running score kept by the board matches the reference
+        after every drop and undo.
+
+        """
+        rng = Random(7)
+
+        for rows, columns in [(6, 7), (5, 9), (12, 14)]:
+            board = Board(random_board(rng, rows, columns), PLAYER_ONE)
+            token = PLAYER_ONE
+
+            for _ in range(rows * columns):
+                if not (open_columns := board.get_open_columns()):
+                    break
+
+                if board.moves and rng.random() < 0.3:
+                    board.undo_move()
+                else:
+                    board.drop_token(rng.choice(open_columns), token)
+                    token = PLAYER_TWO if token == PLAYER_ONE else PLAYER_ONE
+
+                grid = np.array(board.raw, dtype=np.int32)
+                for player in [PLAYER_ONE, PLAYER_TWO]:
+                    self.assertEqual(
+                        board.score(player), reference_score(grid, player)
+                    )
@@ -0,0 +1,97 @@
+from enum import IntEnum
+from typing import Dict, List, NamedTuple, Optional
+
+
+class Bound(IntEnum):
+    """
+    How a stored score relates to the true value of the position.
+
+    """
+
+    EXACT = 0
+    LOWER = 1
+    UPPER = 2
+
+
+class Entry(NamedTuple):
+    key: int
+    depth: int
+    score: float
+    bound: Bound
+    move: int
+    generation: int
+
+
+class TranspositionTable:
+    """
+    Fixed size transposition table indexed by the Zobrist hash of a board.
+
+    Each hash maps to a single slot. A slot is replaced when it holds the
+    same position, an entry from an earlier search, or an entry searched to
+    the same depth or shallower (depth-preferred replacement).
+
+    """
+
+    def __init__(self, size: int) -> None:
+        self.size = max(1, size)
+        self.entries: List[Optional[Entry]] = [None] * self.size
+        self.generation = 0
+
+        self.hits = 0
+        self.misses = 0
+        self.stores = 0
+        self.overwrites = 0
+
+    def new_search(self) -> None:
+        self.generation += 1
+
+    def probe(self, key: int) -> Optional[Entry]:
+        entry = self.entries[key % self.size]
+
+        if entry is not None and entry.key == key:
+            self.hits += 1
+            return entry
+
+        self.misses += 1
+        return None
+
+    def store(
+        self, key: int, depth: int, score: float, bound: Bound, move: int
+    ) -> None:
+        index = key % self.size
+        current = self.entries[index]
+
+        if current is not None and current.key != key:
+            if (
+                current.generation == self.generation
+                and current.depth > depth
+            ):
+                return
+
+            self.overwrites += 1
+
+        self.entries[index] = Entry(
+            key, depth, score, bound, move, self.generation
+        )
+        self.stores += 1
+
+    def clear(self) -> None:
+        self.entries = [None] * self.size
+        self.hits = self.misses = self.stores = self.overwrites = 0
+
+    @property
+    def hit_rate(self) -> float:
+        probes = self.hits + self.misses
+
+        return self.hits / probes if probes else 0.0
+
+    def stats(self) -> Dict[str, float]:
+        return {
+            "size": self.size,
+            "used": self.size - self.entries.count(None),
+            "hits": self.hits,
+            "misses": self.misses,
+            "stores": self.stores,
+            "overwrites": self.overwrites,
+            "hit_rate": self.hit_rate,
+        }
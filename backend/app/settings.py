@@ -13,7 +13,7 @@ https://docs.djangoproject.com/en/5.0/ref/settings/
 from datetime import timedelta
 from pathlib import Path
 
-from decouple import config
+from decouple import Csv, config
 
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
 BASE_DIR = Path(__file__).resolve().parent.parent
@@ -99,6 +99,120 @@ REDIS_HOST = config("REDIS_HOST", default="redis")
 REDIS_PORT = config("REDIS_PORT", default=6379, cast=int)
 REDIS_DB = config("REDIS_DB", default=0, cast=int)
 
+# Number of slots in the transposition table each AI search allocates.
+AI_TRANSPOSITION_TABLE_SIZE = config(
+    "AI_TRANSPOSITION_TABLE_SIZE", default=2**18, cast=int
+)
+
+# Binary opening book written by the build_opening_book command.
+AI_OPENING_BOOK = config(
+    "AI_OPENING_BOOK", default=str(BASE_DIR / "ai" / "data" / "opening_book.bin")
+)
+
+# Shallowest search that plays the opening book's moves. The book is searched
+# deeply, so weaker searches play their own moves instead.
+AI_OPENING_BOOK_MIN_DEPTH = config(
+    "AI_OPENING_BOOK_MIN_DEPTH", default=10, cast=int
+)
+
+# Redis instance of the shared position cache, kept apart from the one used
+# by Celery, Channels and the game state so it can evict under memory
+# pressure.
+AI_POSITION_CACHE_REDIS_HOST = config(
+    "AI_POSITION_CACHE_REDIS_HOST", default="redis-cache"
+)
+AI_POSITION_CACHE_REDIS_PORT = config(
+    "AI_POSITION_CACHE_REDIS_PORT", default=6379, cast=int
+)
+AI_POSITION_CACHE_REDIS_DB = config(
+    "AI_POSITION_CACHE_REDIS_DB", default=0, cast=int
+)
+
+# Seconds an AI move stays in the shared position cache.
+AI_POSITION_CACHE_TTL = config(
+    "AI_POSITION_CACHE_TTL", default=60 * 60 * 24, cast=int
+)
+
+# Number of AI moves each process keeps in front of the shared cache.
+AI_POSITION_CACHE_FRONT_SIZE = config(
+    "AI_POSITION_CACHE_FRONT_SIZE", default=4096, cast=int
+)
+
+# Seconds AI turns are collected for before being computed together in one
+# task. Each turn gets its own task when this is 0.
+AI_MOVE_BATCH_WINDOW = config("AI_MOVE_BATCH_WINDOW", default=0.0, cast=float)
+
+# Largest number of AI turns computed by one batch task.
+AI_MOVE_BATCH_SIZE = config("AI_MOVE_BATCH_SIZE", default=100, cast=int)
+
+# Seconds a batch task may spend searching before the turns it has not
+# reached are queued again.
+AI_MOVE_BATCH_TIME_LIMIT = config(
+    "AI_MOVE_BATCH_TIME_LIMIT", default=10.0, cast=float
+)
+
+# Whether the ASGI server plays AI replies to websocket moves itself, in a
+# pool of AI_EXECUTOR_WORKERS processes, for searches no deeper than
+# AI_EXECUTOR_MAX_DEPTH. Other AI moves are computed by Celery.
+AI_EXECUTOR_ENABLED = config("AI_EXECUTOR_ENABLED", default=False, cast=bool)
+AI_EXECUTOR_WORKERS = config("AI_EXECUTOR_WORKERS", default=2, cast=int)
+AI_EXECUTOR_MAX_DEPTH = config("AI_EXECUTOR_MAX_DEPTH", default=4, cast=int)
+
+# Whether the AI searches its replies to each of the human's moves into the
+# position cache while the human is thinking.
+AI_PONDERING_ENABLED = config("AI_PONDERING_ENABLED", default=False, cast=bool)
+
+# Seconds one pondering task may search for in all, shared among the replies,
+# so it never holds a Celery worker much longer than a single AI move.
+AI_PONDER_TIME_LIMIT = config("AI_PONDER_TIME_LIMIT", default=5.0, cast=float)
+
+# Seconds each process keeps its copy of the statuses before reloading them.
+# Edits in the same process are picked up at once through a signal.
+STATUS_REGISTRY_TTL = config("STATUS_REGISTRY_TTL", default=300, cast=int)
+
+# Seconds the hot state of a game stays in Redis after its last move.
+GAME_STATE_TTL = config("GAME_STATE_TTL", default=60 * 60, cast=int)
+
+# Seconds before the ratings of human players kept in Redis are rebuilt from
+# the database, to correct any update that was missed.
+HUMAN_RATINGS_TTL = config(
+    "HUMAN_RATINGS_TTL", default=24 * 60 * 60, cast=int
+)
+
+# A queued player is matched with the nearest rated player within
+# MATCHMAKING_ELO_WINDOW points of their rating. The window widens by
+# MATCHMAKING_ELO_WINDOW_GROWTH points for every second they have waited, up
+# to MATCHMAKING_MAX_ELO_WINDOW points, and MATCHMAKING_CANDIDATES players
+# are considered on each side of their rating.
+MATCHMAKING_ELO_WINDOW = config("MATCHMAKING_ELO_WINDOW", default=50, cast=int)
+MATCHMAKING_ELO_WINDOW_GROWTH = config(
+    "MATCHMAKING_ELO_WINDOW_GROWTH", default=10.0, cast=float
+)
+MATCHMAKING_MAX_ELO_WINDOW = config(
+    "MATCHMAKING_MAX_ELO_WINDOW", default=400, cast=int
+)
+MATCHMAKING_CANDIDATES = config("MATCHMAKING_CANDIDATES", default=10, cast=int)
+
+# Largest number of matched pairs whose games are created together.
+MATCHMAKING_BATCH_SIZE = config(
+    "MATCHMAKING_BATCH_SIZE", default=500, cast=int
+)
+
+# Seconds between sweeps of the whole matchmaking queue. Players are also
+# matched as soon as they join.
+MATCHMAKING_SWEEP_INTERVAL = config(
+    "MATCHMAKING_SWEEP_INTERVAL", default=10, cast=int
+)
+
+# Players are queued in partitions by board size, Elo band and region, and
+# only matched within their partition. Bands are MATCHMAKING_ELO_BAND points
+# wide, or a single band when it is 0, and players who do not choose a
+# region are queued in the first of MATCHMAKING_REGIONS.
+MATCHMAKING_ELO_BAND = config("MATCHMAKING_ELO_BAND", default=0, cast=int)
+MATCHMAKING_REGIONS = config(
+    "MATCHMAKING_REGIONS", default="global", cast=Csv()
+)
+
 # WSGI_APPLICATION = "app.wsgi.application"
 ASGI_APPLICATION = "app.asgi.application"
 
@@ -235,3 +349,10 @@ CELERY_TIMEZONE = "UTC"
 
 CELERY_BROKER_CONNECTION_RETRY_ON_STARTUP = True
 
+CELERY_BEAT_SCHEDULE = {
+    "process-matchmaking": {
+        "task": "game.tasks.process_matchmaking",
+        "schedule": timedelta(seconds=MATCHMAKING_SWEEP_INTERVAL),
+    },
+}
+
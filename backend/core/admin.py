@@ -101,6 +101,8 @@ class AlgorithmAdmin(admin.ModelAdmin):
         "code_name",
         "description",
         "depth",
+        "time_limit",
+        "workers",
     ]
 
 
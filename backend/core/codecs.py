@@ -0,0 +1,71 @@
+from typing import List, Sequence
+
+# Number of bits each cell of a board is packed into.
+CELL_BITS = 2
+CELLS_PER_BYTE = 8 // CELL_BITS
+CELL_MASK = (1 << CELL_BITS) - 1
+
+
+def pack_board(board: Sequence[Sequence[int]]) -> bytes:
+    """
+    Pack a board into two bits per cell.
+
+    Cells are packed row by row from the top left, four to a byte with the
+    first cell in the lowest bits. A 6x7 board takes 11 bytes.
+
+    Parameters
+    ----------
+    board : Sequence[Sequence[int]]
+        The board, with a token of 0, 1 or 2 in each cell.
+
+    Returns
+    -------
+    bytes
+        The packed board.
+
+    """
+    cells = [cell for row in board for cell in row]
+    packed = bytearray((len(cells) + CELLS_PER_BYTE - 1) // CELLS_PER_BYTE)
+
+    for index, cell in enumerate(cells):
+        if cell:
+            byte, slot = divmod(index, CELLS_PER_BYTE)
+            packed[byte] |= cell << (slot * CELL_BITS)
+
+    return bytes(packed)
+
+
+def unpack_board(data: bytes, rows: int, columns: int) -> List[List[int]]:
+    """
+    Unpack a board packed by ``pack_board``.
+
+    Cells past the end of the data are empty, so the packed default board
+    unpacks to an empty board of any size.
+
+    Parameters
+    ----------
+    data : bytes
+        The packed board.
+
+    rows : int
+        The number of rows on the board.
+
+    columns : int
+        The number of columns on the board.
+
+    Returns
+    -------
+    List[List[int]]
+        The board, as a list of rows.
+
+    """
+    data = bytes(data).ljust(
+        (rows * columns + CELLS_PER_BYTE - 1) // CELLS_PER_BYTE, b"\0"
+    )
+    cells = [
+        (data[index // CELLS_PER_BYTE] >> (index % CELLS_PER_BYTE * CELL_BITS))
+        & CELL_MASK
+        for index in range(rows * columns)
+    ]
+
+    return [cells[row * columns : (row + 1) * columns] for row in range(rows)]
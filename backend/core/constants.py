@@ -36,12 +36,40 @@ BACKENDS = [
     filters.OrderingFilter,
 ]
 
+# Prefix of the Redis keys of each matchmaking partition: a sorted set of
+# the rating of each queued player, one of the time each joined, a hash of
+# statistics and a lock.
 MATCHMAKING_QUEUE = "matchmaking_queue"
+# Redis set of the names of partitions that may have players queued.
+MATCHMAKING_PARTITIONS = "matchmaking_partitions"
+# Redis hash of the partition each queued player is in.
+MATCHMAKING_PLAYERS = "matchmaking_players"
+
+# Redis set of games waiting for a batched AI move, and the lock held while
+# a batch task is scheduled.
+AI_MOVE_BATCH = "ai_move_batch"
+AI_MOVE_BATCH_LOCK = "ai_move_batch:lock"
+
+# Prefix of the Redis hashes holding the hot state of games.
+GAME_STATE = "game_state"
+
+# Redis sorted set of the rating of every human player.
+HUMAN_RATINGS = "human_ratings"
 
 DIFFICULTY_LEVELS: Dict[str, int] = {
     "min": 1,
     "max": 5,
 }
 
+# Seconds an AI may spend searching for a move at each difficulty level,
+# used when the algorithm does not set its own time limit.
+DIFFICULTY_TIME_LIMITS: Dict[int, float] = {
+    1: 0.5,
+    2: 1.0,
+    3: 2.0,
+    4: 3.0,
+    5: 5.0,
+}
+
 # Constant that determines how much the ELO rating affects the depth
 K_DEPTH = 2
@@ -0,0 +1,18 @@
+# Generated by Django 5.0.7 on 2026-10-18 06:48
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0027_alter_gameinvitation_receiver'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='algorithm',
+            name='time_limit',
+            field=models.FloatField(blank=True, null=True),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.0.7 on 2026-10-18 06:59
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0028_algorithm_time_limit'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='algorithm',
+            name='workers',
+            field=models.PositiveSmallIntegerField(default=1),
+        ),
+    ]
@@ -0,0 +1,51 @@
+# Generated by Django 5.0.7 on 2026-10-18 07:10
+
+import core.models
+from core.codecs import pack_board, unpack_board
+from django.db import migrations, models
+
+BATCH_SIZE = 500
+
+
+def pack_boards(apps, schema_editor):
+    Game = apps.get_model("core", "Game")
+    games = []
+
+    for game in Game.objects.only("game_id", "board").iterator():
+        game.board_state = pack_board(game.board)
+        games.append(game)
+
+    Game.objects.bulk_update(games, ["board_state"], batch_size=BATCH_SIZE)
+
+
+def unpack_boards(apps, schema_editor):
+    Game = apps.get_model("core", "Game")
+    games = []
+
+    for game in Game.objects.only(
+        "game_id", "rows", "columns", "board_state"
+    ).iterator():
+        game.board = unpack_board(game.board_state, game.rows, game.columns)
+        games.append(game)
+
+    Game.objects.bulk_update(games, ["board"], batch_size=BATCH_SIZE)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0029_algorithm_workers'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='game',
+            name='board_state',
+            field=models.BinaryField(default=core.models.default_board_state),
+        ),
+        migrations.RunPython(pack_boards, unpack_boards),
+        migrations.RemoveField(
+            model_name='game',
+            name='board',
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 5.0.7 on 2026-10-18 07:51
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0030_game_board_state'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='player',
+            index=models.Index(fields=['is_human', 'elo'], name='player_human_elo_idx'),
+        ),
+    ]
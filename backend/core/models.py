@@ -14,7 +14,9 @@ Copyright ©2024 feaad
 """
 
 import uuid
+from typing import List
 
+from core.codecs import pack_board, unpack_board
 from core.constants import (
     DEFAULT_COLUMNS,
     DEFAULT_ROWS,
@@ -53,6 +55,10 @@ def default_board():
     ]
 
 
+def default_board_state():
+    return pack_board(default_board())
+
+
 class UserManager(BaseUserManager):
     """
     Manager users in the system.
@@ -226,6 +232,8 @@ class Algorithm(models.Model):
     code_name = models.CharField(max_length=100, unique=True)
     description = models.TextField()
     depth = models.IntegerField(null=True, blank=True)
+    time_limit = models.FloatField(null=True, blank=True)
+    workers = models.PositiveSmallIntegerField(default=1)
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
@@ -280,6 +288,18 @@ class Player(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    class Meta:
+        """
+        Index the ratings of human players, to read their range.
+
+        """
+
+        indexes = [
+            models.Index(
+                fields=["is_human", "elo"], name="player_human_elo_idx"
+            )
+        ]
+
     def __str__(self) -> str:
         return (
             self.user.username
@@ -357,7 +377,7 @@ class Game(models.Model):
         blank=True,
     )
     depth = models.IntegerField(null=True, blank=True)
-    board = models.JSONField(default=default_board)
+    board_state = models.BinaryField(default=default_board_state)
     status = models.ForeignKey(
         Status,
         on_delete=models.RESTRICT,
@@ -401,6 +421,37 @@ class Game(models.Model):
     def __str__(self) -> str:
         return f"{self.game_id}"
 
+    @property
+    def board(self) -> List[List[int]]:
+        """
+        The board as a list of rows, unpacked from ``board_state``.
+
+        The list is cached until ``board_state`` changes, and changes made
+        to it in place are packed back into ``board_state`` on save.
+
+        """
+        if self.__dict__.get("_board_source") is not self.board_state:
+            self._board = unpack_board(
+                self.board_state, self.rows, self.columns
+            )
+            self._board_source = self.board_state
+
+        return self._board
+
+    @board.setter
+    def board(self, value: List[List[int]]) -> None:
+        self.board_state = pack_board(value)
+        self._board = value
+        self._board_source = self.board_state
+
+    def save(self, *args, **kwargs):
+        # Repack boards changed in place, and the default board of a game
+        # that is not the default size.
+        cached = self.__dict__.get("_board_source") is self.board_state
+        if cached or len(self.board_state) != len(pack_board(self.board)):
+            self.board = self.board
+        super().save(*args, **kwargs)
+
 
 class MatchMakingQueue(models.Model):
     """
@@ -0,0 +1,174 @@
+from math import ceil
+from typing import Iterable, List, Optional, Tuple
+from uuid import UUID
+
+import redis
+from django.conf import settings
+from django.db.models import Max, Min
+
+from core.constants import HUMAN_RATINGS
+from core.models import Player
+from core.redis import redis_client
+
+BATCH_SIZE = 1000
+
+# Updates ratings only while the set is loaded, so a partial set is never
+# mistaken for the ratings of every human player.
+UPDATE_RATINGS = """
+if redis.call("EXISTS", KEYS[1]) == 0 then
+    return 0
+end
+return redis.call("ZADD", KEYS[1], unpack(ARGV))
+"""
+
+update_ratings = redis_client.register_script(UPDATE_RATINGS)
+
+
+class HumanRatings:
+    """
+    The ratings of human players, kept in a Redis sorted set.
+
+    The set is loaded from the database the first time it is read, and
+    rebuilt every ``HUMAN_RATINGS_TTL`` seconds. In between it is updated as
+    players are saved and as games change their ratings, so the lowest and
+    highest ratings and any percentile are read without querying the
+    players. Errors from Redis are ignored: updates are dropped, and the
+    range is read from the database instead.
+
+    """
+
+    def __init__(self, key: str = HUMAN_RATINGS) -> None:
+        self.key = key
+
+    def load(self) -> List[Tuple[UUID, int]]:
+        ratings = list(
+            Player.objects.filter(is_human=True).values_list(
+                "player_id", "elo"
+            )
+        )
+
+        pipe = redis_client.pipeline()
+        pipe.delete(self.key)
+        for start in range(0, len(ratings), BATCH_SIZE):
+            pipe.zadd(
+                self.key,
+                {
+                    str(player_id): elo
+                    for player_id, elo in ratings[start : start + BATCH_SIZE]
+                },
+            )
+        pipe.expire(self.key, settings.HUMAN_RATINGS_TTL)
+
+        try:
+            pipe.execute()
+        except redis.RedisError:
+            pass
+
+        return ratings
+
+    def invalidate(self) -> None:
+        try:
+            redis_client.delete(self.key)
+        except redis.RedisError:
+            pass
+
+    def update(self, players: Iterable[Player]) -> None:
+        """
+        Record the current ratings of some players.
+
+        Players who are not human are left out.
+
+        """
+        args = []
+        for player in players:
+            if player.is_human:
+                args.extend((player.elo, str(player.player_id)))
+
+        if not args:
+            return
+
+        try:
+            update_ratings(keys=[self.key], args=args)
+        except redis.RedisError:
+            pass
+
+    def remove(self, player_ids: Iterable) -> None:
+        if not (player_ids := [str(player_id) for player_id in player_ids]):
+            return
+
+        try:
+            redis_client.zrem(self.key, *player_ids)
+        except redis.RedisError:
+            pass
+
+    def range(self) -> Optional[Tuple[int, int]]:
+        """
+        Return the lowest and highest ratings of human players.
+
+        Returns
+        -------
+        Optional[Tuple[int, int]]
+            The lowest and highest ratings, or None if there are no human
+            players.
+
+        """
+        pipe = redis_client.pipeline(transaction=False)
+        pipe.zrange(self.key, 0, 0, withscores=True)
+        pipe.zrange(self.key, -1, -1, withscores=True)
+
+        try:
+            lowest, highest = pipe.execute()
+        except redis.RedisError:
+            ratings = Player.objects.filter(is_human=True).aggregate(
+                Min("elo"), Max("elo")
+            )
+            if ratings["elo__min"] is None:
+                return None
+
+            return ratings["elo__min"], ratings["elo__max"]
+
+        if lowest:
+            return int(lowest[0][1]), int(highest[0][1])
+
+        if ratings := [elo for _, elo in self.load()]:
+            return min(ratings), max(ratings)
+
+        return None
+
+    def percentile(self, q: float) -> Optional[int]:
+        """
+        Return the nearest-rank percentile of the ratings of human players.
+
+        Parameters
+        ----------
+        q : float
+            The percentile, from 0 to 100.
+
+        Returns
+        -------
+        Optional[int]
+            The rating, or None if there are no human players.
+
+        """
+        try:
+            if not (count := redis_client.zcard(self.key)):
+                if not (count := len(self.load())):
+                    return None
+
+            rank = max(1, ceil(q / 100 * count)) - 1
+            rating = redis_client.zrange(self.key, rank, rank, withscores=True)
+        except redis.RedisError:
+            ratings = (
+                Player.objects.filter(is_human=True)
+                .order_by("elo")
+                .values_list("elo", flat=True)
+            )
+            if not (count := ratings.count()):
+                return None
+
+            return ratings[max(1, ceil(q / 100 * count)) - 1]
+
+        return int(rating[0][1]) if rating else None
+
+
+human_ratings = HumanRatings()
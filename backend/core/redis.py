@@ -8,3 +8,11 @@ redis_client = redis.StrictRedis(
     db=settings.REDIS_DB,
     decode_responses=True,
 )
+
+# Connection to the Redis instance of the AI position cache
+position_cache_client = redis.StrictRedis(
+    host=settings.AI_POSITION_CACHE_REDIS_HOST,
+    port=settings.AI_POSITION_CACHE_REDIS_PORT,
+    db=settings.AI_POSITION_CACHE_REDIS_DB,
+    decode_responses=True,
+)
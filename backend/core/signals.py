@@ -0,0 +1,25 @@
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from core.models import Player, Status
+from core.ratings import human_ratings
+from core.statuses import statuses
+
+
+@receiver([post_save, post_delete], sender=Status)
+def invalidate_statuses(sender: Status, **kwargs) -> None:
+    statuses.invalidate()
+
+
+@receiver(post_save, sender=Player)
+def update_human_rating(sender: Player, instance: Player, **kwargs) -> None:
+    if instance.is_human:
+        transaction.on_commit(lambda: human_ratings.update([instance]))
+
+
+@receiver(post_delete, sender=Player)
+def remove_human_rating(sender: Player, instance: Player, **kwargs) -> None:
+    if instance.is_human:
+        player_id = instance.player_id
+        transaction.on_commit(lambda: human_ratings.remove([player_id]))
@@ -0,0 +1,103 @@
+from threading import Lock
+from time import monotonic
+from typing import Dict, Optional, Union
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+
+from core.dataclasses import Status as cfs
+from core.models import Status
+
+
+class StatusRegistry:
+    """
+    A process-local copy of the statuses, keyed by name.
+
+    The statuses are read with one query the first time one is needed and
+    kept until they are invalidated, when a status is saved or deleted, or
+    until ``STATUS_REGISTRY_TTL`` seconds have passed, so edits made by
+    other processes are picked up too. A name that is not found reloads
+    the statuses once before giving up.
+
+    """
+
+    def __init__(self, ttl: Optional[float] = None) -> None:
+        self.ttl = ttl
+        self._statuses: Optional[Dict[str, Status]] = None
+        self._loaded_at = 0.0
+        self._lock = Lock()
+
+    @property
+    def loaded(self) -> bool:
+        ttl = settings.STATUS_REGISTRY_TTL if self.ttl is None else self.ttl
+
+        return self._statuses is not None and (
+            not ttl or monotonic() - self._loaded_at < ttl
+        )
+
+    def load(self) -> Dict[str, Status]:
+        with self._lock:
+            self._statuses = {
+                status.name: status for status in Status.objects.all()
+            }
+            self._loaded_at = monotonic()
+
+            return self._statuses
+
+    def invalidate(self) -> None:
+        self._statuses = None
+
+    def get(self, name: Union[str, cfs]) -> Status:
+        """
+        Return the status with a name.
+
+        Parameters
+        ----------
+        name : Union[str, cfs]
+            The name of the status, or its member of ``core.dataclasses``.
+
+        Returns
+        -------
+        Status
+            The status.
+
+        Raises
+        ------
+        Status.DoesNotExist
+            If there is no status with the name.
+
+        """
+        name = str(name)
+        statuses = self._statuses
+
+        if statuses is None or not self.loaded or name not in statuses:
+            statuses = self.load()
+
+        try:
+            return statuses[name]
+        except KeyError:
+            raise Status.DoesNotExist(
+                f"Status {name!r} does not exist"
+            ) from None
+
+    async def aget(self, name: Union[str, cfs]) -> Status:
+        """
+        Return the status with a name from async code.
+
+        The statuses are only loaded in a thread when they are not already.
+
+        """
+        name = str(name)
+        statuses = self._statuses
+
+        if statuses is not None and self.loaded and name in statuses:
+            return statuses[name]
+
+        return await sync_to_async(self.get)(name)
+
+
+statuses = StatusRegistry()
+
+
+def get_status(name: Union[str, cfs]) -> Status:
+    return statuses.get(name)
@@ -0,0 +1,49 @@
+from random import Random
+
+from django.test import SimpleTestCase
+
+from core.codecs import pack_board, unpack_board
+
+
+class CodecTests(SimpleTestCase):
+    """
+    Test the packed board encoding.
+
+    """
+
+    def test_pack_board(self) -> None:
+        """
+        Test Case for packing four cells to a byte, first cell lowest.
+
+        """
+        self.assertEqual(pack_board([[1, 2, 0, 1], [2]]), bytes([0x49, 0x02]))
+        self.assertEqual(len(pack_board([[0] * 7] * 6)), 11)
+
+    def test_round_trip(self) -> None:
+        """
+        Test Case for unpacking boards of several sizes.
+
+        """
+        rng = Random(0)
+
+        for rows, columns in [(6, 7), (5, 4), (7, 9), (1, 1)]:
+            board = [
+                [rng.choice([0, 1, 2]) for _ in range(columns)]
+                for _ in range(rows)
+            ]
+
+            self.assertEqual(
+                unpack_board(pack_board(board), rows, columns), board
+            )
+
+    def test_unpack_short_data(self) -> None:
+        """
+        Test Case for unpacking missing cells as empty.
+
+        """
+        self.assertEqual(
+            unpack_board(pack_board([[0] * 7] * 6), 7, 8), [[0] * 8] * 7
+        )
+        self.assertEqual(
+            unpack_board(bytes([0x49]), 2, 3), [[1, 2, 0], [1, 0, 0]]
+        )
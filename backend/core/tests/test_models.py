@@ -19,7 +19,14 @@ from django.test import TransactionTestCase
 
 import core.tests.helper as hp
 from core import models
-from core.constants import DEFAULT_COLUMNS, DEFAULT_ROWS
+from core.codecs import pack_board
+from core.constants import (
+    DEFAULT_COLUMNS,
+    DEFAULT_ROWS,
+    EMPTY,
+    PLAYER_ONE,
+    PLAYER_TWO,
+)
 
 SAMPLE_USERNAMES = [
     ["tesT1", "test1"],
@@ -211,6 +218,50 @@ class ModelTests(TransactionTestCase):
         self.assertEqual(game.rows, DEFAULT_ROWS)
         self.assertEqual(game.columns, DEFAULT_COLUMNS)
 
+    def test_game_board_is_packed(self) -> None:
+        """
+        Test Case for saving changes to a game's board in its packed state.
+
+        """
+
+        game = hp.create_game()
+        self.assertEqual(
+            game.board, [[EMPTY] * DEFAULT_COLUMNS] * DEFAULT_ROWS
+        )
+
+        game.board[DEFAULT_ROWS - 1][3] = PLAYER_ONE
+        game.save()
+        game = models.Game.objects.get(game_id=game.game_id)
+
+        self.assertEqual(game.board[DEFAULT_ROWS - 1][3], PLAYER_ONE)
+        self.assertEqual(len(bytes(game.board_state)), 11)
+
+        board = [[PLAYER_TWO] * DEFAULT_COLUMNS] * DEFAULT_ROWS
+        models.Game.objects.filter(game_id=game.game_id).update(
+            board_state=pack_board(board)
+        )
+        game.refresh_from_db()
+
+        self.assertEqual(game.board, board)
+
+    def test_game_default_board_size(self) -> None:
+        """
+        Test Case for a game of a larger size created without a board.
+
+        """
+        self.assertEqual(
+            models.Game(rows=7, columns=8).board, [[EMPTY] * 8] * 7
+        )
+
+        game = hp.create_game()
+        game.rows, game.columns = 9, 9
+        game.board_state = models.default_board_state()
+        game.save()
+        game = models.Game.objects.get(game_id=game.game_id)
+
+        self.assertEqual(game.board, [[EMPTY] * 9] * 9)
+        self.assertEqual(len(bytes(game.board_state)), 21)
+
     def test_create_match_making(self) -> None:
         """
         Test Case for creating a match making.
@@ -0,0 +1,154 @@
+from unittest.mock import patch
+
+from django.test import TestCase, override_settings
+from redis.client import Pipeline
+from redis.exceptions import RedisError
+
+from core.models import Player
+from core.ratings import HumanRatings, human_ratings
+from core.redis import redis_client
+from core.tests.helper import create_algorithm, create_guest, create_user
+from game.utils import compute_depth
+
+
+class HumanRatingsTests(TestCase):
+    """
+    Tests for the ratings of human players kept in Redis.
+
+    """
+
+    def setUp(self) -> None:
+        self.ratings = HumanRatings("test_human_ratings")
+        self.ratings.invalidate()
+
+        self.one = create_user().player
+        self.two = create_guest().player
+        Player.objects.filter(player_id=self.one.player_id).update(elo=1000)
+        Player.objects.filter(player_id=self.two.player_id).update(elo=1400)
+        self.algorithm = create_algorithm()
+
+    def tearDown(self) -> None:
+        self.ratings.invalidate()
+
+    def test_range_loads_once(self) -> None:
+        """
+        Test the ratings are read from the database only when not loaded.
+
+        """
+        with self.assertNumQueries(1):
+            self.assertEqual(self.ratings.range(), (1000, 1400))
+
+        with self.assertNumQueries(0):
+            self.assertEqual(self.ratings.range(), (1000, 1400))
+
+    @override_settings(HUMAN_RATINGS_TTL=60)
+    def test_load_expires(self) -> None:
+        """
+        Test the loaded ratings are rebuilt after a while.
+
+        """
+        self.ratings.load()
+
+        self.assertLessEqual(redis_client.ttl(self.ratings.key), 60)
+
+    def test_update(self) -> None:
+        """
+        Test the range follows updated ratings, in either direction.
+
+        """
+        self.ratings.load()
+
+        self.one.elo = 1100
+        self.two.elo = 1300
+        self.ratings.update([self.one, self.two])
+
+        self.assertEqual(self.ratings.range(), (1100, 1300))
+
+    def test_update_not_loaded(self) -> None:
+        """
+        Test updates are ignored until every rating is loaded.
+
+        """
+        self.one.elo = 1100
+        self.ratings.update([self.one])
+
+        self.assertFalse(redis_client.exists(self.ratings.key))
+        self.assertEqual(self.ratings.range(), (1000, 1400))
+
+    def test_percentile(self) -> None:
+        """
+        Test the nearest-rank percentiles of the ratings.
+
+        """
+        self.assertEqual(self.ratings.percentile(50), 1000)
+        self.assertEqual(self.ratings.percentile(100), 1400)
+
+    def test_signals(self) -> None:
+        """
+        Test saved and deleted players are recorded in the shared ratings
+        once committed.
+
+        """
+        human_ratings.load()
+        three = create_user("test3", email="c@c.com").player
+        three.elo = 1600
+
+        with self.captureOnCommitCallbacks(execute=True):
+            three.save()
+
+        self.assertEqual(human_ratings.range(), (1000, 1600))
+
+        with self.captureOnCommitCallbacks(execute=True):
+            three.delete()
+
+        self.assertEqual(human_ratings.range(), (1000, 1400))
+        human_ratings.invalidate()
+
+    def test_signals_skip_algorithms(self) -> None:
+        """
+        Test saving a player that is not human does not touch Redis.
+
+        """
+        ai = Player.objects.get(algorithm=self.algorithm)
+
+        with self.captureOnCommitCallbacks() as callbacks:
+            ai.save()
+
+        self.assertEqual(callbacks, [])
+
+    def test_redis_errors(self) -> None:
+        """
+        Test updates are dropped and the range is read from the database
+        while Redis is unavailable.
+
+        """
+        error = patch.object(
+            redis_client, "execute_command", side_effect=RedisError
+        )
+        pipeline = patch.object(Pipeline, "execute", side_effect=RedisError)
+
+        with error, pipeline:
+            self.ratings.update([self.one])
+            self.ratings.remove([self.one.player_id])
+
+            with self.assertNumQueries(1):
+                self.assertEqual(self.ratings.range(), (1000, 1400))
+
+            self.assertEqual(self.ratings.percentile(100), 1400)
+
+    def test_compute_depth(self) -> None:
+        """
+        Test the depth is computed without reading the players.
+
+        """
+        human_ratings.load()
+        ai = Player.objects.select_related("algorithm").get(
+            algorithm=self.algorithm
+        )
+        self.one.refresh_from_db()
+
+        with self.assertNumQueries(0):
+            depth = compute_depth(1, ai, self.one)
+
+        self.assertEqual(depth, 2 + self.algorithm.depth)
+        human_ratings.invalidate()
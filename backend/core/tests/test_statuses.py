@@ -0,0 +1,97 @@
+from asgiref.sync import async_to_sync
+from django.test import TestCase, override_settings
+
+from core.dataclasses import Status as cfs
+from core.models import Status
+from core.statuses import StatusRegistry, statuses
+from core.tests.helper import create_status
+
+
+class StatusRegistryTests(TestCase):
+    """
+    Tests for the process-local status registry.
+
+    """
+
+    def setUp(self) -> None:
+        self.created = create_status(cfs.CREATED.value)
+        self.draw = create_status(cfs.DRAW.value)
+        self.registry = StatusRegistry()
+
+    def test_get_loads_once(self) -> None:
+        """
+        Test every status is read with one query and then kept.
+
+        """
+        with self.assertNumQueries(1):
+            self.assertEqual(self.registry.get(cfs.CREATED), self.created)
+            self.assertEqual(self.registry.get(cfs.DRAW.value), self.draw)
+            self.assertEqual(self.registry.get("Created"), self.created)
+
+    def test_get_missing(self) -> None:
+        """
+        Test a missing status reloads once and then raises.
+
+        """
+        self.registry.get(cfs.CREATED)
+
+        with self.assertNumQueries(1):
+            with self.assertRaises(Status.DoesNotExist):
+                self.registry.get(cfs.QUEUED)
+
+    def test_get_new_status(self) -> None:
+        """
+        Test a status created elsewhere is found by reloading.
+
+        """
+        self.registry.get(cfs.CREATED)
+        Status.objects.bulk_create([Status(name=cfs.QUEUED.value)])
+
+        self.assertEqual(self.registry.get(cfs.QUEUED).name, "Queued")
+
+    def test_invalidated_on_save(self) -> None:
+        """
+        Test saving or deleting a status invalidates the shared registry.
+
+        """
+        statuses.get(cfs.DRAW)
+
+        self.draw.description = "Nobody won."
+        self.draw.save()
+        self.assertEqual(statuses.get(cfs.DRAW).description, "Nobody won.")
+
+        self.draw.delete()
+        with self.assertRaises(Status.DoesNotExist):
+            statuses.get(cfs.DRAW)
+
+    @override_settings(STATUS_REGISTRY_TTL=0)
+    def test_no_ttl(self) -> None:
+        """
+        Test the statuses are kept indefinitely when there is no TTL.
+
+        """
+        self.registry.get(cfs.CREATED)
+
+        with self.assertNumQueries(0):
+            self.registry.get(cfs.CREATED)
+
+    def test_ttl(self) -> None:
+        """
+        Test the statuses are reloaded once they expire.
+
+        """
+        registry = StatusRegistry(ttl=60)
+        registry.get(cfs.CREATED)
+        registry._loaded_at -= 60
+
+        with self.assertNumQueries(1):
+            registry.get(cfs.CREATED)
+
+    def test_aget(self) -> None:
+        """
+        Test statuses can be looked up from async code.
+
+        """
+        self.assertEqual(
+            async_to_sync(self.registry.aget)(cfs.DRAW), self.draw
+        )
@@ -0,0 +1,173 @@
+import asyncio
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import List, Optional, Tuple
+
+import django
+from ai.engine import find_move
+from channels.db import database_sync_to_async
+from channels.layers import get_channel_layer
+from core.constants import PLAYER_ONE, PLAYER_TWO
+from core.models import Game
+from django.conf import settings
+
+from game import move, services
+from game.tasks import queue_ai_move
+
+_pool: Optional[ProcessPoolExecutor] = None
+_slots: Optional[asyncio.Semaphore] = None
+
+
+def enabled() -> bool:
+    return settings.AI_EXECUTOR_ENABLED
+
+
+def accepts(game: Game) -> bool:
+    """
+    Return whether the executor plays the AI's reply in a game.
+
+    Only searches no deeper than ``AI_EXECUTOR_MAX_DEPTH`` run in the ASGI
+    process; deeper ones are left to Celery.
+
+    """
+    return (
+        enabled()
+        and game.depth is not None
+        and game.depth <= settings.AI_EXECUTOR_MAX_DEPTH
+    )
+
+
+def get_pool() -> ProcessPoolExecutor:
+    global _pool
+
+    if _pool is None:
+        _pool = ProcessPoolExecutor(
+            max_workers=settings.AI_EXECUTOR_WORKERS,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=django.setup,
+        )
+
+    return _pool
+
+
+def get_slots() -> asyncio.Semaphore:
+    global _slots
+
+    if _slots is None:
+        _slots = asyncio.Semaphore(settings.AI_EXECUTOR_WORKERS)
+
+    return _slots
+
+
+def _search(
+    code_name: str,
+    player: int,
+    board: List[List[int]],
+    depth: int,
+    time_limit: Optional[float],
+) -> Optional[Tuple[int, int]]:
+    return find_move(code_name, player, board, depth, time_limit)
+
+
+async def _load_ai_turn(game_id: str) -> Optional[Game]:
+    try:
+        game = await Game.objects.select_related(
+            "current_turn__algorithm"
+        ).aget(game_id=game_id)
+    except Game.DoesNotExist:
+        raise ValueError("Game does not exist") from None
+
+    return game if game.current_turn.algorithm and accepts(game) else None
+
+
+async def play_ai_move(game_id: str) -> Optional[Tuple[int, int, int]]:
+    """
+    Play the AI's reply to a move made through a websocket.
+
+    The search runs in a bounded process pool so the event loop is never
+    blocked, the move is committed by ``services.commit_move``, which
+    validates it under the game's lock, and it is published on the game's
+    group as the Celery task would. When every worker is busy, the search
+    fails or the game changed during the search, the move is queued for
+    Celery instead.
+
+    Parameters
+    ----------
+    game_id : str
+        The id of the game.
+
+    Returns
+    -------
+    Optional[Tuple[int, int, int]]
+        The player token, row and column of the move, or None if it was
+        not the AI's turn, the search is left to Celery or no move was
+        found.
+
+    Raises
+    ------
+    ValueError
+        If the game does not exist.
+
+    """
+    game = await _load_ai_turn(game_id)
+    if game is None:
+        return None
+
+    slots = get_slots()
+    if slots.locked():
+        await database_sync_to_async(queue_ai_move)(game.game_id)
+        return None
+
+    global _pool
+
+    algorithm = game.current_turn.algorithm
+    player = (
+        PLAYER_ONE
+        if game.current_turn_id == game.player_one_id
+        else PLAYER_TWO
+    )
+
+    try:
+        async with slots:
+            position = await asyncio.get_running_loop().run_in_executor(
+                get_pool(),
+                _search,
+                algorithm.code_name,
+                player,
+                game.board,
+                game.depth,
+                move.get_time_limit(game, algorithm),
+            )
+    except Exception as error:
+        if isinstance(error, BrokenProcessPool) and _pool is not None:
+            # A broken pool accepts no more work, so start a new one.
+            _pool.shutdown(wait=False)
+            _pool = None
+
+        await database_sync_to_async(queue_ai_move)(game.game_id)
+        return None
+
+    if position is None:
+        return None
+
+    row, column = position
+    try:
+        await database_sync_to_async(services.commit_move)(
+            game.game_id, game.current_turn, row, column
+        )
+    except Game.DoesNotExist:
+        return None
+    except ValueError:
+        await database_sync_to_async(queue_ai_move)(game.game_id)
+        return None
+
+    await get_channel_layer().group_send(
+        f"game_{game_id}",
+        {
+            "type": "ai_move",
+            "message": {"player": player, "row": row, "column": column},
+        },
+    )
+
+    return player, row, column
@@ -0,0 +1,206 @@
+import asyncio
+import platform
+from contextlib import nullcontext
+from time import perf_counter
+from typing import Any, Dict, List, Sequence, Tuple
+from uuid import uuid4
+
+from ai.benchmark import summarise
+from asgiref.sync import async_to_sync
+from core.constants import (
+    DEFAULT_COLUMNS,
+    DEFAULT_ROWS,
+    EMPTY,
+    PLAYER_ONE,
+    PLAYER_TWO,
+)
+from core.dataclasses import Status as cfs
+from core.models import Game, Guest, Player
+from core.statuses import get_status
+from django.db import connection
+
+from game.move import play_move, undo_move
+from game.simulation import scratch_environment
+from game.utils import is_board_full, is_winner
+
+Position = Tuple[int, int]
+
+
+def move_sequence(
+    count: int, rows: int = DEFAULT_ROWS, columns: int = DEFAULT_COLUMNS
+) -> List[Position]:
+    """
+    Return up to ``count`` alternating moves that do not end a game.
+
+    Each move is played in the leftmost column where it neither wins nor
+    fills the board, so every game in the benchmark stays in progress.
+
+    """
+    board = [[EMPTY for _ in range(columns)] for _ in range(rows)]
+    token = PLAYER_ONE
+    moves: List[Position] = []
+
+    while len(moves) < count:
+        for column in range(columns):
+            open_rows = [r for r in range(rows) if board[r][column] == EMPTY]
+            if not open_rows:
+                continue
+
+            row = open_rows[-1]
+            board[row][column] = token
+            if is_winner(token, board, column, row) or is_board_full(board):
+                board[row][column] = EMPTY
+                continue
+
+            moves.append((row, column))
+            break
+        else:
+            break
+
+        token = PLAYER_TWO if token == PLAYER_ONE else PLAYER_ONE
+
+    return moves
+
+
+def create_games(count: int, rows: int, columns: int) -> List[Game]:
+    """
+    Create games between new guests for the benchmark.
+
+    """
+    status = get_status(cfs.CREATED)
+    games = []
+
+    for _ in range(count):
+        one, two = (
+            Player.objects.get(
+                guest=Guest.objects.create(username=f"bench{uuid4().hex[:12]}")
+            )
+            for _ in range(2)
+        )
+        games.append(
+            Game.objects.create(
+                player_one=one,
+                player_two=two,
+                rows=rows,
+                columns=columns,
+                board=[[EMPTY] * columns for _ in range(rows)],
+                status=status,
+                current_turn=one,
+            )
+        )
+
+    return games
+
+
+def delete_games(games: Sequence[Game]) -> None:
+    players = [
+        player_id
+        for game in games
+        for player_id in (game.player_one_id, game.player_two_id)
+    ]
+    guests = list(
+        Player.objects.filter(player_id__in=players).values_list(
+            "guest_id", flat=True
+        )
+    )
+
+    Game.objects.filter(game_id__in=[game.game_id for game in games]).delete()
+    Player.objects.filter(player_id__in=players).delete()
+    Guest.objects.filter(guest_id__in=guests).delete()
+
+
+async def _play_game(
+    game: Game, moves: Sequence[Position]
+) -> Tuple[List[float], float]:
+    players = (game.player_one, game.player_two)
+    latencies = []
+
+    for index, (row, column) in enumerate(moves):
+        start = perf_counter()
+        await play_move(game.game_id, players[index % 2], row, column)
+        latencies.append(perf_counter() - start)
+
+    start = perf_counter()
+    await undo_move(game.game_id, players[(len(moves) - 1) % 2])
+
+    return latencies, perf_counter() - start
+
+
+async def _play_games(
+    games: Sequence[Game], moves: Sequence[Position]
+) -> Tuple[List[Tuple[List[float], float]], float]:
+    start = perf_counter()
+    results = await asyncio.gather(*(_play_game(g, moves) for g in games))
+
+    return results, perf_counter() - start
+
+
+def benchmark_moves(
+    games: int = 20,
+    moves: int = 20,
+    rows: int = DEFAULT_ROWS,
+    columns: int = DEFAULT_COLUMNS,
+    scratch: bool = True,
+) -> Dict[str, Any]:
+    """
+    Play websocket moves in concurrent games on one event loop.
+
+    Each game is played by two new guests through ``play_move``, as
+    ``GameConsumer`` does, and ends with its last move undone through
+    ``undo_move``. All the games share one event loop, so the moves per
+    second are those one ASGI worker sustains. The games and guests are
+    deleted afterwards.
+
+    Parameters
+    ----------
+    games : int
+        The number of games played at once.
+
+    moves : int
+        The number of moves played in each game.
+
+    rows : int
+        The number of rows of each board.
+
+    columns : int
+        The number of columns of each board.
+
+    scratch : bool
+        Whether to play in a ``scratch_environment``. Only turn it off when
+        Redis and the database are already throwaway ones, as in tests.
+
+    Returns
+    -------
+    Dict[str, Any]
+        The moves played, the moves and undos per second, and their
+        latency percentiles.
+
+    """
+    sequence = move_sequence(moves, rows, columns)
+
+    with scratch_environment() if scratch else nullcontext():
+        created = create_games(games, rows, columns)
+
+        try:
+            results, elapsed = async_to_sync(_play_games)(created, sequence)
+        finally:
+            delete_games(created)
+
+    latencies = [latency for game, _ in results for latency in game]
+    undos = [undo for _, undo in results]
+    played = len(latencies) + len(undos)
+
+    return {
+        "environment": {
+            "python": platform.python_version(),
+            "database": connection.vendor,
+            "machine": platform.machine(),
+        },
+        "games": games,
+        "moves": len(latencies),
+        "undos": len(undos),
+        "seconds": round(elapsed, 4),
+        "moves_per_second": round(played / elapsed) if elapsed else 0,
+        "move_latency": summarise(latencies),
+        "undo_latency": summarise(undos),
+    }
@@ -1,10 +1,9 @@
 import json
 
-from channels.db import database_sync_to_async
 from core.constants import PLAYER_ONE, PLAYER_TWO
 from core.consumers import CLOSE_CODE, BaseConsumer
 from core.models import Game
-from game import move
+from game import ai_executor, move
 
 
 class GameConsumer(BaseConsumer):
@@ -13,32 +12,38 @@ class GameConsumer(BaseConsumer):
         self.group_name = f"game_{self.game_id}"
 
         try:
-            game = await database_sync_to_async(Game.objects.get)(
-                game_id=self.game_id
-            )
+            game = await Game.objects.aget(game_id=self.game_id)
         except Game.DoesNotExist:
             await self.close(code=CLOSE_CODE, reason="Game does not exist")
             return
 
-        if not await self.is_player_in_game(game):
+        if not self.is_player_in_game(game):
             await self.close(code=CLOSE_CODE, reason="User is not in the game")
             return
 
         self.token = (
-            PLAYER_ONE if self.player == game.player_one else PLAYER_TWO
+            PLAYER_ONE
+            if self.player.player_id == game.player_one_id
+            else PLAYER_TWO
         )
         await self.channel_layer.group_add(self.group_name, self.channel_name)
         await self.accept()
 
-    @database_sync_to_async
     def is_player_in_game(self, game: Game) -> bool:
-        return game.player_one == self.player or game.player_two == self.player
+        return self.player.player_id in (
+            game.player_one_id,
+            game.player_two_id,
+        )
 
     async def player_move(self, data: dict) -> None:
         try:
             row, column = data["row"], data["column"]
             success = await move.play_move(
-                self.game_id, self.player, row, column
+                self.game_id,
+                self.player,
+                row,
+                column,
+                defer_ai_move=ai_executor.enabled(),
             )
 
             if success:
@@ -46,6 +51,9 @@ class GameConsumer(BaseConsumer):
                     "player_move",
                     {"row": row, "column": column},
                 )
+
+                if ai_executor.enabled():
+                    await ai_executor.play_ai_move(self.game_id)
         except ValueError as e:
             await self.send_error(str(e))
 
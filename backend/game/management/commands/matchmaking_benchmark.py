@@ -0,0 +1,67 @@
+import json
+from pathlib import Path
+
+from django.core.exceptions import ImproperlyConfigured
+from django.core.management.base import BaseCommand, CommandError
+from game.simulation import DISTRIBUTIONS, simulate_matchmaking
+
+
+class Command(BaseCommand):
+    """
+    Command to simulate the matchmaking queue under load.
+
+    """
+
+    help = (
+        "Queues synthetic players arriving on a simulated clock, matches "
+        "them as the match requests and sweeps do, and prints the wait "
+        "percentiles, rating gaps, throughput and Redis commands per match "
+        "as JSON. It runs against an in-memory Redis and a throwaway test "
+        "database, and needs fakeredis."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--players", type=int, default=1000)
+        parser.add_argument("--arrival-rate", type=float, default=50.0)
+        parser.add_argument(
+            "--distribution", choices=DISTRIBUTIONS, default="normal"
+        )
+        parser.add_argument("--elo-mean", type=float, default=1200)
+        parser.add_argument("--elo-spread", type=float, default=200)
+        parser.add_argument("--sweep-interval", type=float, default=10.0)
+        parser.add_argument("--drain", type=float, default=60.0)
+        parser.add_argument("--rows", type=int, default=6)
+        parser.add_argument("--columns", type=int, default=7)
+        parser.add_argument("--seed", type=int, default=0)
+        parser.add_argument("--output", type=Path, default=None)
+
+    def handle(self, *args, **options):
+        """
+        Handle the command.
+
+        """
+        try:
+            result = simulate_matchmaking(
+                players=options["players"],
+                arrival_rate=options["arrival_rate"],
+                distribution=options["distribution"],
+                elo_mean=options["elo_mean"],
+                elo_spread=options["elo_spread"],
+                sweep_interval=options["sweep_interval"],
+                drain=options["drain"],
+                rows=options["rows"],
+                columns=options["columns"],
+                seed=options["seed"],
+            )
+        except ImproperlyConfigured as error:
+            raise CommandError(error) from None
+
+        output = json.dumps(result, indent=2)
+
+        if options["output"]:
+            options["output"].write_text(output + "\n")
+            self.stdout.write(
+                self.style.SUCCESS(f"Saved results to {options['output']}")
+            )
+        else:
+            self.stdout.write(output)
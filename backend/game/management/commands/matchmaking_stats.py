@@ -0,0 +1,20 @@
+import json
+
+from django.core.management.base import BaseCommand
+from game.match_making import partition_metrics
+
+
+class Command(BaseCommand):
+    """
+    Command to report the depth and wait times of matchmaking partitions.
+
+    """
+
+    help = "Prints the metrics of each matchmaking partition as JSON."
+
+    def handle(self, *args, **options):
+        """
+        Handle the command.
+
+        """
+        self.stdout.write(json.dumps(partition_metrics(), indent=2))
@@ -0,0 +1,52 @@
+import json
+from pathlib import Path
+
+from django.core.exceptions import ImproperlyConfigured
+from django.core.management.base import BaseCommand, CommandError
+from game.benchmark import benchmark_moves
+
+
+class Command(BaseCommand):
+    """
+    Command to benchmark websocket move handling.
+
+    """
+
+    help = (
+        "Plays moves in concurrent games between new guests on one event "
+        "loop, as an ASGI worker does, and prints the moves per second and "
+        "latency percentiles as JSON. It runs against an in-memory Redis "
+        "and a throwaway test database, and needs fakeredis."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--games", type=int, default=20)
+        parser.add_argument("--moves", type=int, default=20)
+        parser.add_argument("--rows", type=int, default=6)
+        parser.add_argument("--columns", type=int, default=7)
+        parser.add_argument("--output", type=Path, default=None)
+
+    def handle(self, *args, **options):
+        """
+        Handle the command.
+
+        """
+        try:
+            result = benchmark_moves(
+                games=options["games"],
+                moves=options["moves"],
+                rows=options["rows"],
+                columns=options["columns"],
+            )
+        except ImproperlyConfigured as error:
+            raise CommandError(error) from None
+
+        output = json.dumps(result, indent=2)
+
+        if options["output"]:
+            options["output"].write_text(output + "\n")
+            self.stdout.write(
+                self.style.SUCCESS(f"Saved results to {options['output']}")
+            )
+        else:
+            self.stdout.write(output)
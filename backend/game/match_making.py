@@ -1,23 +1,155 @@
+import asyncio
 import contextlib
-from typing import Optional
+import logging
+from dataclasses import dataclass
+from time import time
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
 from uuid import UUID
 
 from asgiref.sync import async_to_sync
 from channels.layers import get_channel_layer
-from core.constants import MATCHMAKING_QUEUE
+from core.constants import (
+    DEFAULT_COLUMNS,
+    DEFAULT_ROWS,
+    EMPTY,
+    MATCHMAKING_PARTITIONS,
+    MATCHMAKING_PLAYERS,
+    MATCHMAKING_QUEUE,
+)
 from core.dataclasses import Status as cfs
-from core.models import Game, MatchMakingQueue, Player, Status
+from core.models import Game, MatchMakingQueue, Player
 from core.redis import redis_client
+from core.statuses import get_status
 from core.utils import get_username_or_name
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Case, UUIDField, Value, When
+from django.db.models.signals import post_save
+from django.utils import timezone
+
+logger = logging.getLogger(__name__)
 
 NOTIFICATION_TYPE = "matchmaking"
 
+# A queued player's id, rating and the time they joined the queue.
+Claim = Tuple[str, float, float]
+
+# Removes two players from a partition, but only if both are still in it,
+# so concurrent matchmaking runs can never match a player twice. Returns the
+# rating and join time of each player, or nil if either had already left.
+CLAIM_PAIR = """
+local rating = redis.call("ZSCORE", KEYS[1], ARGV[1])
+local other_rating = redis.call("ZSCORE", KEYS[1], ARGV[2])
+if not rating or not other_rating then
+    return false
+end
+local joined = redis.call("ZSCORE", KEYS[2], ARGV[1]) or ARGV[3]
+local other_joined = redis.call("ZSCORE", KEYS[2], ARGV[2]) or ARGV[3]
+redis.call("ZREM", KEYS[1], ARGV[1], ARGV[2])
+redis.call("ZREM", KEYS[2], ARGV[1], ARGV[2])
+redis.call("HDEL", KEYS[3], ARGV[1], ARGV[2])
+return {rating, joined, other_rating, other_joined}
+"""
+
+# Forgets a partition once nobody is queued in it.
+PRUNE_PARTITION = """
+if redis.call("ZCARD", KEYS[1]) == 0 then
+    return redis.call("SREM", KEYS[2], ARGV[1])
+end
+return 0
+"""
+
+claim_pair = redis_client.register_script(CLAIM_PAIR)
+prune_partition = redis_client.register_script(PRUNE_PARTITION)
+
+
+def elo_band(elo_rating: float) -> int:
+    width = settings.MATCHMAKING_ELO_BAND
+    return int(elo_rating // width) if width else 0
+
+
+@dataclass(frozen=True)
+class Partition:
+    """
+    A matchmaking queue, of players who want the same board size, are in
+    the same Elo band and play in the same region.
+
+    Each partition has its own Redis keys, so partitions are matched
+    independently of each other.
+
+    """
+
+    rows: int = DEFAULT_ROWS
+    columns: int = DEFAULT_COLUMNS
+    band: int = 0
+    region: str = ""
+
+    @classmethod
+    def for_player(
+        cls,
+        elo_rating: float,
+        rows: int = DEFAULT_ROWS,
+        columns: int = DEFAULT_COLUMNS,
+        region: Optional[str] = None,
+    ) -> "Partition":
+        return cls(
+            rows,
+            columns,
+            elo_band(elo_rating),
+            region or settings.MATCHMAKING_REGIONS[0],
+        )
+
+    @classmethod
+    def from_name(cls, name: str) -> "Partition":
+        size, band, region = name.split(":", 2)
+        rows, columns = size.split("x")
 
-def add_player_to_queue(player_id, elo_rating) -> UUID:
-    redis_client.zadd(MATCHMAKING_QUEUE, {str(player_id): elo_rating})
+        return cls(int(rows), int(columns), int(band), region)
+
+    @property
+    def name(self) -> str:
+        return f"{self.rows}x{self.columns}:{self.band}:{self.region}"
+
+    @property
+    def queue(self) -> str:
+        return f"{MATCHMAKING_QUEUE}:{self.name}"
+
+    @property
+    def joined(self) -> str:
+        return f"{self.queue}:joined"
+
+    @property
+    def stats(self) -> str:
+        return f"{self.queue}:stats"
+
+    @property
+    def lock(self) -> str:
+        return f"{self.queue}:lock"
+
+
+def get_partition(player_id) -> Optional[Partition]:
+    name = redis_client.hget(MATCHMAKING_PLAYERS, str(player_id))
+    return Partition.from_name(name) if name else None
+
+
+def add_player_to_queue(
+    player_id,
+    elo_rating,
+    partition: Optional[Partition] = None,
+    now: Optional[float] = None,
+) -> UUID:
+    partition = partition or Partition.for_player(elo_rating)
+    now = time() if now is None else now
+
+    pipe = redis_client.pipeline()
+    pipe.zadd(partition.queue, {str(player_id): elo_rating})
+    pipe.zadd(partition.joined, {str(player_id): now}, nx=True)
+    pipe.hset(MATCHMAKING_PLAYERS, str(player_id), partition.name)
+    pipe.sadd(MATCHMAKING_PARTITIONS, partition.name)
+    pipe.execute()
 
     match = MatchMakingQueue.objects.create(
-        player_id=player_id, status=Status.objects.get(name=cfs.QUEUED.value)
+        player_id=player_id, status=get_status(cfs.QUEUED.value)
     )
 
     return match.queue_id
@@ -27,90 +159,488 @@ def remove_player_from_queue(player_id, game: Optional[Game] = None) -> int:
     status = 0
     with contextlib.suppress(MatchMakingQueue.DoesNotExist):
         match = MatchMakingQueue.objects.get(
-            player=player_id, status=Status.objects.get(name=cfs.QUEUED.value)
+            player=player_id, status=get_status(cfs.QUEUED.value)
         )
 
         if game:
-            match.status = Status.objects.get(name=cfs.MATCHED.value)
+            match.status = get_status(cfs.MATCHED.value)
             match.game = game
             status = 1
         else:
-            match.status = Status.objects.get(name=cfs.CANCELLED.value)
+            match.status = get_status(cfs.CANCELLED.value)
             status = 2
 
         match.save()
 
-        redis_client.zrem(MATCHMAKING_QUEUE, player_id)
+        if partition := get_partition(player_id):
+            pipe = redis_client.pipeline()
+            pipe.zrem(partition.queue, str(player_id))
+            pipe.zrem(partition.joined, str(player_id))
+            pipe.hdel(MATCHMAKING_PLAYERS, str(player_id))
+            pipe.execute()
 
     return status
 
 
-def find_match_for_player(player_id) -> Game | None:
-    with contextlib.suppress(Player.DoesNotExist):
-        player_data = Player.objects.get(player_id=player_id)
-        player_rating = player_data.elo
+def elo_window(waited: float) -> float:
+    """
+    Return how far apart the ratings of two players may be to be matched.
 
-        # Get players from the queue with Elo ratings
-        players = redis_client.zrangebyscore(
-            MATCHMAKING_QUEUE, "-inf", "+inf", withscores=True
-        )
-        potential_opponents = [
-            (pid, score) for pid, score in players if pid != player_id
-        ]
+    Parameters
+    ----------
+    waited : float
+        The number of seconds the player has been queued.
 
-        if not potential_opponents:
-            return None
+    Returns
+    -------
+    float
+        The largest difference in rating allowed.
 
-        # Match based on closest rating
-        opponent_id, _ = min(
-            potential_opponents, key=lambda x: abs(x[1] - player_rating)
-        )
+    """
+    return min(
+        settings.MATCHMAKING_ELO_WINDOW
+        + max(waited, 0) * settings.MATCHMAKING_ELO_WINDOW_GROWTH,
+        settings.MATCHMAKING_MAX_ELO_WINDOW,
+    )
+
+
+def find_opponent(
+    partition: Partition, player_id: str, rating: float, window: float
+) -> Optional[str]:
+    """
+    Return the player in a partition rated nearest to a rating, within a
+    window.
+
+    Only the ``MATCHMAKING_CANDIDATES`` players nearest on either side of
+    the rating are read from the queue, so the lookup takes logarithmic
+    time in the size of the queue.
+
+    Parameters
+    ----------
+    partition : Partition
+        The partition the player is queued in.
+
+    player_id : str
+        The id of the player looking for an opponent.
+
+    rating : float
+        The rating of the player.
+
+    window : float
+        The largest difference in rating allowed.
+
+    Returns
+    -------
+    Optional[str]
+        The id of the opponent, or None if nobody is in the window.
+
+    """
+    # One more than needed, as the player appears on both sides.
+    count = settings.MATCHMAKING_CANDIDATES + 1
+
+    pipe = redis_client.pipeline(transaction=False)
+    pipe.zrangebyscore(
+        partition.queue,
+        rating,
+        rating + window,
+        start=0,
+        num=count,
+        withscores=True,
+    )
+    pipe.zrevrangebyscore(
+        partition.queue,
+        rating,
+        rating - window,
+        start=0,
+        num=count,
+        withscores=True,
+    )
+    above, below = pipe.execute()
+
+    candidates = [
+        (pid, score) for pid, score in above + below if pid != player_id
+    ]
+    if not candidates:
+        return None
+
+    opponent_id, _ = min(candidates, key=lambda x: abs(x[1] - rating))
+
+    return opponent_id
+
+
+def requeue_players(partition: Partition, claimed: Sequence[Claim]) -> None:
+    """
+    Put claimed players back in their partition, with their original join
+    time.
+
+    Players that no longer exist are left out.
+
+    """
+    existing = {
+        str(player_id)
+        for player_id in Player.objects.filter(
+            player_id__in=[player_id for player_id, _, _ in claimed]
+        ).values_list("player_id", flat=True)
+    }
+
+    pipe = redis_client.pipeline()
+    for player_id, rating, joined in claimed:
+        if player_id in existing:
+            pipe.zadd(partition.queue, {player_id: rating})
+            pipe.zadd(partition.joined, {player_id: joined})
+            pipe.hset(MATCHMAKING_PLAYERS, player_id, partition.name)
+    pipe.sadd(MATCHMAKING_PARTITIONS, partition.name)
+    pipe.execute()
+
+
+def claim_opponent(
+    partition: Partition, player_id: str, now: float
+) -> Optional[Tuple[Claim, Claim]]:
+    """
+    Find and claim the nearest rated opponent in a player's window, from
+    the player's partition.
+
+    Returns
+    -------
+    Optional[Tuple[Claim, Claim]]
+        The id, rating and join time of the player and their opponent,
+        who are no longer queued, or None if the player was not matched.
+
+    """
+    player_id = str(player_id)
+
+    pipe = redis_client.pipeline(transaction=False)
+    pipe.zscore(partition.queue, player_id)
+    pipe.zscore(partition.joined, player_id)
+    rating, joined = pipe.execute()
+
+    if rating is None:
+        return None
+
+    waited = now - (now if joined is None else joined)
+    opponent_id = find_opponent(
+        partition, player_id, rating, elo_window(waited)
+    )
+    if opponent_id is None:
+        return None
 
-        game = create_game(player_id, opponent_id)
+    scores = claim_pair(
+        keys=[partition.queue, partition.joined, MATCHMAKING_PLAYERS],
+        args=[player_id, opponent_id, now],
+    )
+    if scores is None:
+        return None
+
+    rating, joined, opponent_rating, opponent_joined = map(float, scores)
+
+    return (player_id, rating, joined), (
+        opponent_id,
+        opponent_rating,
+        opponent_joined,
+    )
+
+
+def create_matches(
+    partition: Partition,
+    pairs: Sequence[Tuple[Claim, Claim]],
+    now: Optional[float] = None,
+) -> List[Game]:
+    """
+    Create the games of pairs of players claimed from a partition together.
+
+    The players are read with one query, the games are written with one
+    bulk insert, and the queue entries of every player are marked as
+    matched with one update. ``bulk_create`` does not send ``post_save``,
+    so it is sent for each game afterwards as ``Game.objects.create``
+    would. The players are put back in the queue if the games cannot be
+    created, and a player whose opponent no longer exists is put back
+    straight away. The games use the board size of the partition, and the
+    number of matches and the time their players waited are added to the
+    partition's statistics.
+
+    Parameters
+    ----------
+    partition : Partition
+        The partition the pairs were claimed from.
+
+    pairs : Sequence[Tuple[Claim, Claim]]
+        The pairs claimed by ``claim_opponent``.
+
+    now : Optional[float]
+        The current time, to measure how long the players waited.
+
+    Returns
+    -------
+    List[Game]
+        The games created, with both players loaded.
+
+    """
+    claims = [claim for pair in pairs for claim in pair]
+
+    try:
+        with transaction.atomic():
+            players = Player.objects.select_related(
+                "user", "guest", "algorithm"
+            ).in_bulk([player_id for player_id, _, _ in claims])
+            players = {str(pk): player for pk, player in players.items()}
+
+            created = get_status(cfs.CREATED)
+            games = []
+            stranded = []
+            for one, two in pairs:
+                if one[0] not in players or two[0] not in players:
+                    stranded.extend((one, two))
+                    continue
+
+                games.append(
+                    Game(
+                        player_one=players[one[0]],
+                        player_two=players[two[0]],
+                        rows=partition.rows,
+                        columns=partition.columns,
+                        board=[
+                            [EMPTY] * partition.columns
+                            for _ in range(partition.rows)
+                        ],
+                        status=created,
+                        current_turn=players[one[0]],
+                    )
+                )
+
+            Game.objects.bulk_create(games)
+
+            matched = {
+                player_id: game.game_id
+                for game in games
+                for player_id in (game.player_one_id, game.player_two_id)
+            }
+            MatchMakingQueue.objects.filter(
+                player_id__in=list(matched),
+                status=get_status(cfs.QUEUED),
+            ).update(
+                status=get_status(cfs.MATCHED),
+                game=Case(
+                    *(
+                        When(player_id=player_id, then=Value(game_id))
+                        for player_id, game_id in matched.items()
+                    ),
+                    output_field=UUIDField(),
+                ),
+                updated_at=timezone.now(),
+            )
+    except Exception:
+        requeue_players(partition, claims)
+        raise
+
+    if stranded:
+        requeue_players(partition, stranded)
+
+    if games:
+        record_matches(partition, games, claims, now)
+
+    for game in games:
+        post_save.send(sender=Game, instance=game, created=True)
+
+    return games
+
+
+def find_match_for_player(
+    player_id, now: Optional[float] = None
+) -> Game | None:
+    """
+    Match a queued player with the nearest rated player in their window.
+
+    The pair is claimed atomically before the game is created, and put
+    back in the queue if the game cannot be created.
+
+    Parameters
+    ----------
+    player_id : str
+        The id of the queued player.
+
+    now : Optional[float]
+        The current time, to measure how long the player has waited.
+
+    Returns
+    -------
+    Game | None
+        The game created, or None if the player was not matched.
+
+    """
+    now = time() if now is None else now
 
-        # Remove both players from the queue
-        remove_player_from_queue(player_id, game)
-        remove_player_from_queue(opponent_id, game)
+    if (partition := get_partition(player_id)) is None:
+        return None
 
-        return game
+    if (pair := claim_opponent(partition, player_id, now)) is None:
+        return None
 
-    redis_client.zrem(MATCHMAKING_QUEUE, player_id)
-    return None
+    games = create_matches(partition, [pair], now)
 
+    return games[0] if games else None
 
-def create_game(player1_id, player2_id):
-    # Create a game instance
-    return Game.objects.create(
-        player_one=Player.objects.get(player_id=player1_id),
-        player_two=Player.objects.get(player_id=player2_id),
-        status=Status.objects.get(name=cfs.CREATED),
-        current_turn=Player.objects.get(player_id=player1_id),
+
+def match_queue(
+    partition: Partition, now: Optional[float] = None
+) -> List[Game]:
+    """
+    Try to match every player queued in a partition once, longest waiting
+    first.
+
+    The pairs are claimed first, then their games are created in batches
+    of ``MATCHMAKING_BATCH_SIZE``. A batch that fails is put back in the
+    queue by ``create_matches`` and the sweep goes on with the next, so the
+    games already created are still returned to be announced.
+
+    Parameters
+    ----------
+    partition : Partition
+        The partition to match.
+
+    now : Optional[float]
+        The current time, to measure how long players have waited.
+
+    Returns
+    -------
+    List[Game]
+        The games created.
+
+    """
+    now = time() if now is None else now
+
+    pairs = []
+    for player_id in redis_client.zrange(partition.joined, 0, -1):
+        if pair := claim_opponent(partition, player_id, now):
+            pairs.append(pair)
+
+    size = settings.MATCHMAKING_BATCH_SIZE
+    games = []
+    for start in range(0, len(pairs), size):
+        batch = pairs[start : start + size]
+        try:
+            games.extend(create_matches(partition, batch, now))
+        except Exception:
+            logger.exception(
+                "Could not create %d matches in %s", len(batch), partition.name
+            )
+
+    return games
+
+
+def record_matches(
+    partition: Partition,
+    games: Sequence[Game],
+    claims: Sequence[Claim],
+    now: Optional[float] = None,
+) -> None:
+    matched = {
+        str(player_id)
+        for game in games
+        for player_id in (game.player_one_id, game.player_two_id)
+    }
+    now = time() if now is None else now
+    waited = sum(
+        now - joined for player_id, _, joined in claims if player_id in matched
     )
 
+    pipe = redis_client.pipeline()
+    pipe.hincrby(partition.stats, "matched", len(matched))
+    pipe.hincrbyfloat(partition.stats, "wait_seconds", waited)
+    pipe.execute()
 
-def notify_players(game: Game):
-    game_id = game.game_id
-    p1_id = game.player_one.player_id
-    p2_id = game.player_two.player_id
 
-    p1_name = get_username_or_name(game.player_one)
-    p2_name = get_username_or_name(game.player_two)
+def active_partitions() -> List[Partition]:
+    return [
+        Partition.from_name(name)
+        for name in sorted(redis_client.smembers(MATCHMAKING_PARTITIONS))
+    ]
+
+
+def prune_partitions(partitions: Iterable[Partition]) -> None:
+    for partition in partitions:
+        prune_partition(
+            keys=[partition.queue, MATCHMAKING_PARTITIONS],
+            args=[partition.name],
+        )
 
-    channel_layer = get_channel_layer()
 
-    send_notification(channel_layer, p1_id, game_id, p1_name, p2_name)
-    send_notification(channel_layer, p2_id, game_id, p1_name, p2_name)
+def partition_metrics(now: Optional[float] = None) -> Dict[str, Any]:
+    """
+    Return the depth and wait times of every active partition.
+
+    Parameters
+    ----------
+    now : Optional[float]
+        The current time, to measure how long players have waited.
+
+    Returns
+    -------
+    Dict[str, Any]
+        For each partition, by name, the number of players queued, the
+        longest any of them has waited, the number of players matched and
+        the mean time they waited to be matched, in seconds.
+
+    """
+    now = time() if now is None else now
+    partitions = active_partitions()
+
+    pipe = redis_client.pipeline(transaction=False)
+    for partition in partitions:
+        pipe.zcard(partition.queue)
+        pipe.zrange(partition.joined, 0, 0, withscores=True)
+        pipe.hgetall(partition.stats)
+    results = pipe.execute()
+
+    metrics = {}
+    for index, partition in enumerate(partitions):
+        depth, oldest, stats = results[index * 3 : index * 3 + 3]
+        matched = int(stats.get("matched", 0))
+        waited = float(stats.get("wait_seconds", 0))
+
+        metrics[partition.name] = {
+            "depth": depth,
+            "longest_wait_seconds": (
+                round(now - oldest[0][1], 3) if oldest else 0.0
+            ),
+            "matched": matched,
+            "mean_wait_to_match_seconds": (
+                round(waited / matched, 3) if matched else 0.0
+            ),
+        }
+
+    return metrics
+
+
+def notify_players(games: Iterable[Game]) -> None:
+    """
+    Tell both players of each game that they have been matched.
+
+    Every notification is sent from one call into the event loop, rather
+    than one call per player.
+
+    """
+    messages = []
+    for game in games:
+        message = {
+            "game_id": str(game.game_id),
+            "player_one": get_username_or_name(game.player_one),
+            "player_two": get_username_or_name(game.player_two),
+        }
+        messages.extend(
+            (
+                f"player_{player_id}",
+                {"type": NOTIFICATION_TYPE, "message": message},
+            )
+            for player_id in (game.player_one_id, game.player_two_id)
+        )
+
+    if messages:
+        async_to_sync(send_notifications)(get_channel_layer(), messages)
 
 
-def send_notification(channel_layer, player_id, game_id, p1_name, p2_name):
-    async_to_sync(channel_layer.group_send)(
-        f"player_{player_id}",
-        {
-            "type": NOTIFICATION_TYPE,
-            "message": {
-                "game_id": str(game_id),
-                "player_one": p1_name,
-                "player_two": p2_name,
-            },
-        },
+async def send_notifications(
+    channel_layer, messages: List[Tuple[str, dict]]
+) -> None:
+    await asyncio.gather(
+        *(channel_layer.group_send(group, event) for group, event in messages)
     )
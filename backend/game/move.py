@@ -1,90 +1,283 @@
 import contextlib
-from typing import Optional, Tuple
+import logging
+from time import monotonic
+from typing import Iterable, Iterator, Optional, Tuple
 
-from ai.algorithm.alphabeta import AlphaBeta
-from ai.algorithm.minimax import Minimax
+from ai.board import Board
+from ai.engine import find_move
+from ai.ordering import centre_out
+from ai.transposition import TranspositionTable
 from asgiref.sync import sync_to_async
-from core.constants import PLAYER_ONE, PLAYER_TWO
-from core.dataclasses import Algorithm as cfa
+from core.constants import DIFFICULTY_TIME_LIMITS, PLAYER_ONE, PLAYER_TWO
 from core.dataclasses import Status as cfs
-from core.models import Game, Move, Player
+from core.models import Algorithm, Game, Move, Player
+from django.conf import settings
 
-from game import utils
+from game import services, tasks
+from game.state import PLAYABLE, load_state
 
+logger = logging.getLogger(__name__)
 
-def get_game_status(game_id: str) -> Optional[str]:
-    with contextlib.suppress(Game.DoesNotExist):
-        game = Game.objects.get(game_id=game_id)
 
-        return game.status.name
+def get_game_status(game_id: str) -> Optional[str]:
+    if state := load_state(game_id):
+        return state.status
 
     return None
 
 
+def get_time_limit(game: Game, algorithm: Algorithm) -> Optional[float]:
+    if algorithm.time_limit is not None:
+        return algorithm.time_limit
+
+    return DIFFICULTY_TIME_LIMITS.get(game.difficulty_level)
+
+
+def search_ai_move(
+    game: Game, table: Optional[TranspositionTable] = None
+) -> Optional[Tuple[int, int, int]]:
+    algorithm = game.current_turn.algorithm
+
+    player = (
+        PLAYER_ONE
+        if game.current_turn_id == game.player_one_id
+        else PLAYER_TWO
+    )
+
+    position = find_move(
+        algorithm.code_name,
+        player,
+        game.board,
+        game.depth,
+        get_time_limit(game, algorithm),
+        algorithm.workers,
+        table=table,
+    )
+    if position is None:
+        return None
+
+    row, column = position
+
+    return player, row, column
+
+
 def compute_ai_move(game_id) -> Optional[Tuple[int, int, int]]:
     with contextlib.suppress(Game.DoesNotExist):
-        game = Game.objects.get(game_id=game_id)
+        game = Game.objects.select_related("current_turn__algorithm").get(
+            game_id=game_id
+        )
 
         if game.current_turn.algorithm is None:
             return
 
-        current_turn = game.current_turn.algorithm.code_name
+        if (position := search_ai_move(game)) is None:
+            return
 
-        player = (
-            PLAYER_ONE if game.current_turn == game.player_one else PLAYER_TWO
-        )
+        _, row, column = position
 
-        match current_turn:
-            case cfa.MINIMAX.value:
-                algorithm = Minimax(player, game.board, game.depth)
-            case cfa.ALPHA_BETA.value:
-                algorithm = AlphaBeta(player, game.board, game.depth)
-            case _:
-                return
-        row, column = algorithm.get_move()
-
-        Move.objects.create(
-            game=game,
-            player=game.current_turn,
-            row=row,
-            column=column,
-        )
+        services.commit_move(game.game_id, game.current_turn, row, column)
 
-        return player, row, column
+        return position
     raise ValueError("Game does not exist")
 
 
-async def play_move(
-    game_id: str, player: Player, row: int, column: int
-) -> bool:
-    with contextlib.suppress(Game.DoesNotExist):
-        game = await sync_to_async(Game.objects.get)(game_id=game_id)
+def compute_ai_moves(
+    game_ids: Iterable[str], time_limit: Optional[float] = None
+) -> Iterator[Tuple[str, int, int, int]]:
+    """
+    Compute the AI moves of several games together.
 
-        status_name = await sync_to_async(lambda: game.status.name)()
+    The searches share a transposition table, whose entries are keyed by
+    the searching player as well as the position. Each move is committed by
+    ``services.commit_move``, which validates it under the game's lock, so
+    a game that changed during the search is skipped, and is yielded as
+    soon as it is played. A game whose search or commit fails otherwise is
+    logged and queued again, without holding up the rest. Once
+    ``time_limit`` seconds have passed, the games not yet searched are
+    queued again instead.
 
-        if status_name not in [cfs.IN_PROGRESS.value, cfs.CREATED.value]:
-            raise ValueError("Game is not in progress")
+    Parameters
+    ----------
+    game_ids : Iterable[str]
+        The ids of the games whose turn it is for an AI player.
 
-        current_turn = await sync_to_async(lambda: game.current_turn)()
-        if current_turn != player:
-            raise ValueError("It is not your turn")
+    time_limit : Optional[float]
+        The number of seconds to search for, if limited.
 
-        columns = await sync_to_async(lambda: game.columns)()
-        rows = await sync_to_async(lambda: game.rows)()
-        if not (0 <= column < columns and 0 <= row < rows):
-            raise ValueError(
-                f"(Column,Row) must be 0 or less than ({columns},{rows})"
+    Yields
+    ------
+    Tuple[str, int, int, int]
+        The game id, player token, row and column of each move played.
+
+    """
+    games = list(
+        Game.objects.select_related(
+            "current_turn__algorithm", "status"
+        ).filter(
+            game_id__in=list(game_ids),
+            current_turn__algorithm__isnull=False,
+            status__name__in=[cfs.CREATED.value, cfs.IN_PROGRESS.value],
+        )
+    )
+    table = TranspositionTable(settings.AI_TRANSPOSITION_TABLE_SIZE)
+    start = monotonic()
+
+    for index, game in enumerate(games):
+        if time_limit is not None and monotonic() - start >= time_limit:
+            for game in games[index:]:
+                tasks.queue_ai_move(game.game_id)
+            return
+
+        try:
+            if (position := search_ai_move(game, table)) is None:
+                continue
+
+            _, row, column = position
+
+            try:
+                services.commit_move(
+                    game.game_id, game.current_turn, row, column
+                )
+            except (Game.DoesNotExist, ValueError):
+                continue
+        except Exception:
+            logger.exception(
+                "Could not play the AI move of game %s", game.game_id
             )
+            tasks.queue_ai_move(game.game_id)
+            continue
+
+        yield str(game.game_id), *position
+
+
+def ponder_ai_replies(game_id: str) -> int:
+    """
+    Search the AI's reply to each move the human can make next.
+
+    The replies are stored in the position cache, so ``compute_ai_move``
+    answers from the cache once the human has moved. The most likely moves,
+    from the centre outwards, are searched first, and pondering stops as
+    soon as the game changes. The searches share ``AI_PONDER_TIME_LIMIT``
+    seconds, each taking an equal part of what is left and no more than
+    the game's own time limit, and replies not reached in time are left
+    unsearched.
 
-        board = await sync_to_async(lambda: game.board)()
-        if not utils.is_valid_move(board, column, row):
-            raise ValueError("Invalid move")
+    Parameters
+    ----------
+    game_id : str
+        The id of a game in which a human is to move against an AI.
 
-        await sync_to_async(Move.objects.create)(
-            game=game,
-            player=player,
-            row=row,
-            column=column,
+    Returns
+    -------
+    int
+        The number of replies searched.
+
+    """
+    with contextlib.suppress(Game.DoesNotExist):
+        game = Game.objects.select_related(
+            "player_one__algorithm", "player_two__algorithm", "status"
+        ).get(game_id=game_id)
+
+        if game.current_turn_id == game.player_one_id:
+            current, ai = game.player_one, game.player_two
+            human, token = PLAYER_ONE, PLAYER_TWO
+        else:
+            current, ai = game.player_two, game.player_one
+            human, token = PLAYER_TWO, PLAYER_ONE
+
+        if (
+            current.algorithm is not None
+            or ai.algorithm is None
+            or game.status.name != cfs.IN_PROGRESS.value
+        ):
+            return 0
+
+        board = Board(game.board, token)
+        open_columns = board.get_open_columns()
+        replies = [c for c in centre_out(board.columns) if c in open_columns]
+        time_limit = get_time_limit(game, ai.algorithm)
+        deadline = monotonic() + settings.AI_PONDER_TIME_LIMIT
+        searched = 0
+
+        for index, column in enumerate(replies):
+            if (remaining := deadline - monotonic()) <= 0:
+                break
+
+            budget = remaining / (len(replies) - index)
+            if time_limit is not None:
+                budget = min(budget, time_limit)
+
+            if not Game.objects.filter(
+                game_id=game.game_id, updated_at=game.updated_at
+            ).exists():
+                break
+
+            board.drop_token(column, human)
+            if not board.game_over():
+                find_move(
+                    ai.algorithm.code_name,
+                    token,
+                    board.raw,
+                    game.depth,
+                    budget,
+                )
+                searched += 1
+            board.undo_move()
+
+        return searched
+
+    return 0
+
+
+def make_move(
+    game_id: str,
+    player: Player,
+    row: int,
+    column: int,
+    defer_ai_move: bool = False,
+) -> Move:
+    """
+    Validate a move against the game's hot state and commit it.
+
+    A move that cannot be made is rejected without reading the database.
+    A valid move is committed by ``services.commit_move``, which validates
+    it again under the game's lock and writes the new hot state through.
+
+    Raises
+    ------
+    Game.DoesNotExist
+        If the game does not exist.
+
+    ValueError
+        If the move cannot be made.
+
+    """
+    if (state := load_state(game_id)) is None:
+        raise Game.DoesNotExist()
+
+    state.validate(player.player_id, row, column)
+
+    return services.commit_move(game_id, player, row, column, defer_ai_move)
+
+
+async def play_move(
+    game_id: str,
+    player: Player,
+    row: int,
+    column: int,
+    defer_ai_move: bool = False,
+) -> bool:
+    """
+    Play a move made through a websocket.
+
+    The move is validated and committed by ``make_move`` in a single
+    handoff to the thread running synchronous code, as the game is locked
+    in a transaction, which the async ORM does not support.
+
+    """
+    with contextlib.suppress(Game.DoesNotExist):
+        await sync_to_async(make_move)(
+            game_id, player, row, column, defer_ai_move
         )
         return True
 
@@ -92,22 +285,35 @@ async def play_move(
 
 
 async def undo_move(game_id: str, player: Player) -> Optional[Tuple[int, int]]:
-    with contextlib.suppress(Move.DoesNotExist):
-        move: Move = await sync_to_async(
-            Move.objects.filter(
-                game_id=game_id, player=player, is_undone=False
-            ).latest
-        )("created_at")
-
-        if not await sync_to_async(utils.can_undo_move)(move):
+    """
+    Undo a player's move, if it is the last move of the game.
+
+    The last move is read with its game and status in one query and
+    checked in Python; only saving the move, which updates the game,
+    leaves the event loop.
+
+    """
+    try:
+        move = await (
+            Move.objects.select_related("game__status")
+            .filter(game_id=game_id, is_undone=False)
+            .alatest("created_at")
+        )
+    except Move.DoesNotExist:
+        raise ValueError("No moves to undo") from None
+
+    if move.player_id != player.player_id:
+        if await Move.objects.filter(
+            game_id=game_id, player=player, is_undone=False
+        ).aexists():
             raise ValueError("You cannot undo this move")
 
-        column = await sync_to_async(lambda: move.column)()
-        row = await sync_to_async(lambda: move.row)()
+        raise ValueError("No moves to undo")
 
-        move.is_undone = True
-        await sync_to_async(move.save)()
+    if move.game.status.name not in PLAYABLE:
+        raise ValueError("You cannot undo this move")
 
-        return row, column
+    move.is_undone = True
+    await move.asave()
 
-    raise ValueError("No moves to undo")
+    return move.row, move.column
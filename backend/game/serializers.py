@@ -1,6 +1,7 @@
 from core import models
 from core.constants import DEFAULT_COLUMNS, DEFAULT_ROWS, EMPTY
 from core.dataclasses import Status as cfs
+from core.statuses import get_status
 from core.utils import get_username_or_name
 from game.utils import compute_depth
 from rest_framework import serializers
@@ -36,7 +37,7 @@ class CreateGameSerializer(serializers.ModelSerializer):
         columns = validated_data.get("columns", DEFAULT_COLUMNS)
         board = [[EMPTY for _ in range(columns)] for _ in range(rows)]
         validated_data["board"] = board
-        validated_data["status"] = models.Status.objects.get(name=cfs.CREATED)
+        validated_data["status"] = get_status(cfs.CREATED)
         validated_data["current_turn"] = validated_data["player_one"]
 
         if validated_data.get("difficulty_level"):
@@ -62,6 +63,9 @@ class GameSerializer(serializers.ModelSerializer):
     winner_username = serializers.SerializerMethodField()
     created_by_username = serializers.SerializerMethodField()
     status_name = serializers.SerializerMethodField()
+    board = serializers.ListField(
+        child=serializers.ListField(child=serializers.IntegerField())
+    )
 
     class Meta:
         """
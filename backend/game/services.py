@@ -0,0 +1,243 @@
+from uuid import UUID
+
+from core.constants import EMPTY, PLAYER_ONE, PLAYER_TWO
+from core.dataclasses import GameResult
+from core.dataclasses import Status as cfs
+from core.models import EloHistory, Game, Move, Player, Status
+from core.ratings import human_ratings
+from core.statuses import get_status
+from django.db import transaction
+from django.utils import timezone
+
+from game import ai_executor
+from game.elo import EloRating as elo
+from game.state import GameState, forget_state, store_state
+from game.tasks import process_game_update, queue_ai_move, queue_ponder
+from game.utils import is_board_full, is_winner
+
+PLAYER_STATS_FIELDS = [
+    "wins",
+    "losses",
+    "draws",
+    "total_games",
+    "elo",
+    "updated_at",
+]
+
+
+def validate_move(game: Game, player: Player, row: int, column: int) -> None:
+    """
+    Check a player may make a move in a game.
+
+    Raises
+    ------
+    ValueError
+        If the move cannot be made, with the reason as the message.
+
+    """
+    GameState.from_game(game).validate(player.player_id, row, column)
+
+
+def commit_move(
+    game_id: str,
+    player: Player,
+    row: int,
+    column: int,
+    defer_ai_move: bool = False,
+) -> Move:
+    """
+    Validate and play a move, updating the game in a single transaction.
+
+    The game is locked and read once, together with its status and
+    players, the move is inserted, and the game is saved once. A move that
+    ends the game also updates both players with one query and creates
+    their Elo histories with another. Tasks triggered by the move are
+    queued once the transaction commits.
+
+    Parameters
+    ----------
+    game_id : str
+        The id of the game.
+
+    player : Player
+        The player making the move.
+
+    row : int
+        The row of the move.
+
+    column : int
+        The column of the move.
+
+    defer_ai_move : bool
+        Whether the caller plays the AI's reply itself, if the AI executor
+        accepts the game, instead of queueing a task for it.
+
+    Returns
+    -------
+    Move
+        The move played.
+
+    Raises
+    ------
+    Game.DoesNotExist
+        If the game does not exist.
+
+    ValueError
+        If the move cannot be made.
+
+    """
+    game = None
+
+    try:
+        with transaction.atomic():
+            game = (
+                Game.objects.select_for_update(of=("self",))
+                .select_related(
+                    "status", "player_one__algorithm", "player_two__algorithm"
+                )
+                .get(game_id=game_id)
+            )
+
+            validate_move(game, player, row, column)
+
+            move = Move(game=game, player=player, row=row, column=column)
+            # The game is updated below rather than by the post_save signal.
+            move.committed = True
+            move.save()
+
+            apply_move(game, move, defer_ai_move)
+    except Exception:
+        # The hot state is only stale once the game has been read.
+        if game is not None:
+            forget_state(game.game_id)
+        raise
+
+    return move
+
+
+def lock_game(move: Move) -> Game:
+    return (
+        Game.objects.select_for_update(of=("self",))
+        .select_related(
+            "status", "player_one__algorithm", "player_two__algorithm"
+        )
+        .get(game_id=UUID(str(move.game_id)))
+    )
+
+
+def apply_move(game: Game, move: Move, defer_ai_move: bool = False) -> None:
+    """
+    Update and save a locked game for a move, and queue the next AI turn.
+
+    """
+    update_board_and_status(game, move)
+    game.save()
+    store_state(game)
+
+    if game.current_turn.algorithm_id and not (
+        defer_ai_move and ai_executor.accepts(game)
+    ):
+        transaction.on_commit(lambda: queue_ai_move(game.game_id))
+    elif move.player.algorithm_id and not move.is_undone:
+        queue_ponder(game.game_id)
+
+
+def update_board_and_status(game: Game, move: Move) -> None:
+    token = EMPTY
+    game.current_turn = move.player
+    if not move.is_undone:
+        token = PLAYER_ONE if move.player == game.player_one else PLAYER_TWO
+        game.board[move.row][move.column] = token
+
+        if is_winner(token, game.board, move.column, move.row):
+            handle_winner(game, move.player)
+
+        elif is_board_full(game.board):
+            handle_draw(game)
+        else:
+            game.current_turn = get_next_turn(game, token)
+
+        if game.status.name == cfs.CREATED.value:
+            game.status = get_status(cfs.IN_PROGRESS.value)
+            game.start_time = timezone.now()
+
+    game.board[move.row][move.column] = token
+
+
+def handle_winner(game: Game, player: Player) -> None:
+    game.winner = player
+    game.status = get_status_by_player(player, game)
+    game.end_time = timezone.now()
+    update_players_stats(game)
+    transaction.on_commit(lambda: process_game_update.delay(game.game_id))
+
+
+def handle_draw(game: Game) -> None:
+    game.status = get_status(cfs.DRAW.value)
+    game.end_time = timezone.now()
+    update_players_stats(game)
+    transaction.on_commit(lambda: process_game_update.delay(game.game_id))
+
+
+def get_status_by_player(player: Player, game: Game) -> Status:
+    return get_status(
+        cfs.P1W.value if player == game.player_one else cfs.P2W.value
+    )
+
+
+def get_next_turn(game: Game, token: int) -> Player:
+    return game.player_one if token == PLAYER_TWO else game.player_two
+
+
+def update_players_stats(game: Game) -> None:
+    player_one: Player = game.player_one
+    player_two: Player = game.player_two
+
+    match game.status.name:
+        case cfs.DRAW.value:
+            result = GameResult.DRAW
+            player_one.draws += 1
+            player_two.draws += 1
+        case cfs.P1W.value:
+            result = GameResult.WIN
+            player_one.wins += 1
+            player_two.losses += 1
+        case _:
+            result = GameResult.LOSS
+            player_one.losses += 1
+            player_two.wins += 1
+
+    player_one.total_games += 1
+    player_two.total_games += 1
+
+    old_elo_one = player_one.elo
+    old_elo_two = player_two.elo
+
+    elo.update_player_elo(player_one, player_two, result)
+
+    player_one.updated_at = player_two.updated_at = timezone.now()
+    Player.objects.bulk_update(
+        [player_one, player_two], PLAYER_STATS_FIELDS
+    )
+    # bulk_update sends no post_save, so the ratings are recorded here.
+    transaction.on_commit(
+        lambda: human_ratings.update([player_one, player_two])
+    )
+
+    EloHistory.objects.bulk_create(
+        [
+            elo_history(player_one, game, old_elo_one),
+            elo_history(player_two, game, old_elo_two),
+        ]
+    )
+
+
+def elo_history(player: Player, game: Game, old_elo: int) -> EloHistory:
+    # bulk_create skips EloHistory.save, which sets the delta.
+    return EloHistory(
+        player=player,
+        old_elo=old_elo,
+        new_elo=player.elo,
+        delta=player.elo - old_elo,
+        game=game,
+    )
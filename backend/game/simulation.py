@@ -0,0 +1,339 @@
+import platform
+import random
+from contextlib import contextmanager, nullcontext
+from time import perf_counter
+from typing import Any, Dict, Iterable, Iterator, List, Sequence
+
+from ai.benchmark import percentile
+from core.constants import (
+    DEFAULT_COLUMNS,
+    DEFAULT_ROWS,
+    MATCHMAKING_PARTITIONS,
+    MATCHMAKING_PLAYERS,
+)
+from core.dataclasses import Status as cfs
+from core.models import Game, MatchMakingQueue, Player, Status
+from core.redis import redis_client
+from core.statuses import statuses
+from django.core.exceptions import ImproperlyConfigured
+from django.db import DEFAULT_DB_ALIAS, connection
+from django.test.utils import setup_databases, teardown_databases
+from redis.client import Pipeline
+
+from game.match_making import (
+    Partition,
+    add_player_to_queue,
+    find_match_for_player,
+    match_queue,
+)
+
+# Simulated players are queued in their own region, so they are never
+# matched with real players.
+SIMULATION_REGION = "simulation"
+
+DISTRIBUTIONS = ("normal", "uniform")
+
+
+class CommandCounter:
+    """
+    Count the Redis commands sent by a client while in use.
+
+    A pipeline counts each of its commands, but a single round trip.
+
+    """
+
+    def __init__(self, client) -> None:
+        self.client = client
+        self.commands = 0
+        self.round_trips = 0
+
+    def __enter__(self) -> "CommandCounter":
+        counter = self
+        execute_command = self.client.execute_command
+        pipeline_execute = Pipeline.execute
+
+        def count_command(*args, **options):
+            counter.commands += 1
+            counter.round_trips += 1
+            return execute_command(*args, **options)
+
+        def count_pipeline(pipe, *args, **kwargs):
+            if pipe.command_stack:
+                counter.commands += len(pipe.command_stack)
+                counter.round_trips += 1
+            return pipeline_execute(pipe, *args, **kwargs)
+
+        self._execute_command = execute_command
+        self._pipeline_execute = pipeline_execute
+        self.client.execute_command = count_command
+        Pipeline.execute = count_pipeline
+
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.client.execute_command = self._execute_command
+        Pipeline.execute = self._pipeline_execute
+
+
+def sample_ratings(
+    rng: random.Random,
+    count: int,
+    distribution: str,
+    mean: float,
+    spread: float,
+) -> List[int]:
+    """
+    Return the Elo ratings of simulated players.
+
+    Ratings are drawn from a normal distribution with a standard deviation
+    of ``spread``, or uniformly within ``spread`` of the mean.
+
+    """
+    if distribution not in DISTRIBUTIONS:
+        raise ValueError(f"Choose from {DISTRIBUTIONS}")
+
+    if distribution == "normal":
+        return [round(rng.gauss(mean, spread)) for _ in range(count)]
+
+    return [
+        round(rng.uniform(mean - spread, mean + spread)) for _ in range(count)
+    ]
+
+
+@contextmanager
+def scratch_environment() -> Iterator[None]:
+    """
+    Point Redis and the database at throwaway copies while in use.
+
+    Redis commands go to an empty in-memory fakeredis server, and queries
+    to a new database created and migrated as the test runner does, with
+    the statuses the queue needs. Both are dropped afterwards, so nothing
+    the simulation does is seen by the scheduled sweeps or kept in the
+    configured database.
+
+    Raises
+    ------
+    ImproperlyConfigured
+        If fakeredis is not installed.
+
+    """
+    try:
+        import fakeredis
+    except ImportError:
+        raise ImproperlyConfigured(
+            "fakeredis is needed to simulate matchmaking away from the "
+            "configured Redis"
+        ) from None
+
+    pool = redis_client.connection_pool
+    old_config = setup_databases(
+        verbosity=0,
+        interactive=False,
+        aliases={DEFAULT_DB_ALIAS},
+        serialized_aliases=set(),
+    )
+
+    try:
+        redis_client.connection_pool = fakeredis.FakeStrictRedis(
+            server=fakeredis.FakeServer(), decode_responses=True
+        ).connection_pool
+        statuses.invalidate()
+        Status.objects.bulk_create(
+            [Status(name=status.value) for status in cfs],
+            ignore_conflicts=True,
+        )
+
+        yield
+    finally:
+        redis_client.connection_pool = pool
+        statuses.invalidate()
+        teardown_databases(old_config, verbosity=0)
+
+
+def clear_simulation(
+    players: Sequence[Player], partitions: Iterable[Partition]
+) -> None:
+    """
+    Remove simulated players, their games and their partitions.
+
+    """
+    player_ids = [player.player_id for player in players]
+
+    pipe = redis_client.pipeline()
+    for partition in partitions:
+        pipe.delete(
+            partition.queue, partition.joined, partition.stats, partition.lock
+        )
+        pipe.srem(MATCHMAKING_PARTITIONS, partition.name)
+    if player_ids:
+        pipe.hdel(MATCHMAKING_PLAYERS, *map(str, player_ids))
+    pipe.execute()
+
+    MatchMakingQueue.objects.filter(player_id__in=player_ids).delete()
+    Game.objects.filter(player_one_id__in=player_ids).delete()
+    Player.objects.filter(player_id__in=player_ids).delete()
+
+
+def simulate_matchmaking(
+    players: int = 1000,
+    arrival_rate: float = 50.0,
+    distribution: str = "normal",
+    elo_mean: float = 1200,
+    elo_spread: float = 200,
+    sweep_interval: float = 10.0,
+    drain: float = 60.0,
+    rows: int = DEFAULT_ROWS,
+    columns: int = DEFAULT_COLUMNS,
+    seed: int = 0,
+    scratch: bool = True,
+) -> Dict[str, Any]:
+    """
+    Drive the matchmaking queue with synthetic players.
+
+    Players arrive as a Poisson process on a simulated clock. Each is
+    queued and matched straight away, as a match request does, and every
+    ``sweep_interval`` simulated seconds the whole queue is swept, as the
+    scheduled task does, until ``drain`` seconds after the last arrival.
+    The players are queued in a region of their own and deleted
+    afterwards, with their games.
+
+    Parameters
+    ----------
+    players : int
+        The number of players that arrive.
+
+    arrival_rate : float
+        The mean number of players that arrive each simulated second.
+
+    distribution : str
+        The distribution of the ratings of the players, "normal" or
+        "uniform".
+
+    elo_mean : float
+        The mean rating of the players.
+
+    elo_spread : float
+        The standard deviation of the ratings, or the largest distance of
+        a uniform rating from the mean.
+
+    sweep_interval : float
+        The simulated seconds between sweeps of the queue.
+
+    drain : float
+        The simulated seconds swept after the last player arrives.
+
+    rows : int
+        The number of rows of the board every player asks for.
+
+    columns : int
+        The number of columns of the board every player asks for.
+
+    seed : int
+        The seed of the ratings and arrival times.
+
+    scratch : bool
+        Whether to run in a ``scratch_environment``. Only turn it off when
+        Redis and the database are already throwaway ones, as in tests.
+
+    Returns
+    -------
+    Dict[str, Any]
+        The players matched, their wait percentiles in simulated seconds,
+        the rating gap of the games, the matches per second of wall time
+        and the Redis commands per match.
+
+    """
+    rng = random.Random(seed)
+    ratings = sample_ratings(rng, players, distribution, elo_mean, elo_spread)
+
+    arrivals = []
+    clock = 0.0
+    for _ in ratings:
+        clock += rng.expovariate(arrival_rate)
+        arrivals.append(clock)
+
+    partitions = set()
+    games: List[Game] = []
+    waits: List[float] = []
+    gaps: List[int] = []
+
+    def record(matched: Sequence[Game], now: float) -> None:
+        for game in matched:
+            one, two = arrived[game.player_one_id], arrived[game.player_two_id]
+            waits.extend((now - one[0], now - two[0]))
+            gaps.append(abs(one[1] - two[1]))
+        games.extend(matched)
+
+    def sweep(now: float) -> None:
+        for partition in partitions:
+            record(match_queue(partition, now), now)
+
+    with scratch_environment() if scratch else nullcontext():
+        created = Player.objects.bulk_create(
+            [Player(elo=rating) for rating in ratings]
+        )
+        arrived = {
+            player.player_id: (at, player.elo)
+            for player, at in zip(created, arrivals)
+        }
+
+        try:
+            with CommandCounter(redis_client) as counter:
+                start = perf_counter()
+                next_sweep = sweep_interval
+
+                for player, at in zip(created, arrivals):
+                    while next_sweep <= at:
+                        sweep(next_sweep)
+                        next_sweep += sweep_interval
+
+                    partition = Partition.for_player(
+                        player.elo, rows, columns, SIMULATION_REGION
+                    )
+                    partitions.add(partition)
+                    add_player_to_queue(
+                        player.player_id, player.elo, partition, at
+                    )
+
+                    if game := find_match_for_player(player.player_id, now=at):
+                        record([game], at)
+
+                while next_sweep <= clock + drain:
+                    sweep(next_sweep)
+                    next_sweep += sweep_interval
+
+                elapsed = perf_counter() - start
+        finally:
+            clear_simulation(created, partitions)
+
+    matches = len(games)
+
+    return {
+        "environment": {
+            "python": platform.python_version(),
+            "database": connection.vendor,
+            "machine": platform.machine(),
+        },
+        "players": players,
+        "partitions": len(partitions),
+        "simulated_seconds": round(next_sweep - sweep_interval, 3),
+        "matches": matches,
+        "unmatched": players - 2 * matches,
+        "wait_seconds": {
+            f"p{q}": round(percentile(waits, q), 3) for q in (50, 95, 99)
+        }
+        | {"max": round(max(waits, default=0.0), 3)},
+        "elo_gap": {
+            "mean": round(sum(gaps) / matches, 1) if matches else 0.0,
+            "p95": percentile(gaps, 95),
+            "max": max(gaps, default=0),
+        },
+        "seconds": round(elapsed, 4),
+        "matches_per_second": round(matches / elapsed) if elapsed else 0,
+        "redis_commands_per_match": (
+            round(counter.commands / matches, 1) if matches else 0.0
+        ),
+        "redis_round_trips_per_match": (
+            round(counter.round_trips / matches, 1) if matches else 0.0
+        ),
+    }
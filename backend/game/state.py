@@ -0,0 +1,165 @@
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Union
+from uuid import UUID
+
+from core.codecs import pack_board, unpack_board
+from core.constants import EMPTY, GAME_STATE
+from core.dataclasses import Status as cfs
+from core.models import Game
+from core.redis import redis_client
+from django.conf import settings
+
+from game.utils import is_board_full, is_valid_move
+
+PLAYABLE = (cfs.IN_PROGRESS.value, cfs.CREATED.value)
+
+
+@dataclass
+class GameState:
+    """
+    The state of a game that moves are validated against.
+
+    """
+
+    game_id: str
+    rows: int
+    columns: int
+    board: List[List[int]]
+    player_one: str
+    player_two: str
+    current_turn: str
+    status: str
+    moves: int
+
+    @classmethod
+    def from_game(cls, game: Game) -> "GameState":
+        return cls(
+            game_id=str(game.game_id),
+            rows=game.rows,
+            columns=game.columns,
+            board=game.board,
+            player_one=str(game.player_one_id),
+            player_two=str(game.player_two_id),
+            current_turn=str(game.current_turn_id),
+            status=game.status.name,
+            moves=sum(cell != EMPTY for row in game.board for cell in row),
+        )
+
+    @classmethod
+    def from_hash(cls, game_id: str, data: Dict[str, str]) -> "GameState":
+        rows, columns = int(data["rows"]), int(data["columns"])
+
+        return cls(
+            game_id=str(game_id),
+            rows=rows,
+            columns=columns,
+            board=unpack_board(bytes.fromhex(data["board"]), rows, columns),
+            player_one=data["player_one"],
+            player_two=data["player_two"],
+            current_turn=data["current_turn"],
+            status=data["status"],
+            moves=int(data["moves"]),
+        )
+
+    def to_hash(self) -> Dict[str, Union[int, str]]:
+        return {
+            "rows": self.rows,
+            "columns": self.columns,
+            "board": pack_board(self.board).hex(),
+            "player_one": self.player_one,
+            "player_two": self.player_two,
+            "current_turn": self.current_turn,
+            "status": self.status,
+            "moves": self.moves,
+        }
+
+    def validate(self, player_id: str, row: int, column: int) -> None:
+        """
+        Check a player may make a move.
+
+        Raises
+        ------
+        ValueError
+            If the move cannot be made, with the reason as the message.
+
+        """
+        player_id = str(player_id)
+
+        if player_id not in (self.player_one, self.player_two):
+            raise ValueError("You are not a player in this game")
+
+        if self.status not in PLAYABLE:
+            raise ValueError("Game is not in progress")
+
+        if self.current_turn != player_id:
+            raise ValueError("It is not your turn")
+
+        if is_board_full(self.board):
+            raise ValueError("Board is full")
+
+        if column < 0 or row < 0:
+            raise ValueError("Column and Row are required")
+
+        if column >= self.columns or row >= self.rows:
+            raise ValueError(
+                f"(Column,Row) must be less than ({self.columns},{self.rows})"
+            )
+
+        if not is_valid_move(self.board, column, row):
+            raise ValueError("Invalid move")
+
+
+def state_key(game_id: str) -> str:
+    return f"{GAME_STATE}:{UUID(str(game_id))}"
+
+
+def store_state(game: Game) -> GameState:
+    """
+    Write the state of a game to Redis.
+
+    Called whenever a move is applied to a game, so the hot state is
+    written through with the database.
+
+    """
+    state = GameState.from_game(game)
+    key = state_key(state.game_id)
+
+    pipe = redis_client.pipeline()
+    pipe.hset(key, mapping=state.to_hash())
+    pipe.expire(key, settings.GAME_STATE_TTL)
+    pipe.execute()
+
+    return state
+
+
+def forget_state(game_id: str) -> None:
+    redis_client.delete(state_key(game_id))
+
+
+def load_state(game_id: str) -> Optional[GameState]:
+    """
+    Return the hot state of a game.
+
+    The state is read from Redis, and only read from the database, and
+    stored, when Redis does not hold it.
+
+    Parameters
+    ----------
+    game_id : str
+        The id of the game.
+
+    Returns
+    -------
+    Optional[GameState]
+        The state of the game, or None if the game does not exist.
+
+    """
+    if data := redis_client.hgetall(state_key(game_id)):
+        return GameState.from_hash(game_id, data)
+
+    try:
+        game = Game.objects.select_related("status").get(game_id=game_id)
+    except Game.DoesNotExist:
+        return None
+
+    return store_state(game)
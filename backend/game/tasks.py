@@ -3,50 +3,77 @@ import contextlib
 from asgiref.sync import async_to_sync
 from celery import shared_task
 from channels.layers import get_channel_layer
-from core.constants import MATCHMAKING_QUEUE
+from core.constants import AI_MOVE_BATCH, AI_MOVE_BATCH_LOCK
 from core.models import GameInvitation
 from core.redis import redis_client
 from core.utils import get_username_or_name
-from game.match_making import find_match_for_player, notify_players
-from game.move import compute_ai_move, get_game_status
+from django.conf import settings
+from django.db import transaction
+from game.match_making import (
+    Partition,
+    active_partitions,
+    find_match_for_player,
+    match_queue,
+    notify_players,
+    prune_partitions,
+)
+from game import move
+
+# Seconds after which a batch lock is abandoned if its task never ran.
+AI_MOVE_BATCH_LOCK_TIMEOUT = 60
+# Seconds after which a partition lock is abandoned if its worker died.
+MATCHMAKING_LOCK_TIMEOUT = 60
 
 
 @shared_task(name="game.tasks.process_matchmaking")
 def process_matchmaking():
-    run = 0
-    message = "Matchmaking complete"
+    partitions = active_partitions()
+    prune_partitions(partitions)
 
-    while True:
-        player_ids = redis_client.zrange(
-            MATCHMAKING_QUEUE, 0, 0, withscores=False
-        )
-        if not player_ids:
-            break
+    partitions = active_partitions()
+    if not partitions:
+        return "No players in the queue"
+
+    for partition in partitions:
+        process_partition_matchmaking.delay(partition.name)
+
+    return f"Matching {len(partitions)} partitions"
 
-        player_id = player_ids[0]
 
-        if game := find_match_for_player(player_id):
-            run = 2
-            notify_players(game)
+@shared_task(name="game.tasks.process_partition_matchmaking")
+def process_partition_matchmaking(name):
+    partition = Partition.from_name(name)
 
-        run = 1 if run == 0 else run
+    # Only one worker matches a partition at a time; the others skip it.
+    if not redis_client.set(
+        partition.lock, 1, nx=True, ex=MATCHMAKING_LOCK_TIMEOUT
+    ):
+        return "Partition is being matched"
 
-    match run:
-        case 0:
-            message = "No players in the queue"
-        case 1:
-            message = "Matchmaking Completed"
-        case 2:
-            message = "Matches Found"
+    try:
+        games = match_queue(partition)
+    finally:
+        redis_client.delete(partition.lock)
 
-    return message
+    notify_players(games)
+
+    return "Matches Found" if games else "Matchmaking Completed"
+
+
+@shared_task(name="game.tasks.process_player_matchmaking")
+def process_player_matchmaking(player_id):
+    if game := find_match_for_player(player_id):
+        notify_players([game])
+        return "Matches Found"
+
+    return "Matchmaking Completed"
 
 
 @shared_task(
     name="game.tasks.compute_ai_move",
 )
 def process_ai_move(game_id):
-    if position := compute_ai_move(game_id):
+    if position := move.compute_ai_move(game_id):
         player, row, column = position
         channel_layer = get_channel_layer()
         async_to_sync(channel_layer.group_send)(
@@ -62,9 +89,87 @@ def process_ai_move(game_id):
         )
 
 
+@shared_task(name="game.tasks.compute_ai_moves")
+def process_ai_moves():
+    # Release the lock before draining, so a turn queued from now on
+    # schedules another batch instead of waiting for this one.
+    redis_client.delete(AI_MOVE_BATCH_LOCK)
+
+    game_ids = redis_client.spop(AI_MOVE_BATCH, settings.AI_MOVE_BATCH_SIZE)
+    if not game_ids:
+        return
+
+    if redis_client.scard(AI_MOVE_BATCH):
+        process_ai_moves.delay()
+
+    moves = move.compute_ai_moves(
+        game_ids, settings.AI_MOVE_BATCH_TIME_LIMIT
+    )
+    channel_layer = get_channel_layer()
+
+    for game_id, player, row, column in moves:
+        async_to_sync(channel_layer.group_send)(
+            f"game_{game_id}",
+            {
+                "type": "ai_move",
+                "message": {
+                    "player": player,
+                    "row": row,
+                    "column": column,
+                },
+            },
+        )
+
+
+def queue_ai_move(game_id) -> None:
+    """
+    Schedule the AI move of a game.
+
+    Without a batch window each move gets its own task. Otherwise the game
+    is added to the pending batch, and the first game of a batch schedules
+    the task that computes it once the window has passed.
+
+    Parameters
+    ----------
+    game_id : str
+        The id of the game whose turn it is for an AI player.
+
+    """
+    window = settings.AI_MOVE_BATCH_WINDOW
+
+    if window <= 0:
+        process_ai_move.delay(game_id)
+        return
+
+    redis_client.sadd(AI_MOVE_BATCH, str(game_id))
+
+    if redis_client.set(
+        AI_MOVE_BATCH_LOCK,
+        str(game_id),
+        nx=True,
+        ex=int(window) + AI_MOVE_BATCH_LOCK_TIMEOUT,
+    ):
+        process_ai_moves.apply_async(countdown=window)
+
+
+@shared_task(name="game.tasks.ponder_ai_move")
+def process_ponder(game_id):
+    return move.ponder_ai_replies(game_id)
+
+
+def queue_ponder(game_id) -> None:
+    """
+    Schedule pondering on a game once the AI's move is committed, if
+    pondering is enabled.
+
+    """
+    if settings.AI_PONDERING_ENABLED:
+        transaction.on_commit(lambda: process_ponder.delay(game_id))
+
+
 @shared_task(name="game.tasks.game_update")
 def process_game_update(game_id):
-    if status := get_game_status(game_id):
+    if status := move.get_game_status(game_id):
         channel_layer = get_channel_layer()
         async_to_sync(channel_layer.group_send)(
             f"game_{game_id}",
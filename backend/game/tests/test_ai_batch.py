@@ -0,0 +1,185 @@
+from unittest.mock import patch
+
+from core.constants import (
+    AI_MOVE_BATCH,
+    AI_MOVE_BATCH_LOCK,
+    EMPTY,
+    PLAYER_TWO,
+)
+from core.dataclasses import Algorithm as cfa
+from core.models import Game, Move, Player
+from core.redis import redis_client
+from core.tests.helper import create_algorithm, create_status, create_user
+from django.test import TestCase, override_settings
+
+from game import services
+from game.move import compute_ai_moves, search_ai_move
+from game.tasks import queue_ai_move
+
+
+class AIMoveBatchTests(TestCase):
+    """
+    Tests for computing the AI moves of several games together.
+
+    """
+
+    def setUp(self) -> None:
+        self.created = create_status("Created")
+        create_status("In Progress")
+        self.ai = Player.objects.get(
+            algorithm=create_algorithm("Alpha-Beta", cfa.ALPHA_BETA.value)
+        )
+        self.games = [
+            self.create_ai_turn(
+                create_user(f"user{i}", email=f"user{i}@example.com")
+            )
+            for i in range(3)
+        ]
+        redis_client.delete(AI_MOVE_BATCH, AI_MOVE_BATCH_LOCK)
+
+    def tearDown(self) -> None:
+        redis_client.delete(AI_MOVE_BATCH, AI_MOVE_BATCH_LOCK)
+
+    def create_ai_turn(self, user) -> Game:
+        human = Player.objects.get(user=user)
+        game = Game.objects.create(
+            player_one=human,
+            player_two=self.ai,
+            status=self.created,
+            current_turn=human,
+            created_by=human,
+            depth=2,
+        )
+        Move.objects.create(game=game, player=human, row=5, column=3)
+        game.refresh_from_db()
+
+        return game
+
+    def test_compute_ai_moves(self) -> None:
+        """
+        Test every game gets its move, committed through the service.
+
+        """
+        ids = [str(game.game_id) for game in self.games]
+
+        with patch(
+            "game.services.commit_move", wraps=services.commit_move
+        ) as commit_move:
+            played = list(compute_ai_moves(ids))
+
+        self.assertEqual(commit_move.call_count, 3)
+        self.assertCountEqual([move[0] for move in played], ids)
+
+        for game in self.games:
+            game.refresh_from_db()
+            _, token, row, column = next(
+                move for move in played if move[0] == str(game.game_id)
+            )
+
+            self.assertEqual(token, PLAYER_TWO)
+            self.assertEqual(game.board[row][column], PLAYER_TWO)
+            self.assertEqual(game.current_turn, game.player_one)
+            self.assertEqual(
+                Move.objects.filter(game=game, player=self.ai).count(), 1
+            )
+
+    def test_compute_ai_moves_revalidates(self) -> None:
+        """
+        Test a move searched on a game that changed meanwhile is skipped.
+
+        """
+        game = self.games[0]
+
+        def undo_during_search(searched, table=None):
+            position = search_ai_move(searched, table)
+            human_move = Move.objects.get(game=game)
+            human_move.is_undone = True
+            human_move.save()
+            return position
+
+        with patch(
+            "game.move.search_ai_move", side_effect=undo_during_search
+        ):
+            played = list(compute_ai_moves([str(game.game_id)]))
+
+        game.refresh_from_db()
+        self.assertEqual(played, [])
+        self.assertFalse(Move.objects.filter(player=self.ai).exists())
+        self.assertTrue(
+            all(cell == EMPTY for row in game.board for cell in row)
+        )
+
+    def test_compute_ai_moves_failed_game(self) -> None:
+        """
+        Test a game whose search fails is queued again and the others
+        still get their moves.
+
+        """
+        failed = self.games[1]
+
+        def fail_one(searched, table=None):
+            if searched.game_id == failed.game_id:
+                raise RuntimeError("search failed")
+            return search_ai_move(searched, table)
+
+        with patch("game.move.search_ai_move", side_effect=fail_one), patch(
+            "game.tasks.queue_ai_move"
+        ) as queue, self.assertLogs("game.move", "ERROR"):
+            played = list(
+                compute_ai_moves([str(game.game_id) for game in self.games])
+            )
+
+        self.assertCountEqual(
+            [game_id for game_id, *_ in played],
+            [str(self.games[0].game_id), str(self.games[2].game_id)],
+        )
+        queue.assert_called_once_with(failed.game_id)
+        self.assertFalse(
+            Move.objects.filter(game=failed, player=self.ai).exists()
+        )
+
+    def test_compute_ai_moves_time_limit(self) -> None:
+        """
+        Test games not reached within the time limit are queued again.
+
+        """
+        ids = [str(game.game_id) for game in self.games]
+
+        with patch("game.tasks.queue_ai_move") as queue:
+            played = list(compute_ai_moves(ids, time_limit=0))
+
+        self.assertEqual(played, [])
+        self.assertCountEqual(
+            [str(call.args[0]) for call in queue.call_args_list], ids
+        )
+        self.assertFalse(Move.objects.filter(player=self.ai).exists())
+
+    def test_compute_ai_moves_skips_human_turns(self) -> None:
+        """
+        Test games waiting on a human are left alone.
+
+        """
+        game = self.games[0]
+        game.current_turn = game.player_one
+        game.save()
+
+        played = list(compute_ai_moves([str(game.game_id)]))
+
+        self.assertEqual(played, [])
+        self.assertFalse(Move.objects.filter(player=self.ai).exists())
+
+    @override_settings(AI_MOVE_BATCH_WINDOW=0.5)
+    def test_queue_ai_move_schedules_one_batch(self) -> None:
+        """
+        Test only the first game queued in a window schedules a task.
+
+        """
+        with patch("game.tasks.process_ai_moves.apply_async") as apply:
+            for game in self.games:
+                queue_ai_move(game.game_id)
+
+        apply.assert_called_once_with(countdown=0.5)
+        self.assertEqual(
+            redis_client.smembers(AI_MOVE_BATCH),
+            {str(game.game_id) for game in self.games},
+        )
@@ -0,0 +1,166 @@
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from unittest.mock import patch
+
+from asgiref.sync import async_to_sync
+from channels.layers import get_channel_layer
+from core.constants import PLAYER_ONE, PLAYER_TWO
+from core.dataclasses import Algorithm as cfa
+from core.models import Game, Move, Player
+from core.tests.helper import create_algorithm, create_status, create_user
+from django.test import TestCase, override_settings
+
+from game import ai_executor
+from game.move import play_move
+
+
+@override_settings(AI_EXECUTOR_ENABLED=True, AI_EXECUTOR_MAX_DEPTH=2)
+class AIExecutorTests(TestCase):
+    """
+    Tests for playing AI moves in the ASGI process.
+
+    """
+
+    def setUp(self) -> None:
+        create_status("Created")
+        create_status("In Progress")
+        self.human = Player.objects.get(user=create_user())
+        self.ai = Player.objects.get(
+            algorithm=create_algorithm("Alpha-Beta", cfa.ALPHA_BETA.value)
+        )
+        self.game = Game.objects.create(
+            player_one=self.human,
+            player_two=self.ai,
+            status=create_status("Created"),
+            current_turn=self.human,
+            created_by=self.human,
+            depth=2,
+        )
+
+    def test_accepts_shallow_searches(self) -> None:
+        """
+        Test only searches up to the maximum depth are accepted.
+
+        """
+        self.assertTrue(ai_executor.accepts(self.game))
+
+        self.game.depth = 3
+        self.assertFalse(ai_executor.accepts(self.game))
+
+        with override_settings(AI_EXECUTOR_ENABLED=False):
+            self.game.depth = 1
+            self.assertFalse(ai_executor.accepts(self.game))
+
+    @patch("game.services.queue_ai_move")
+    def test_deferred_move_skips_celery(self, queue_ai_move) -> None:
+        """
+        Test a websocket move leaves the AI's reply to the executor.
+
+        """
+        with self.captureOnCommitCallbacks(execute=True):
+            async_to_sync(play_move)(
+                self.game.game_id, self.human, 5, 3, defer_ai_move=True
+            )
+
+        queue_ai_move.assert_not_called()
+
+        Game.objects.filter(game_id=self.game.game_id).update(depth=5)
+        with self.captureOnCommitCallbacks(execute=True):
+            async_to_sync(play_move)(
+                self.game.game_id, self.ai, 4, 3, defer_ai_move=True
+            )
+            async_to_sync(play_move)(
+                self.game.game_id, self.human, 3, 3, defer_ai_move=True
+            )
+
+        queue_ai_move.assert_called_once_with(self.game.game_id)
+
+    def test_play_ai_move(self) -> None:
+        """
+        Test the AI's reply is saved and published on the game's group.
+
+        """
+        Move.objects.create(game=self.game, player=self.human, row=5, column=3)
+        channel_layer = get_channel_layer()
+        channel = async_to_sync(channel_layer.new_channel)()
+        async_to_sync(channel_layer.group_add)(
+            f"game_{self.game.game_id}", channel
+        )
+
+        token, row, column = async_to_sync(ai_executor.play_ai_move)(
+            str(self.game.game_id)
+        )
+        event = async_to_sync(channel_layer.receive)(channel)
+
+        self.game.refresh_from_db()
+        self.assertEqual(token, PLAYER_TWO)
+        self.assertEqual(self.game.board[row][column], PLAYER_TWO)
+        self.assertEqual(self.game.board[5][3], PLAYER_ONE)
+        self.assertEqual(self.game.current_turn, self.human)
+        self.assertEqual(event["type"], "ai_move")
+        self.assertEqual(
+            event["message"], {"player": token, "row": row, "column": column}
+        )
+
+    def test_play_ai_move_on_human_turn(self) -> None:
+        """
+        Test nothing is played when it is not the AI's turn.
+
+        """
+        self.assertIsNone(
+            async_to_sync(ai_executor.play_ai_move)(str(self.game.game_id))
+        )
+        self.assertFalse(Move.objects.exists())
+
+    def test_play_ai_move_missing_game(self) -> None:
+        """
+        Test a deleted game raises the error the consumer sends.
+
+        """
+        game_id = str(self.game.game_id)
+        self.game.delete()
+
+        with self.assertRaisesMessage(ValueError, "Game does not exist"):
+            async_to_sync(ai_executor.play_ai_move)(game_id)
+
+    def test_play_ai_move_search_fails(self) -> None:
+        """
+        Test a failed search leaves the turn to Celery.
+
+        """
+        Move.objects.create(game=self.game, player=self.human, row=5, column=3)
+
+        with ThreadPoolExecutor(1) as pool, patch.object(
+            ai_executor, "get_pool", return_value=pool
+        ), patch.object(
+            ai_executor, "_search", side_effect=BrokenProcessPool
+        ), patch.object(ai_executor, "queue_ai_move") as queue_ai_move:
+            result = async_to_sync(ai_executor.play_ai_move)(
+                str(self.game.game_id)
+            )
+
+        self.assertIsNone(result)
+        queue_ai_move.assert_called_once_with(self.game.game_id)
+        self.assertFalse(Move.objects.filter(player=self.ai).exists())
+
+    def test_play_ai_move_revalidates(self) -> None:
+        """
+        Test a move that is no longer valid is not written.
+
+        """
+        Move.objects.create(game=self.game, player=self.human, row=5, column=3)
+
+        with ThreadPoolExecutor(1) as pool, patch.object(
+            ai_executor, "get_pool", return_value=pool
+        ), patch.object(
+            ai_executor, "_search", return_value=(5, 3)
+        ), patch.object(ai_executor, "queue_ai_move") as queue_ai_move:
+            result = async_to_sync(ai_executor.play_ai_move)(
+                str(self.game.game_id)
+            )
+
+        self.game.refresh_from_db()
+        self.assertIsNone(result)
+        queue_ai_move.assert_called_once_with(self.game.game_id)
+        self.assertEqual(self.game.board[5][3], PLAYER_ONE)
+        self.assertFalse(Move.objects.filter(player=self.ai).exists())
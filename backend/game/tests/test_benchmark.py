@@ -0,0 +1,82 @@
+import json
+from io import StringIO
+from unittest.mock import patch
+
+from core.constants import EMPTY, PLAYER_ONE, PLAYER_TWO
+from core.models import Game, Guest, Move
+from core.tests.helper import create_status
+from django.core.management import call_command
+from django.test import TestCase
+
+from game.benchmark import benchmark_moves, move_sequence
+from game.utils import is_winner
+
+
+class MoveBenchmarkTests(TestCase):
+    """
+    Tests for the websocket move benchmark.
+
+    """
+
+    def setUp(self) -> None:
+        create_status("Created")
+        create_status("In Progress")
+
+    def test_move_sequence(self) -> None:
+        """
+        Test the moves are legal and never end the game.
+
+        """
+        board = [[EMPTY] * 7 for _ in range(6)]
+        moves = move_sequence(30)
+
+        self.assertEqual(len(moves), 30)
+        for index, (row, column) in enumerate(moves):
+            token = PLAYER_ONE if index % 2 == 0 else PLAYER_TWO
+            self.assertEqual(board[row][column], EMPTY)
+            self.assertTrue(row == 5 or board[row + 1][column] != EMPTY)
+
+            board[row][column] = token
+            self.assertFalse(is_winner(token, board, column, row))
+
+    def test_benchmark_moves(self) -> None:
+        """
+        Test every move is played and the games are deleted afterwards.
+
+        """
+        result = benchmark_moves(games=3, moves=4, scratch=False)
+
+        self.assertEqual(result["moves"], 12)
+        self.assertEqual(result["undos"], 3)
+        self.assertGreater(result["moves_per_second"], 0)
+        self.assertFalse(Game.objects.exists())
+        self.assertFalse(Move.objects.exists())
+        self.assertFalse(Guest.objects.exists())
+
+    def test_benchmark_moves_large_board(self) -> None:
+        """
+        Test games are played on boards larger than the default.
+
+        """
+        result = benchmark_moves(
+            games=2, moves=10, rows=7, columns=8, scratch=False
+        )
+
+        self.assertEqual(result["moves"], 20)
+
+    @patch("game.simulation.teardown_databases")
+    @patch("game.simulation.setup_databases", return_value=[])
+    def test_command(self, setup, teardown) -> None:
+        """
+        Test the command prints the results as JSON, from a scratch
+        environment.
+
+        """
+        out = StringIO()
+        call_command(
+            "move_benchmark", "--games", "1", "--moves", "2", stdout=out
+        )
+
+        self.assertEqual(json.loads(out.getvalue())["moves"], 2)
+        setup.assert_called_once()
+        teardown.assert_called_once()
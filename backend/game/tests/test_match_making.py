@@ -0,0 +1,425 @@
+from unittest.mock import patch
+from uuid import uuid4
+
+from asgiref.sync import async_to_sync
+from channels.layers import get_channel_layer
+from core.constants import (
+    MATCHMAKING_PARTITIONS,
+    MATCHMAKING_PLAYERS,
+    MATCHMAKING_QUEUE,
+)
+from core.dataclasses import Status as cfs
+from core.models import Game, MatchMakingQueue
+from core.redis import redis_client
+from core.tests.helper import create_status, create_user
+from django.test import TestCase, override_settings
+
+from game.match_making import (
+    Partition,
+    add_player_to_queue,
+    claim_pair,
+    elo_window,
+    find_match_for_player,
+    find_opponent,
+    match_queue,
+    notify_players,
+    partition_metrics,
+)
+from game.tasks import process_matchmaking, process_partition_matchmaking
+
+
+def clear_queue() -> None:
+    redis_client.delete(
+        MATCHMAKING_PARTITIONS,
+        MATCHMAKING_PLAYERS,
+        *redis_client.keys(f"{MATCHMAKING_QUEUE}:*"),
+    )
+
+
+@override_settings(
+    MATCHMAKING_ELO_WINDOW=50,
+    MATCHMAKING_ELO_WINDOW_GROWTH=10,
+    MATCHMAKING_MAX_ELO_WINDOW=400,
+    MATCHMAKING_CANDIDATES=2,
+)
+class MatchMakingTests(TestCase):
+    """
+    Tests for matching queued players.
+
+    """
+
+    def setUp(self) -> None:
+        clear_queue()
+        for name in (cfs.QUEUED, cfs.MATCHED, cfs.CANCELLED, cfs.CREATED):
+            create_status(name.value)
+
+        self.one = create_user().player
+        self.two = create_user("test2", "password", email="b@b.com").player
+        self.partition = Partition.for_player(1000)
+
+    def tearDown(self) -> None:
+        clear_queue()
+
+    def queue(self, player, elo: int, joined: float = 0) -> None:
+        add_player_to_queue(player.player_id, elo)
+        redis_client.zadd(
+            self.partition.joined, {str(player.player_id): joined}
+        )
+
+    def test_elo_window(self) -> None:
+        """
+        Test the window widens with the time waited, up to a limit.
+
+        """
+        self.assertEqual(elo_window(0), 50)
+        self.assertEqual(elo_window(10), 150)
+        self.assertEqual(elo_window(3600), 400)
+
+    def test_find_opponent(self) -> None:
+        """
+        Test the nearest rated player within the window is chosen.
+
+        """
+        partition = self.partition
+        redis_client.zadd(
+            partition.queue,
+            {"a": 1000, "b": 1030, "c": 980, "d": 1200, "e": 1010},
+        )
+
+        self.assertEqual(find_opponent(partition, "a", 1000, 50), "e")
+        self.assertEqual(find_opponent(partition, "e", 1010, 50), "a")
+        self.assertIsNone(find_opponent(partition, "d", 1200, 50))
+        self.assertEqual(find_opponent(partition, "d", 1200, 200), "b")
+
+    def test_claim_pair(self) -> None:
+        """
+        Test a pair can only be claimed while both players are queued.
+
+        """
+        queue, joined = self.partition.queue, self.partition.joined
+        redis_client.zadd(queue, {"a": 1000, "b": 1010, "c": 990})
+        redis_client.zadd(joined, {"a": 1, "b": 2, "c": 3})
+
+        keys = [queue, joined, MATCHMAKING_PLAYERS]
+
+        self.assertEqual(
+            claim_pair(keys=keys, args=["a", "b", 5]),
+            ["1000", "1", "1010", "2"],
+        )
+        self.assertIsNone(claim_pair(keys=keys, args=["c", "a", 5]))
+        self.assertEqual(redis_client.zrange(queue, 0, -1), ["c"])
+
+    def test_match_queries(self) -> None:
+        """
+        Test a match reads the players, creates the game and updates the
+        queue with one query each.
+
+        The other two queries are the savepoint of the test's transaction.
+
+        """
+        add_player_to_queue(self.one.player_id, self.one.elo)
+        add_player_to_queue(self.two.player_id, self.two.elo)
+
+        with self.assertNumQueries(5):
+            game = find_match_for_player(str(self.one.player_id))
+
+        self.assertIsNotNone(game)
+        self.assertEqual(
+            MatchMakingQueue.objects.filter(
+                game=game, status__name=cfs.MATCHED.value
+            ).count(),
+            2,
+        )
+        self.assertEqual(redis_client.zcard(self.partition.queue), 0)
+        self.assertEqual(redis_client.zcard(self.partition.joined), 0)
+        self.assertFalse(redis_client.hlen(MATCHMAKING_PLAYERS))
+
+    def test_window_widens(self) -> None:
+        """
+        Test players too far apart are matched once they have waited.
+
+        """
+        self.queue(self.one, 1000)
+        self.queue(self.two, 1200)
+
+        self.assertIsNone(find_match_for_player(self.one.player_id, now=10))
+        self.assertIsNotNone(find_match_for_player(self.one.player_id, now=20))
+
+    def test_failed_game_requeues(self) -> None:
+        """
+        Test claimed players are queued again if the game is not created.
+
+        """
+        self.queue(self.one, 1000, joined=3)
+        self.queue(self.two, 1010, joined=4)
+
+        with patch.object(Game.objects, "bulk_create", side_effect=OSError):
+            with self.assertRaises(OSError):
+                find_match_for_player(self.one.player_id, now=5)
+
+        self.assertEqual(
+            redis_client.zrange(
+                self.partition.joined, 0, -1, withscores=True
+            ),
+            [(str(self.one.player_id), 3), (str(self.two.player_id), 4)],
+        )
+        self.assertEqual(redis_client.zcard(self.partition.queue), 2)
+        self.assertEqual(redis_client.hlen(MATCHMAKING_PLAYERS), 2)
+        self.assertFalse(Game.objects.exists())
+
+    def test_match_queue(self) -> None:
+        """
+        Test a sweep matches each player once and leaves the odd one out.
+
+        """
+        three = create_user("test3", "password", email="c@c.com").player
+        self.queue(self.one, 1000, joined=1)
+        self.queue(self.two, 1010, joined=2)
+        self.queue(three, 1020, joined=3)
+
+        games = match_queue(self.partition, now=3)
+
+        self.assertEqual(len(games), 1)
+        self.assertEqual(
+            {games[0].player_one, games[0].player_two}, {self.one, self.two}
+        )
+        self.assertEqual(
+            redis_client.zrange(self.partition.queue, 0, -1),
+            [str(three.player_id)],
+        )
+
+    def test_match_queue_in_batches(self) -> None:
+        """
+        Test the games of a sweep are created with a query per batch.
+
+        """
+        players = [
+            create_user(f"player{i}", "password", email=f"{i}@c.com").player
+            for i in range(6)
+        ]
+        for index, player in enumerate(players):
+            self.queue(player, 1000 + index, joined=index)
+
+        with override_settings(MATCHMAKING_BATCH_SIZE=2):
+            with self.assertNumQueries(10):
+                games = match_queue(self.partition, now=6)
+
+        self.assertEqual(len(games), 3)
+        self.assertEqual(
+            MatchMakingQueue.objects.filter(
+                status__name=cfs.MATCHED.value, game__in=games
+            ).count(),
+            6,
+        )
+        for game in games:
+            self.assertEqual(
+                set(
+                    MatchMakingQueue.objects.filter(game=game).values_list(
+                        "player_id", flat=True
+                    )
+                ),
+                {game.player_one_id, game.player_two_id},
+            )
+
+    def test_match_queue_failed_batch(self) -> None:
+        """
+        Test a failed batch is queued again and the other batches still
+        create their games.
+
+        """
+        players = [
+            create_user(f"player{i}", "password", email=f"{i}@c.com").player
+            for i in range(6)
+        ]
+        for index, player in enumerate(players):
+            self.queue(player, 1000 + index, joined=index)
+
+        bulk_create = Game.objects.bulk_create
+        calls = []
+
+        def fail_second_batch(games, *args, **kwargs):
+            calls.append(games)
+            if len(calls) == 2:
+                raise OSError()
+            return bulk_create(games, *args, **kwargs)
+
+        with override_settings(MATCHMAKING_BATCH_SIZE=1), patch.object(
+            Game.objects, "bulk_create", side_effect=fail_second_batch
+        ), self.assertLogs("game.match_making", "ERROR"):
+            games = match_queue(self.partition, now=6)
+
+        self.assertEqual(len(games), 2)
+        failed = {calls[1][0].player_one_id, calls[1][0].player_two_id}
+        self.assertEqual(
+            set(redis_client.zrange(self.partition.queue, 0, -1)),
+            {str(player_id) for player_id in failed},
+        )
+        self.assertEqual(
+            MatchMakingQueue.objects.filter(
+                status__name=cfs.QUEUED.value
+            ).count(),
+            2,
+        )
+
+    def test_missing_player_requeues_opponent(self) -> None:
+        """
+        Test a player whose opponent no longer exists is queued again.
+
+        """
+        self.queue(self.one, 1000, joined=3)
+        redis_client.zadd(self.partition.queue, {str(uuid4()): 1010})
+
+        self.assertIsNone(find_match_for_player(self.one.player_id, now=5))
+        self.assertEqual(
+            redis_client.zrange(
+                self.partition.joined, 0, -1, withscores=True
+            ),
+            [(str(self.one.player_id), 3)],
+        )
+
+    def test_notify_players(self) -> None:
+        """
+        Test both players of every game are notified.
+
+        """
+        self.queue(self.one, 1000)
+        self.queue(self.two, 1010)
+        game = find_match_for_player(self.one.player_id, now=1)
+
+        channel_layer = get_channel_layer()
+        channels = {}
+        for player in (self.one, self.two):
+            channels[player] = async_to_sync(channel_layer.new_channel)()
+            async_to_sync(channel_layer.group_add)(
+                f"player_{player.player_id}", channels[player]
+            )
+
+        with self.assertNumQueries(0):
+            notify_players([game])
+
+        for channel in channels.values():
+            event = async_to_sync(channel_layer.receive)(channel)
+            self.assertEqual(event["type"], "matchmaking")
+            self.assertEqual(
+                event["message"],
+                {
+                    "game_id": str(game.game_id),
+                    "player_one": "testuser",
+                    "player_two": "test2",
+                },
+            )
+
+    def test_partitions(self) -> None:
+        """
+        Test players are only matched within their partition.
+
+        """
+        large = Partition.for_player(1000, rows=8, columns=9)
+        add_player_to_queue(self.one.player_id, 1000)
+        add_player_to_queue(self.two.player_id, 1010, large)
+
+        self.assertIsNone(find_match_for_player(self.one.player_id, now=60))
+        self.assertEqual(Partition.from_name(large.name), large)
+
+        three = create_user("test3", "password", email="c@c.com").player
+        add_player_to_queue(three.player_id, 1020, large)
+
+        game = find_match_for_player(three.player_id)
+
+        self.assertEqual((game.rows, game.columns), (8, 9))
+        board = Game.objects.get(game_id=game.game_id).board
+        self.assertEqual((len(board), len(board[0])), (8, 9))
+        self.assertEqual({game.player_one, game.player_two}, {self.two, three})
+
+    @override_settings(MATCHMAKING_ELO_BAND=200)
+    def test_elo_bands(self) -> None:
+        """
+        Test players in different Elo bands are queued apart.
+
+        """
+        self.assertEqual(Partition.for_player(1199).band, 5)
+        self.assertEqual(Partition.for_player(1200).band, 6)
+
+        add_player_to_queue(self.one.player_id, 1199)
+        add_player_to_queue(self.two.player_id, 1200)
+
+        self.assertIsNone(find_match_for_player(self.one.player_id, now=60))
+
+    def test_partition_metrics(self) -> None:
+        """
+        Test the depth and wait times of each partition are reported.
+
+        """
+        three = create_user("test3", "password", email="c@c.com").player
+        self.queue(self.one, 1000, joined=10)
+        self.queue(self.two, 1010, joined=20)
+        self.queue(three, 1400, joined=30)
+
+        match_queue(self.partition, now=40)
+
+        metrics = partition_metrics(now=50)[self.partition.name]
+
+        self.assertEqual(metrics["depth"], 1)
+        self.assertEqual(metrics["longest_wait_seconds"], 20)
+        self.assertEqual(metrics["matched"], 2)
+        self.assertGreater(metrics["mean_wait_to_match_seconds"], 0)
+
+    def test_process_matchmaking_fans_out(self) -> None:
+        """
+        Test a sweep queues a task for each partition with players, and
+        forgets empty partitions.
+
+        """
+        large = Partition.for_player(1000, rows=8, columns=9)
+        add_player_to_queue(self.one.player_id, 1000)
+        add_player_to_queue(self.two.player_id, 1000, large)
+        redis_client.sadd(MATCHMAKING_PARTITIONS, "6x6:0:global")
+
+        with patch.object(process_partition_matchmaking, "delay") as delay:
+            process_matchmaking()
+
+        self.assertEqual(
+            sorted(call.args[0] for call in delay.call_args_list),
+            sorted([self.partition.name, large.name]),
+        )
+        self.assertFalse(
+            redis_client.sismember(MATCHMAKING_PARTITIONS, "6x6:0:global")
+        )
+
+    def test_partition_lock(self) -> None:
+        """
+        Test a partition being matched by one worker is skipped by others.
+
+        """
+        self.queue(self.one, 1000)
+        self.queue(self.two, 1010)
+        redis_client.set(self.partition.lock, 1)
+
+        self.assertEqual(
+            process_partition_matchmaking(self.partition.name),
+            "Partition is being matched",
+        )
+        self.assertEqual(redis_client.zcard(self.partition.queue), 2)
+
+        redis_client.delete(self.partition.lock)
+
+        self.assertEqual(
+            process_partition_matchmaking(self.partition.name),
+            "Matches Found",
+        )
+        self.assertFalse(redis_client.exists(self.partition.lock))
+
+    def test_process_matchmaking_single_player(self) -> None:
+        """
+        Test a sweep with one queued player ends without a match.
+
+        """
+        self.assertEqual(process_matchmaking(), "No players in the queue")
+
+        self.queue(self.one, 1000)
+
+        self.assertEqual(
+            process_partition_matchmaking(self.partition.name),
+            "Matchmaking Completed",
+        )
+        self.assertEqual(redis_client.zcard(self.partition.queue), 1)
@@ -2,6 +2,7 @@ from core.dataclasses import Status as cfs
 from core.models import MatchMakingQueue, Player
 from core.tests.helper import create_match_making, create_status, create_user
 from django.urls import reverse
+from game.match_making import Partition, get_partition
 from game.serializers import MatchMakingQueueSerializer
 from rest_framework import status
 from rest_framework.test import APIClient, APITestCase
@@ -50,6 +51,40 @@ class PrivateUserAPITests(APITestCase):
             response.data["queue_id"], str(match_making_queue.first().queue_id)
         )
 
+    def test_request_match_partition(self) -> None:
+        """
+        Test a player is queued in the partition of the board they chose.
+
+        """
+        response = self.client.post(
+            REQUEST_URL, {"rows": 8, "columns": 9, "region": "global"}
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(
+            get_partition(self.user.player.player_id),
+            Partition.for_player(self.user.player.elo, 8, 9, "global"),
+        )
+
+    def test_request_match_invalid(self) -> None:
+        """
+        Test a match cannot be requested for a small board or an unknown
+        region.
+
+        """
+        for data in (
+            {"rows": 3},
+            {"columns": "seven"},
+            {"region": "mars"},
+        ):
+            response = self.client.post(REQUEST_URL, data)
+
+            self.assertEqual(
+                response.status_code, status.HTTP_400_BAD_REQUEST
+            )
+
+        self.assertFalse(MatchMakingQueue.objects.exists())
+
     def test_request_match_twice(self) -> None:
         """
         Test creating a new match making queue twice.
@@ -120,6 +120,18 @@ class PrivateUserAPITests(APITestCase):
         self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
         self.assertEqual(response.data["error"], "Game does not exist")
 
+    def test_create_move_for_malformed_game(self) -> None:
+        """
+        Test creating a new move for a malformed or missing game id.
+
+        """
+
+        for data in ({"game_id": "not-a-game"}, {}):
+            response = self.client.post(MOVE_URL, {**data, "column": 0})
+
+            self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+            self.assertEqual(response.data["error"], "Game does not exist")
+
     def test_create_move_for_dif_game(self) -> None:
         """
         Test creating a new move for a different game.
@@ -0,0 +1,120 @@
+from unittest.mock import patch
+
+from ai.cache import position_cache
+from core.dataclasses import Algorithm as cfa
+from core.models import Game, Move, Player
+from core.tests.helper import create_algorithm, create_status, create_user
+from django.test import TestCase, override_settings
+
+from game.move import compute_ai_move, ponder_ai_replies
+
+
+class PonderTests(TestCase):
+    """
+    Tests for searching the AI's replies while the human is thinking.
+
+    """
+
+    def setUp(self) -> None:
+        create_status("Created")
+        self.in_progress = create_status("In Progress")
+        self.human = Player.objects.get(user=create_user())
+        self.ai = Player.objects.get(
+            algorithm=create_algorithm("Alpha-Beta", cfa.ALPHA_BETA.value)
+        )
+        board = [[0] * 7 for _ in range(6)]
+        board[5][3], board[5][2] = 1, 2
+        self.game = Game.objects.create(
+            player_one=self.human,
+            player_two=self.ai,
+            status=self.in_progress,
+            current_turn=self.human,
+            created_by=self.human,
+            board=board,
+            depth=3,
+        )
+        position_cache.clear()
+
+    def tearDown(self) -> None:
+        position_cache.clear()
+
+    def test_ponder_fills_position_cache(self) -> None:
+        """
+        Test the AI's reply to the human's move is answered from the cache.
+
+        """
+        self.assertEqual(ponder_ai_replies(self.game.game_id), 7)
+
+        hits = position_cache.counts["front_hits"]
+        with patch("game.services.queue_ai_move"):
+            Move.objects.create(
+                game=self.game, player=self.human, row=4, column=3
+            )
+
+        self.assertIsNotNone(compute_ai_move(self.game.game_id))
+        self.assertEqual(position_cache.counts["front_hits"], hits + 1)
+
+    @override_settings(AI_PONDER_TIME_LIMIT=6.0)
+    def test_ponder_shares_time_limit(self) -> None:
+        """
+        Test the replies share the pondering budget, capped by the game's
+        time limit, and stop once it is spent.
+
+        """
+        clock = [0.0]
+
+        def search(*args):
+            # Each search takes the whole of its budget.
+            clock[0] += args[4]
+
+        with patch("game.move.monotonic", lambda: clock[0]), patch(
+            "game.move.find_move", side_effect=search
+        ) as find_move:
+            self.assertEqual(ponder_ai_replies(self.game.game_id), 7)
+
+            budgets = [call.args[4] for call in find_move.call_args_list]
+            self.assertAlmostEqual(sum(budgets), 6.0)
+            for budget in budgets:
+                self.assertAlmostEqual(budget, 6.0 / 7)
+
+            find_move.reset_mock()
+            Game.objects.filter(game_id=self.game.game_id).update(
+                difficulty_level=1
+            )
+            ponder_ai_replies(self.game.game_id)
+
+            self.assertTrue(
+                all(call.args[4] == 0.5 for call in find_move.call_args_list)
+            )
+
+        with override_settings(AI_PONDER_TIME_LIMIT=0):
+            self.assertEqual(ponder_ai_replies(self.game.game_id), 0)
+
+    def test_no_ponder_on_ai_turn(self) -> None:
+        """
+        Test nothing is searched while the AI is to move.
+
+        """
+        Game.objects.filter(game_id=self.game.game_id).update(
+            current_turn=self.ai
+        )
+
+        self.assertEqual(ponder_ai_replies(self.game.game_id), 0)
+
+    @override_settings(AI_PONDERING_ENABLED=True)
+    def test_ai_move_queues_ponder(self) -> None:
+        """
+        Test pondering is scheduled once the AI's move is committed.
+
+        """
+        Game.objects.filter(game_id=self.game.game_id).update(
+            current_turn=self.ai
+        )
+
+        with patch("game.tasks.process_ponder.delay") as delay:
+            with self.captureOnCommitCallbacks(execute=True):
+                Move.objects.create(
+                    game=self.game, player=self.ai, row=4, column=3
+                )
+
+        delay.assert_called_once_with(self.game.game_id)
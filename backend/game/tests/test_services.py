@@ -0,0 +1,136 @@
+from core.constants import CONNECT, PLAYER_ONE, PLAYER_TWO
+from core.dataclasses import Status as cfs
+from core.models import EloHistory, Game, Move, Player
+from core.ratings import human_ratings
+from core.statuses import statuses
+from core.tests.helper import (
+    create_game,
+    create_guest,
+    create_status,
+    create_user,
+)
+from django.test import TestCase
+
+from game.services import commit_move
+
+
+class CommitMoveTests(TestCase):
+    """
+    Tests for the move-commit service.
+
+    """
+
+    def setUp(self) -> None:
+        self.user = create_user()
+        self.guest = create_guest()
+        self.created = create_status("Created")
+        self.in_progress = create_status("In Progress")
+        create_status("Draw")
+        create_status("Player 1 Wins")
+        create_status("Player 2 Wins")
+        self.game = create_game(self.user, self.guest, self.created)
+        self.one = self.game.player_one
+        self.two = self.game.player_two
+
+    def play(self, player: Player, row: int, column: int) -> Move:
+        return commit_move(self.game.game_id, player, row, column)
+
+    def test_first_move(self) -> None:
+        """
+        Test the first move also starts the game.
+
+        """
+        statuses.get(cfs.IN_PROGRESS)
+
+        with self.assertNumQueries(5):
+            self.play(self.one, 5, 3)
+
+        self.game.refresh_from_db()
+        self.assertEqual(self.game.board[5][3], PLAYER_ONE)
+        self.assertEqual(self.game.status, self.in_progress)
+        self.assertEqual(self.game.current_turn, self.two)
+        self.assertIsNotNone(self.game.start_time)
+
+    def test_move(self) -> None:
+        """
+        Test a move in progress locks, inserts and updates once each.
+
+        The other two queries are the savepoint of the test's transaction.
+
+        """
+        self.play(self.one, 5, 3)
+
+        with self.assertNumQueries(5):
+            self.play(self.two, 4, 3)
+
+        self.game.refresh_from_db()
+        self.assertEqual(self.game.board[4][3], PLAYER_TWO)
+        self.assertEqual(self.game.current_turn, self.one)
+
+    def test_winning_move(self) -> None:
+        """
+        Test a winning move updates the players and Elo in bulk.
+
+        """
+        for column in range(CONNECT - 1):
+            self.play(self.one, 5, column)
+            self.play(self.two, 4, column)
+
+        with self.assertNumQueries(7):
+            self.play(self.one, 5, CONNECT - 1)
+
+        self.game.refresh_from_db()
+        self.one.refresh_from_db()
+        self.two.refresh_from_db()
+        self.assertEqual(self.game.winner, self.one)
+        self.assertEqual(self.game.status.name, "Player 1 Wins")
+        self.assertEqual((self.one.wins, self.two.losses), (1, 1))
+        self.assertEqual(EloHistory.objects.filter(game=self.game).count(), 2)
+        for history in EloHistory.objects.filter(game=self.game):
+            self.assertEqual(history.delta, history.new_elo - history.old_elo)
+
+    def test_winning_move_updates_ratings(self) -> None:
+        """
+        Test the new ratings of the players are recorded once committed.
+
+        """
+        human_ratings.load()
+        for column in range(CONNECT - 1):
+            self.play(self.one, 5, column)
+            self.play(self.two, 4, column)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.play(self.one, 5, CONNECT - 1)
+
+        self.one.refresh_from_db()
+        self.two.refresh_from_db()
+        self.assertGreater(self.one.elo, self.two.elo)
+        self.assertEqual(human_ratings.range(), (self.two.elo, self.one.elo))
+
+    def test_invalid_moves(self) -> None:
+        """
+        Test invalid moves are rejected without writing anything.
+
+        """
+        cases = [
+            (self.two, 5, 3, "It is not your turn"),
+            (self.one, 4, 3, "Invalid move"),
+            (self.one, 5, 9, "(Column,Row) must be less than (7,6)"),
+            (self.one, -1, 3, "Column and Row are required"),
+        ]
+
+        for player, row, column, message in cases:
+            with self.assertRaisesMessage(ValueError, message):
+                self.play(player, row, column)
+
+        self.assertFalse(Move.objects.exists())
+
+    def test_missing_game(self) -> None:
+        """
+        Test a move in a game that does not exist.
+
+        """
+        with self.assertRaises(Game.DoesNotExist):
+            commit_move(
+                "00000000-0000-0000-0000-000000000000", self.one, 5, 3
+            )
@@ -0,0 +1,139 @@
+import json
+import random
+from io import StringIO
+from unittest.mock import patch
+
+from core.constants import MATCHMAKING_PARTITIONS
+from core.dataclasses import Status as cfs
+from core.models import Game, MatchMakingQueue, Player, Status
+from core.redis import redis_client
+from core.tests.helper import create_status
+from django.core.management import CommandError, call_command
+from django.test import TestCase
+
+from game.simulation import (
+    CommandCounter,
+    sample_ratings,
+    scratch_environment,
+    simulate_matchmaking,
+)
+
+
+class MatchMakingSimulationTests(TestCase):
+    """
+    Tests for the matchmaking simulator.
+
+    """
+
+    def setUp(self) -> None:
+        for name in (cfs.QUEUED, cfs.MATCHED, cfs.CREATED):
+            create_status(name.value)
+
+    def test_sample_ratings(self) -> None:
+        """
+        Test uniform ratings stay within the spread of the mean.
+
+        """
+        ratings = sample_ratings(random.Random(1), 100, "uniform", 1200, 50)
+
+        self.assertEqual(len(ratings), 100)
+        self.assertTrue(all(1150 <= rating <= 1250 for rating in ratings))
+
+        with self.assertRaises(ValueError):
+            sample_ratings(random.Random(1), 1, "poisson", 1200, 50)
+
+    def test_command_counter(self) -> None:
+        """
+        Test pipelined commands count once each, in a single round trip.
+
+        """
+        with CommandCounter(redis_client) as counter:
+            redis_client.get("simulation:test")
+            pipe = redis_client.pipeline()
+            pipe.get("simulation:test")
+            pipe.get("simulation:test")
+            pipe.execute()
+
+        self.assertEqual((counter.commands, counter.round_trips), (3, 2))
+
+        redis_client.get("simulation:test")
+
+        self.assertEqual(counter.commands, 3)
+
+    def test_simulate_matchmaking(self) -> None:
+        """
+        Test every player is matched or left over, and the simulation
+        cleans up after itself.
+
+        """
+        result = simulate_matchmaking(
+            players=40, arrival_rate=10, elo_spread=20, seed=3, scratch=False
+        )
+
+        self.assertEqual(result["matches"] * 2 + result["unmatched"], 40)
+        self.assertGreater(result["matches"], 0)
+        self.assertLessEqual(result["elo_gap"]["max"], 400)
+        self.assertGreater(result["redis_commands_per_match"], 0)
+        self.assertFalse(Player.objects.exists())
+        self.assertFalse(Game.objects.exists())
+        self.assertFalse(MatchMakingQueue.objects.exists())
+        self.assertFalse(
+            any(
+                name.endswith(":simulation")
+                for name in redis_client.smembers(MATCHMAKING_PARTITIONS)
+            )
+        )
+
+    @patch("game.simulation.teardown_databases")
+    @patch("game.simulation.setup_databases", return_value=[])
+    def test_scratch_environment(self, setup, teardown) -> None:
+        """
+        Test Redis is swapped for an empty server and a test database is
+        set up with the statuses, and both are put back afterwards.
+
+        """
+        redis_client.set("simulation:test", 1)
+
+        with scratch_environment():
+            self.assertIsNone(redis_client.get("simulation:test"))
+            self.assertEqual(
+                Status.objects.filter(name=cfs.CANCELLED.value).count(), 1
+            )
+            redis_client.set("simulation:scratch", 1)
+            setup.assert_called_once()
+            teardown.assert_not_called()
+
+        teardown.assert_called_once_with([], verbosity=0)
+        self.assertEqual(redis_client.get("simulation:test"), "1")
+        self.assertIsNone(redis_client.get("simulation:scratch"))
+
+        redis_client.delete("simulation:test")
+
+    @patch("game.simulation.setup_databases")
+    def test_scratch_environment_needs_fakeredis(self, setup) -> None:
+        """
+        Test the simulation refuses to run without fakeredis.
+
+        """
+        with patch.dict("sys.modules", {"fakeredis": None}):
+            with self.assertRaises(CommandError):
+                call_command("matchmaking_benchmark", stdout=StringIO())
+
+        setup.assert_not_called()
+
+    @patch("game.simulation.teardown_databases")
+    @patch("game.simulation.setup_databases", return_value=[])
+    def test_command(self, setup, teardown) -> None:
+        """
+        Test the command prints the results as JSON, from a scratch
+        environment.
+
+        """
+        out = StringIO()
+        call_command(
+            "matchmaking_benchmark", "--players", "4", stdout=out
+        )
+
+        self.assertEqual(json.loads(out.getvalue())["players"], 4)
+        setup.assert_called_once()
+        teardown.assert_called_once()
@@ -0,0 +1,120 @@
+from asgiref.sync import async_to_sync
+from core.constants import PLAYER_ONE
+from core.models import Game
+from core.redis import redis_client
+from core.tests.helper import (
+    create_game,
+    create_guest,
+    create_status,
+    create_user,
+)
+from django.test import TestCase
+
+from game.move import get_game_status, make_move, play_move
+from game.state import forget_state, load_state, state_key
+
+
+class GameStateTests(TestCase):
+    """
+    Tests for the hot state of games.
+
+    """
+
+    def setUp(self) -> None:
+        self.user = create_user()
+        self.guest = create_guest()
+        self.in_progress = create_status("In Progress")
+        self.created = create_status("Created")
+        self.game = create_game(self.user, self.guest, self.created)
+        self.one = self.game.player_one
+        self.two = self.game.player_two
+        self.game_id = self.game.game_id
+        forget_state(self.game_id)
+
+    def tearDown(self) -> None:
+        forget_state(self.game_id)
+
+    def test_load_state(self) -> None:
+        """
+        Test the state is read from the database once, then from Redis.
+
+        """
+        with self.assertNumQueries(1):
+            state = load_state(self.game.game_id)
+
+        with self.assertNumQueries(0):
+            self.assertEqual(load_state(str(self.game.game_id)), state)
+
+        self.assertEqual(state.status, "Created")
+        self.assertEqual(state.current_turn, str(self.one.player_id))
+        self.assertEqual(state.moves, 0)
+
+    def test_load_missing_game(self) -> None:
+        """
+        Test there is no state for a game that does not exist.
+
+        """
+        game_id = self.game.game_id
+        Game.objects.filter(game_id=game_id).delete()
+
+        self.assertIsNone(load_state(game_id))
+        self.assertIsNone(get_game_status(game_id))
+
+    def test_invalid_move_skips_database(self) -> None:
+        """
+        Test a move that cannot be made is rejected from the hot state.
+
+        """
+        load_state(self.game.game_id)
+
+        with self.assertNumQueries(0):
+            with self.assertRaisesMessage(ValueError, "It is not your turn"):
+                make_move(self.game.game_id, self.two, 5, 3)
+
+            with self.assertRaisesMessage(ValueError, "Invalid move"):
+                make_move(self.game.game_id, self.one, 0, 3)
+
+    def test_move_writes_through(self) -> None:
+        """
+        Test a move updates the hot state with the database.
+
+        """
+        load_state(self.game.game_id)
+        async_to_sync(play_move)(self.game.game_id, self.one, 5, 3)
+
+        with self.assertNumQueries(0):
+            state = load_state(self.game.game_id)
+
+        self.game.refresh_from_db()
+        self.assertEqual(state.board, self.game.board)
+        self.assertEqual(state.board[5][3], PLAYER_ONE)
+        self.assertEqual(state.current_turn, str(self.two.player_id))
+        self.assertEqual(state.status, "In Progress")
+        self.assertEqual(state.moves, 1)
+        self.assertEqual(get_game_status(self.game.game_id), "In Progress")
+
+    def test_rejected_move_forgets_state(self) -> None:
+        """
+        Test a move the database rejects forgets a stale hot state.
+
+        """
+        load_state(self.game.game_id)
+        Game.objects.filter(game_id=self.game.game_id).update(
+            current_turn=self.two
+        )
+
+        with self.assertRaisesMessage(ValueError, "It is not your turn"):
+            make_move(self.game.game_id, self.one, 5, 3)
+
+        self.assertFalse(redis_client.exists(state_key(self.game.game_id)))
+        make_move(self.game.game_id, self.two, 5, 3)
+
+    def test_deleted_game_forgets_state(self) -> None:
+        """
+        Test deleting a game forgets its hot state.
+
+        """
+        load_state(self.game_id)
+        self.game.delete()
+
+        self.assertFalse(redis_client.exists(state_key(self.game_id)))
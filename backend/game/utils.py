@@ -3,6 +3,7 @@ from typing import List, Optional
 from core.constants import CONNECT, EMPTY, K_DEPTH
 from core.dataclasses import Status as cfs
 from core.models import Move, Player
+from core.ratings import human_ratings
 
 
 def is_valid_move(board: List[List[int]], column: int, row: int) -> bool:
@@ -173,8 +174,7 @@ def compute_depth(
     if not algo_depth:
         return None
 
-    min_elo = Player.objects.filter(is_human=True).order_by("elo").first().elo
-    max_elo = Player.objects.filter(is_human=True).order_by("elo").last().elo
+    min_elo, max_elo = human_ratings.range() or (elo, elo)
 
     norm_elo = (
         (elo - min_elo) / (max_elo - min_elo) if max_elo != min_elo else 0
@@ -18,9 +18,11 @@ from core.models import (
     MatchMakingQueue,
     Move,
     Player,
-    Status,
 )
+from core.statuses import get_status
 from core.utils import get_player, get_player_by_username
+from django.conf import settings
+from django.core.exceptions import ValidationError
 from django.db.models import Q
 from rest_framework import status, viewsets
 from rest_framework.decorators import action
@@ -30,20 +32,24 @@ from rest_framework.response import Response
 from rest_framework.exceptions import NotFound
 
 import game.utils as utils
-from game.match_making import add_player_to_queue, remove_player_from_queue
+from game.match_making import (
+    Partition,
+    add_player_to_queue,
+    remove_player_from_queue,
+)
 from game.mixins import PermissionMixin
 from game.serializers import (
     CreateGameSerializer,
-    CreateMoveSerializer,
     GameInvitationSerializer,
     GameSerializer,
     MatchMakingQueueSerializer,
     MatchmakingResponseSerializer,
     MoveSerializer,
 )
+from game.services import commit_move
 from game.tasks import (
     process_invitation_update,
-    process_matchmaking,
+    process_player_matchmaking,
     process_send_invitation,
 )
 
@@ -262,7 +268,7 @@ class RequestMatchMakingView(PermissionMixin, GenericAPIView):
 
         if player_matches := MatchMakingQueue.objects.filter(
             player=player.player_id,
-            status=Status.objects.get(name=cfs.QUEUED.value),
+            status=get_status(cfs.QUEUED.value),
         ):
             response_data = {
                 "status": "Player already in matchmaking queue",
@@ -274,10 +280,30 @@ class RequestMatchMakingView(PermissionMixin, GenericAPIView):
                 status=status.HTTP_200_OK,
             )
 
-        queue_id = add_player_to_queue(player.player_id, player.elo)
+        try:
+            rows = int(request.data.get("rows", DEFAULT_ROWS))
+            columns = int(request.data.get("columns", DEFAULT_COLUMNS))
+        except ValueError:
+            return error_response("Column and Row must be integers")
 
-        # Optionally, trigger matchmaking immediately here
-        process_matchmaking.apply_async()
+        if rows < CONNECT or columns < CONNECT:
+            return error_response(
+                f"Rows and Columns must be at least {CONNECT}"
+            )
+
+        region = request.data.get("region", settings.MATCHMAKING_REGIONS[0])
+        if region not in settings.MATCHMAKING_REGIONS:
+            return error_response(
+                f"Choose from {list(settings.MATCHMAKING_REGIONS)}"
+            )
+
+        queue_id = add_player_to_queue(
+            player.player_id,
+            player.elo,
+            Partition.for_player(player.elo, rows, columns, region),
+        )
+
+        process_player_matchmaking.apply_async((str(player.player_id),))
 
         response_data = {
             "status": "Player added to matchmaking queue",
@@ -476,7 +502,7 @@ class GameInvitationViewSet(PermissionMixin, viewsets.ModelViewSet):
             play_preference=play_preference,
             rows=rows,
             columns=columns,
-            status=Status.objects.get(name=cfs.PENDING.value),
+            status=get_status(cfs.PENDING.value),
         )
         process_send_invitation.delay(invitation.invitation_id)
 
@@ -514,7 +540,7 @@ class GameInvitationViewSet(PermissionMixin, viewsets.ModelViewSet):
             play_preference=play_preference,
             rows=rows,
             columns=columns,
-            status=Status.objects.get(name=cfs.OPPONENT.value),
+            status=get_status(cfs.OPPONENT.value),
         )
 
         return Response(
@@ -547,7 +573,7 @@ class GameInvitationViewSet(PermissionMixin, viewsets.ModelViewSet):
                 status.HTTP_404_NOT_FOUND,
             )
 
-        if invitation.status == Status.objects.get(name=cfs.OPPONENT.value):
+        if invitation.status == get_status(cfs.OPPONENT.value):
             invitation.receiver = player
 
         if invitation.receiver != player:
@@ -555,7 +581,7 @@ class GameInvitationViewSet(PermissionMixin, viewsets.ModelViewSet):
                 "You are not the receiver of this invitation"
             )
 
-        invitation.status = Status.objects.get(name=cfs.ACCEPTED.value)
+        invitation.status = get_status(cfs.ACCEPTED.value)
 
         # Determine who plays first based on the sender's play preference
         if invitation.play_preference == "first":
@@ -618,7 +644,7 @@ class GameInvitationViewSet(PermissionMixin, viewsets.ModelViewSet):
                 "Game Invitation does not exist",
                 status.HTTP_404_NOT_FOUND,
             )
-        if invitation.status == Status.objects.get(name=cfs.OPPONENT.value):
+        if invitation.status == get_status(cfs.OPPONENT.value):
             invitation.receiver = player
 
         if invitation.receiver != player:
@@ -626,7 +652,7 @@ class GameInvitationViewSet(PermissionMixin, viewsets.ModelViewSet):
                 "You are not the receiver of this invitation"
             )
 
-        invitation.status = Status.objects.get(name=cfs.REJECTED.value)
+        invitation.status = get_status(cfs.REJECTED.value)
         invitation.save()
 
         process_invitation_update.delay(invitation.invitation_id)
@@ -697,56 +723,19 @@ class MoveViewSet(PermissionMixin, viewsets.ModelViewSet):
         except ValueError:
             return error_response("Column and Row must be integers")
 
-        game = Game.objects.filter(game_id=game_id).first()
-
-        if not game:
+        try:
+            move = commit_move(game_id, player, row, column)
+        except (Game.DoesNotExist, ValidationError):
             return error_response(
                 "Game does not exist", status.HTTP_404_NOT_FOUND
             )
+        except ValueError as e:
+            return error_response(str(e))
 
-        if game.player_one != player and game.player_two != player:
-            return error_response(
-                "You are not a player in this game",
-            )
-
-        if game.status.name not in [cfs.IN_PROGRESS.value, cfs.CREATED.value]:
-            return error_response("Game is not in progress")
-
-        if game.current_turn != player:
-            return error_response("It is not your turn")
-
-        if utils.is_board_full(game.board):
-            return error_response("Board is full")
-
-        if column < 0 or row < 0:
-            return error_response("Column and Row are required")
-
-        if column >= game.columns or row >= game.rows:
-            return error_response(
-                f"(Column,Row) must be less than ({game.columns},{game.rows})"
-            )
-
-        if not utils.is_valid_move(game.board, column, row):
-            return error_response("Invalid move")
-
-        move_data = {
-            "game": game.game_id,
-            "player": player.player_id,
-            "column": column,
-            "row": row,
-        }
-
-        serializer = CreateMoveSerializer(data=move_data)
-
-        if serializer.is_valid():
-            move = serializer.save()
-            move_reponse = MoveSerializer(move)
-            return Response(
-                move_reponse.data,
-                status=status.HTTP_201_CREATED,
-            )
-
-        return error_response(serializer.errors)
+        return Response(
+            MoveSerializer(move).data,
+            status=status.HTTP_201_CREATED,
+        )
 
     @action(
         detail=False, methods=["post"], url_path="(?P<game_id>[^/.]+)/undo"